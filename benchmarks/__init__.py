@@ -0,0 +1,6 @@
+"""Offline benchmark suite for Spot2YTM.
+
+Runs the migration pipeline against a local stub of the Spotify Web API and a fake
+YTMusic object, so throughput can be measured without touching the live services.
+See ``python -m benchmarks.run --help``.
+"""
@@ -0,0 +1,80 @@
+"""Deterministic synthetic music catalog shared by the benchmark stand-ins.
+
+Track ``i`` always has the same title, album, artist and duration, so the stub
+Spotify server and the fake YTMusic agree on what exists without sharing state.
+"""
+
+import re
+
+TRACKS_PER_ALBUM = 12
+ALBUMS_PER_ARTIST = 3
+
+_TRACK_NUMBER = re.compile(r"Track (\d+)\b")
+
+
+def track_title(index: int) -> str:
+    return f"Track {index} Song"
+
+
+def album_name(index: int) -> str:
+    return f"Album {index // TRACKS_PER_ALBUM}"
+
+
+def artist_name(index: int) -> str:
+    return f"Artist {index // (TRACKS_PER_ALBUM * ALBUMS_PER_ARTIST)}"
+
+
+def duration_seconds(index: int) -> int:
+    return 150 + (index * 37) % 150
+
+
+def video_id(index: int) -> str:
+    return f"yt{index:09d}"
+
+
+def track_index(text: str) -> int | None:
+    """Extract the catalog index from a title or search query.
+    \n    Args:
+        text: A catalog track title, or a query containing one.
+        \n    Returns:
+        int | None: The track index, or None if the text names no catalog track.
+    """
+    found = _TRACK_NUMBER.search(text)
+    return int(found.group(1)) if found else None
+
+
+def spotify_item(index: int) -> dict:
+    """Build a Spotify playlist track item for catalog track ``index``.
+    \n    Args:
+        index: The catalog index.
+        \n    Returns:
+        dict: An item of a Spotify playlist tracks page.
+    """
+    return {
+        "track": {
+            "id": f"sp{index:020d}",
+            "name": track_title(index),
+            "type": "track",
+            "duration_ms": duration_seconds(index) * 1000,
+            "external_ids": {"isrc": f"BENCH{index:07d}"},
+            "album": {"name": album_name(index)},
+            "artists": [{"name": artist_name(index)}],
+        }
+    }
+
+
+def ytmusic_song(index: int) -> dict:
+    """Build a YTMusic song search result for catalog track ``index``.
+    \n    Args:
+        index: The catalog index.
+        \n    Returns:
+        dict: A song result as returned by YTMusic.search(filter="songs").
+    """
+    return {
+        "resultType": "song",
+        "videoId": video_id(index),
+        "title": track_title(index),
+        "artists": [{"name": artist_name(index), "id": None}],
+        "album": {"name": album_name(index), "id": f"alb{index // TRACKS_PER_ALBUM}"},
+        "duration_seconds": duration_seconds(index),
+    }
@@ -0,0 +1,160 @@
+"""In-memory stand-in for ``ytmusicapi.YTMusic``.
+
+Implements the YTMusic methods YTMusicClient calls, answering from the synthetic
+catalog with configurable latency, error rate and miss rate. Errors are raised as
+``YTMusicServerError``, like a throttled or failing live call.
+"""
+
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+from ytmusicapi.exceptions import YTMusicServerError
+from benchmarks import catalog
+
+
+@dataclass
+class FakeConfig:
+    """Behaviour of the fake YTMusic.
+
+    Attributes:
+        search_latency: Mean latency of search/get calls, in seconds.
+        write_latency: Mean latency of playlist mutations, in seconds.
+        jitter: Latency varies uniformly by this fraction around the mean.
+        error_rate: Probability of a call raising YTMusicServerError.
+        miss_rate: Probability that a track is not on YT Music (only decoys are found).
+        decoys: Extra, wrong results returned with every song search.
+    """
+
+    search_latency: float = 0.0
+    write_latency: float = 0.0
+    jitter: float = 0.5
+    error_rate: float = 0.0
+    miss_rate: float = 0.0
+    decoys: int = 4
+
+
+class FakeYTMusic:
+    """Thread-safe fake YTMusic session backed by the synthetic catalog."""
+
+    def __init__(self, config: FakeConfig | None = None) -> None:
+        self.config = config or FakeConfig()
+        self.calls: Dict[str, int] = {}
+        self.errors = 0
+        self._playlists: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _io(self, method: str, latency: float) -> None:
+        """Count the call, apply latency and maybe fail it."""
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+        if latency:
+            time.sleep(latency * random.uniform(1 - self.config.jitter, 1 + self.config.jitter))
+        if self.config.error_rate and random.random() < self.config.error_rate:
+            with self._lock:
+                self.errors += 1
+            raise YTMusicServerError("Server returned HTTP 503: Service Unavailable.")
+
+    def _missing(self, index: int) -> bool:
+        return self.config.miss_rate > 0 and random.Random(index).random() < self.config.miss_rate
+
+    # ---------- search ----------
+
+    def search(self, query: str, filter: str | None = None, limit: int = 20, **kwargs) -> List[dict]:
+        self._io("search", self.config.search_latency)
+        index = catalog.track_index(query)
+        if filter == "albums":
+            found = re.search(r"Album (\d+)", query)
+            if found is None:
+                return []
+            first = int(found.group(1)) * catalog.TRACKS_PER_ALBUM
+            return [{
+                "resultType": "album",
+                "browseId": f"alb{found.group(1)}",
+                "title": catalog.album_name(first),
+                "artists": [{"name": catalog.artist_name(first), "id": None}],
+            }]
+        if index is None:
+            return []
+
+        results = [] if self._missing(index) else [catalog.ytmusic_song(index)]
+        for decoy in range(self.config.decoys):
+            song = catalog.ytmusic_song(index)
+            song.update(
+                videoId=f"dx{decoy}{index:08d}",
+                title=f"{song['title']} (Live {decoy})",
+                artists=[{"name": f"Cover Band {decoy}", "id": None}],
+                duration_seconds=song["duration_seconds"] + 20 + decoy,
+            )
+            results.append(song)
+        return results
+
+    def get_album(self, browseId: str) -> dict:
+        self._io("get_album", self.config.search_latency)
+        album = int(browseId.removeprefix("alb"))
+        first = album * catalog.TRACKS_PER_ALBUM
+        tracks = [
+            catalog.ytmusic_song(index)
+            for index in range(first, first + catalog.TRACKS_PER_ALBUM)
+            if not self._missing(index)
+        ]
+        return {"title": f"Album {album}", "tracks": tracks}
+
+    def get_library_songs(self, limit: int | None = 25, **kwargs) -> List[dict]:
+        self._io("get_library_songs", self.config.search_latency)
+        return []
+
+    def get_liked_songs(self, limit: int | None = 100) -> dict:
+        self._io("get_liked_songs", self.config.search_latency)
+        return {"tracks": []}
+
+    # ---------- playlists ----------
+
+    def get_library_playlists(self, limit: int | None = 25) -> List[dict]:
+        self._io("get_library_playlists", self.config.search_latency)
+        with self._lock:
+            return [{"title": playlist["title"], "playlistId": pid} for pid, playlist in self._playlists.items()]
+
+    def create_playlist(self, title: str, description: str, privacy_status: str = "PRIVATE", video_ids: List[str] | None = None, **kwargs) -> str:
+        self._io("create_playlist", self.config.write_latency)
+        with self._lock:
+            pid = f"PLbench{len(self._playlists):06d}"
+            self._playlists[pid] = {"title": title, "tracks": [{"videoId": vid, "setVideoId": vid} for vid in video_ids or []]}
+            return pid
+
+    def get_playlist(self, playlistId: str, limit: int | None = 100, **kwargs) -> dict:
+        self._io("get_playlist", self.config.search_latency)
+        with self._lock:
+            playlist = self._playlists.get(playlistId, {"title": "", "tracks": []})
+            return {"id": playlistId, "title": playlist["title"], "tracks": list(playlist["tracks"])}
+
+    def add_playlist_items(self, playlistId: str, videoIds: List[str] | None = None, duplicates: bool = False, **kwargs) -> dict:
+        self._io("add_playlist_items", self.config.write_latency)
+        with self._lock:
+            tracks = self._playlists.setdefault(playlistId, {"title": "", "tracks": []})["tracks"]
+            tracks.extend(self._playlist_item(vid) for vid in videoIds or [])
+        return {"status": "STATUS_SUCCEEDED", "playlistEditResults": [{"videoId": vid} for vid in videoIds or []]}
+
+    @staticmethod
+    def _playlist_item(video_id: str) -> dict:
+        """A playlist item like get_playlist returns, with title and artists for catalog songs."""
+        item = {"videoId": video_id, "setVideoId": video_id}
+        if video_id.startswith("yt") and video_id[2:].isdigit():
+            song = catalog.ytmusic_song(int(video_id[2:]))
+            item.update(title=song["title"], artists=song["artists"])
+        return item
+
+    def remove_playlist_items(self, playlistId: str, videos: List[dict]) -> dict:
+        self._io("remove_playlist_items", self.config.write_latency)
+        removed = {video["setVideoId"] for video in videos}
+        with self._lock:
+            playlist = self._playlists.get(playlistId)
+            if playlist:
+                playlist["tracks"] = [track for track in playlist["tracks"] if track["setVideoId"] not in removed]
+        return {"status": "STATUS_SUCCEEDED"}
+
+    def playlist_length(self, playlist_id: str) -> int:
+        with self._lock:
+            return len(self._playlists.get(playlist_id, {"tracks": []})["tracks"])
@@ -0,0 +1,317 @@
+"""Benchmark harness: wires the real pipeline to the local stand-ins and measures it.
+
+Every scenario runs in a fresh subprocess so its peak RSS is not inflated by earlier
+scenarios. Within a scenario, selected client and service methods are wrapped with
+timers to collect per-stage latency samples.
+"""
+
+import os
+
+# The token request needs Spotify credentials; the stub server ignores them.
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "benchmark")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "benchmark")
+
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List
+
+from spot2ytm.auth.spotify_authentication_manager import SpotifyAuthenticationManager
+from spot2ytm.clients.http_transport import HttpTransport
+from spot2ytm.clients.spotfiy_client import SpotifyClient
+from spot2ytm.clients.ytmusic_client import YTMusicClient
+from spot2ytm.config.settings import settings
+from spot2ytm.domain.track import Track
+from spot2ytm.domain.track_batch import TrackBatch
+from spot2ytm.services.match_scoring import MatchScorer
+from spot2ytm.services.playlist_fetcher import PlaylistFetcher
+from spot2ytm.services.playlist_migrator import PlaylistMigrator
+from spot2ytm.services.sharded_migrator import ShardedMigrator
+from spot2ytm.services.track_matcher import TrackMatcher
+from spot2ytm.storage.http_cache import HttpCache
+from spot2ytm.storage.match_cache import MatchCache
+from spot2ytm.storage.migration_journal import MigrationJournal
+from spot2ytm.storage.review_list import ReviewList
+from spot2ytm.storage.sync_state import SyncStateStore
+from spot2ytm.telemetry.metrics import metrics
+
+from benchmarks import catalog
+from benchmarks.fake_ytmusic import FakeConfig, FakeYTMusic
+from benchmarks.stub_spotify import StubConfig, StubSpotifyServer, playlist_id, playlist_ids
+
+STAGES = ("migrate", "fetch", "match", "insert", "library")
+DEFAULT_STAGES = STAGES[:4]
+
+
+@dataclass
+class BenchConfig:
+    """One benchmark scenario.
+
+    Attributes:
+        stage: What to run: 'migrate' end to end, or 'fetch', 'match' or 'insert' alone,
+               or 'library': migrate ``playlists`` playlists with ShardedMigrator.
+        size: Number of tracks in the playlist.
+        spotify_latency: Added latency per Spotify request, in seconds.
+        spotify_error_rate: Probability of a Spotify request failing with HTTP 503.
+        yt_search_latency: Latency of YT Music searches, in seconds.
+        yt_write_latency: Latency of YT Music playlist mutations, in seconds.
+        yt_error_rate: Probability of a YT Music call failing.
+        yt_miss_rate: Probability of a track not being on YT Music.
+        fetch_workers: Parallel Spotify page requests.
+        search_workers: Parallel YT Music searches.
+        album_batch: Album batching threshold (0 disables it).
+        scoring: Rank search candidates instead of taking the top result.
+        cache: Use a (fresh) match cache.
+        journal: Journal the migration.
+        streaming: Use the streaming pipeline for 'migrate'.
+        rate_limit: Keep the adaptive YT Music rate limiters from settings.
+        http_cache: Send Spotify requests through a warm ETag cache (primed by one
+                    untimed fetch of the playlist), as on a re-run.
+        playlists: Playlists of ``size`` tracks migrated by the 'library' stage.
+        processes: Worker processes of the 'library' stage.
+    """
+
+    stage: str = "migrate"
+    size: int = 1000
+    spotify_latency: float = 0.0
+    spotify_error_rate: float = 0.0
+    yt_search_latency: float = 0.0
+    yt_write_latency: float = 0.0
+    yt_error_rate: float = 0.0
+    yt_miss_rate: float = 0.0
+    fetch_workers: int = 1
+    search_workers: int = 1
+    album_batch: int = 0
+    scoring: bool = True
+    cache: bool = True
+    journal: bool = True
+    streaming: bool = False
+    rate_limit: bool = False
+    http_cache: bool = False
+    playlists: int = 4
+    processes: int = 1
+
+
+class StageRecorder:
+    """Collects latency samples of wrapped methods, grouped by stage name."""
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def wrap(self, obj: Any, method: str, stage: str) -> None:
+        """Replace ``obj.method`` with a timed wrapper recording into ``stage``."""
+        original = getattr(obj, method)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.samples[stage].append(elapsed)
+
+        setattr(obj, method, timed)
+
+    def summary(self) -> Dict[str, dict]:
+        """Count, p50, p99 and total time per stage."""
+        return {stage: summarize(samples) for stage, samples in sorted(self.samples.items())}
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def summarize(samples: List[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "total_s": sum(ordered),
+    }
+
+
+class StubTransport(HttpTransport):
+    """HttpTransport that sends Spotify API and token requests to the stub server."""
+
+    PREFIXES = ("https://api.spotify.com", "https://accounts.spotify.com")
+
+    def __init__(self, base_url: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def _rewrite(self, url: str) -> str:
+        for prefix in self.PREFIXES:
+            if url.startswith(prefix):
+                return self.base_url + url[len(prefix):]
+        return url
+
+    def get(self, url: str, **kwargs):
+        return super().get(self._rewrite(url), **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return super().post(self._rewrite(url), **kwargs)
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def catalog_tracks(size: int) -> TrackBatch:
+    """The tracks of a benchmark playlist, built locally without the stub server."""
+    return TrackBatch(
+        Track(
+            title=catalog.track_title(index),
+            album=catalog.album_name(index),
+            id=f"sp{index:020d}",
+            isrc=f"BENCH{index:07d}",
+            artists=(catalog.artist_name(index),),
+            duration_ms=catalog.duration_seconds(index) * 1000,
+        )
+        for index in range(size)
+    )
+
+
+def fake_ytmusic(config: BenchConfig) -> FakeYTMusic:
+    return FakeYTMusic(FakeConfig(
+        search_latency=config.yt_search_latency,
+        write_latency=config.yt_write_latency,
+        error_rate=config.yt_error_rate,
+        miss_rate=config.yt_miss_rate,
+    ))
+
+
+def build_migrator(config: BenchConfig, base_url: str, data: Path, fake: FakeYTMusic) -> PlaylistMigrator:
+    """Wire the real pipeline to the stub server and a fake YTMusic, storing files under ``data``."""
+    settings.SPOTIFY_FETCH_WORKERS = config.fetch_workers
+
+    transport = StubTransport(base_url, pool_size=max(10, config.fetch_workers))
+    spotify_auth = SpotifyAuthenticationManager(token_file=data / "spotify_token.json", transport=transport)
+    http_cache = HttpCache(data / "http_cache.sqlite3") if config.http_cache else None
+    spotify_client = SpotifyClient(spotify_auth, transport=transport, http_cache=http_cache)
+    ytmusic_client = YTMusicClient(fake, ytmusic_factory=lambda: fake, limiters=None if config.rate_limit else {})
+
+    fetcher = PlaylistFetcher(spotify_client)
+    matcher = TrackMatcher(
+        ytmusic_client,
+        workers=config.search_workers,
+        cache=MatchCache(data / "match_cache.sqlite3") if config.cache else None,
+        album_batch_min_tracks=config.album_batch,
+        scorer=MatchScorer(settings.YTM_MATCH_THRESHOLD) if config.scoring else None,
+        candidates=settings.YTM_SEARCH_CANDIDATES,
+    )
+    return PlaylistMigrator(
+        fetcher,
+        matcher,
+        ytmusic_client,
+        spotify_client,
+        journal=MigrationJournal(data / "migrations.sqlite3") if config.journal else None,
+        sync_store=SyncStateStore(data / "sync_state.sqlite3"),
+        review_list=ReviewList(data / "review.jsonl"),
+    )
+
+
+@dataclass
+class BenchApp:
+    """Picklable app factory for ShardedMigrator workers; each worker gets its own fake YTMusic."""
+
+    config: BenchConfig
+    base_url: str
+    data: str
+
+    def __call__(self) -> PlaylistMigrator:
+        return build_migrator(self.config, self.base_url, Path(self.data), fake_ytmusic(self.config))
+
+
+def run_scenario(config: BenchConfig) -> dict:
+    """Run one scenario in the current process and return its measurements."""
+    baseline_rss = peak_rss_mb()
+    stub_config = StubConfig(latency=config.spotify_latency, error_rate=config.spotify_error_rate)
+    fake = fake_ytmusic(config)
+    recorder = StageRecorder()
+
+    with tempfile.TemporaryDirectory(prefix="spot2ytm-bench-") as workdir, StubSpotifyServer(stub_config) as server:
+        data = Path(workdir)
+        migrator = build_migrator(config, server.base_url, data, fake)
+        spotify_client, ytmusic_client = migrator.spotify_client, migrator.ytmusic_client
+        fetcher, matcher = migrator.fetcher, migrator.matcher
+        transport = spotify_client.transport
+        http_cache = spotify_client.http_cache
+
+        spotify_playlist_id = playlist_id(config.size)
+        if http_cache:
+            fetcher.fetch(spotify_playlist_id, workers=config.fetch_workers)
+            spotify_client.get_playlist_name_desc(spotify_playlist_id)
+            metrics.reset()
+            server.requests = server.not_modified = 0
+
+        recorder.wrap(transport, "get", "spotify_request")
+        recorder.wrap(ytmusic_client, "search_candidates", "yt_search")
+        recorder.wrap(ytmusic_client, "search_song", "yt_search")
+        recorder.wrap(ytmusic_client, "get_album_tracks", "yt_album")
+        recorder.wrap(ytmusic_client, "_add_items", "yt_insert")
+        recorder.wrap(matcher, "_resolve", "match_track")
+
+        done = 0
+        start = time.perf_counter()
+        if config.stage == "fetch":
+            done = len(fetcher.fetch(spotify_playlist_id, workers=config.fetch_workers))
+        elif config.stage == "match":
+            results = matcher.match_all(catalog_tracks(config.size))
+            done = sum(1 for result in results if result.matched)
+        elif config.stage == "insert":
+            video_ids = [catalog.video_id(index) for index in range(config.size)]
+            yt_playlist_id = ytmusic_client.get_or_create_playlist("Benchmark insert", "")
+            done = len(ytmusic_client.add_songs_to_playlist(yt_playlist_id, video_ids).added)
+        elif config.stage == "library":
+            sharded = ShardedMigrator(config.processes, app_factory=BenchApp(config, server.base_url, workdir))
+            results = sharded.migrate(playlist_ids(config.size, config.playlists))
+            done = sum(1 for yt_playlist_id in results.values() if yt_playlist_id) * config.size
+        elif config.stage == "migrate":
+            yt_playlist_id = migrator.migrate(spotify_playlist_id, streaming=config.streaming)
+            done = fake.playlist_length(yt_playlist_id) if yt_playlist_id else 0
+        else:
+            raise ValueError(f"Unknown stage {config.stage!r}, expected one of {STAGES}")
+        elapsed = time.perf_counter() - start
+        matcher.close()
+        ytmusic_client.close()
+
+    return {
+        "config": asdict(config),
+        "seconds": elapsed,
+        "tracks_per_sec": (config.size * (config.playlists if config.stage == "library" else 1)) / elapsed if elapsed else 0.0,
+        "completed": done,
+        "peak_rss_mb": peak_rss_mb(),
+        "baseline_rss_mb": baseline_rss,
+        "stages": recorder.summary(),
+        "spotify_requests": server.requests,
+        "spotify_errors": server.errors,
+        "spotify_not_modified": server.not_modified,
+        "yt_calls": dict(fake.calls),
+        "yt_errors": fake.errors,
+        "counters": metrics.snapshot()["counters"],
+    }
+
+
+def run_isolated(config: BenchConfig) -> dict:
+    """Run one scenario in a fresh subprocess so peak RSS is measured on its own."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(run_scenario, config).result()
@@ -0,0 +1,86 @@
+"""Command line entry point of the benchmark suite.
+
+Examples:
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 100,1000,10000,50000 --stages migrate
+    python -m benchmarks.run --sizes 2000 --stages library --playlists 8 --processes 4 --yt-search-latency 0.01
+    python -m benchmarks.run --sizes 5000 --yt-search-latency 0.05 --search-workers 8 --json bench.json
+"""
+
+import argparse
+import json
+from dataclasses import fields
+from typing import List
+
+from benchmarks.harness import DEFAULT_STAGES, STAGES, BenchConfig, run_isolated, run_scenario
+
+
+def parse_args() -> argparse.Namespace:
+    defaults = BenchConfig()
+    parser = argparse.ArgumentParser(description="Offline Spot2YTM throughput benchmarks.")
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma separated playlist sizes (100 to 50000).")
+    parser.add_argument("--stages", default=",".join(DEFAULT_STAGES), help=f"Comma separated stages: {', '.join(STAGES)}.")
+    parser.add_argument("--spotify-latency", type=float, default=defaults.spotify_latency, help="Seconds added per Spotify request.")
+    parser.add_argument("--spotify-error-rate", type=float, default=defaults.spotify_error_rate, help="Share of Spotify requests failing with 503.")
+    parser.add_argument("--yt-search-latency", type=float, default=defaults.yt_search_latency, help="Seconds per YT Music search.")
+    parser.add_argument("--yt-write-latency", type=float, default=defaults.yt_write_latency, help="Seconds per YT Music playlist mutation.")
+    parser.add_argument("--yt-error-rate", type=float, default=defaults.yt_error_rate, help="Share of YT Music calls failing.")
+    parser.add_argument("--yt-miss-rate", type=float, default=defaults.yt_miss_rate, help="Share of tracks missing on YT Music.")
+    parser.add_argument("--fetch-workers", type=int, default=defaults.fetch_workers, help="Parallel Spotify page requests.")
+    parser.add_argument("--search-workers", type=int, default=defaults.search_workers, help="Parallel YT Music searches.")
+    parser.add_argument("--album-batch", type=int, default=defaults.album_batch, help="Album batching threshold (0 = off).")
+    parser.add_argument("--no-scoring", dest="scoring", action="store_false", help="Take the top search result instead of ranking.")
+    parser.add_argument("--no-cache", dest="cache", action="store_false", help="Disable the match cache.")
+    parser.add_argument("--no-journal", dest="journal", action="store_false", help="Disable the migration journal.")
+    parser.add_argument("--streaming", action="store_true", help="Use the streaming pipeline for 'migrate'.")
+    parser.add_argument("--http-cache", action="store_true", help="Revalidate Spotify responses from a warm ETag cache.")
+    parser.add_argument("--playlists", type=int, default=defaults.playlists, help="Playlists migrated by the 'library' stage.")
+    parser.add_argument("--processes", type=int, default=defaults.processes, help="Worker processes of the 'library' stage.")
+    parser.add_argument("--rate-limit", action="store_true", help="Keep the configured YT Music rate limits.")
+    parser.add_argument("--in-process", action="store_true", help="Run scenarios in this process (peak RSS is then cumulative).")
+    parser.add_argument("--json", help="Also write the raw results to this file.")
+    return parser.parse_args()
+
+
+def build_configs(args: argparse.Namespace) -> List[BenchConfig]:
+    options = {field.name: getattr(args, field.name) for field in fields(BenchConfig) if hasattr(args, field.name)}
+    options.pop("stage", None)
+    options.pop("size", None)
+    return [
+        BenchConfig(stage=stage.strip(), size=int(size), **options)
+        for stage in args.stages.split(",")
+        for size in args.sizes.split(",")
+    ]
+
+
+def print_result(result: dict) -> None:
+    config = result["config"]
+    rss = result["peak_rss_mb"]
+    print(
+        f"{config['stage']:<8} {config['size']:>6} tracks  {result['seconds']:8.2f} s  "
+        f"{result['tracks_per_sec']:10.1f} tracks/s  completed {result['completed']:>6}  "
+        + (f"peak RSS {rss:7.1f} MiB" if rss is not None else "peak RSS n/a")
+    )
+    for stage, stats in result["stages"].items():
+        print(
+            f"    {stage:<16} n={stats['count']:<7} p50 {stats['p50_ms']:8.2f} ms  "
+            f"p99 {stats['p99_ms']:8.2f} ms  total {stats['total_s']:8.2f} s"
+        )
+
+
+def main() -> None:
+    args = parse_args()
+    run = run_scenario if args.in_process else run_isolated
+    results = []
+    for config in build_configs(args):
+        result = run(config)
+        print_result(result)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Start-up time benchmark.
+
+Measures, in fresh interpreters, how long ``import spot2ytm.app``, loading the
+settings and ``create_app()`` take, and which heavy libraries they pulled in.
+Storage files are redirected to a temporary directory and no credentials are read,
+so this runs offline.
+
+Examples:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 20 --importtime
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.harness import percentile
+
+ROOT = Path(__file__).resolve().parent.parent
+PHASES = ("import", "settings", "create_app")
+# Libraries start-up should not need; they are loaded on first use.
+HEAVY_MODULES = ("requests", "urllib3", "ytmusicapi", "dotenv")
+
+_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import spot2ytm.app
+imported = time.perf_counter()
+from pathlib import Path
+from spot2ytm.config.settings import settings
+data = Path(sys.argv[1])
+for name in ("REVIEW_FILE", "MATCH_CACHE_FILE", "HTTP_CACHE_FILE", "MIGRATION_JOURNAL_FILE", "SYNC_STATE_FILE"):
+    setattr(settings, name, data / getattr(settings, name).name)
+loaded = time.perf_counter()
+spot2ytm.app.create_app()
+created = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "settings": loaded - imported,
+    "create_app": created - loaded,
+    "modules": [name for name in sys.argv[2:] if name in sys.modules],
+}))
+"""
+
+
+def child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("SPOTIFY_CLIENT_ID", "benchmark")
+    env.setdefault("SPOTIFY_CLIENT_SECRET", "benchmark")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def run_once() -> dict:
+    """Start one fresh interpreter and return its phase timings in seconds."""
+    with tempfile.TemporaryDirectory(prefix="spot2ytm-startup-") as workdir:
+        output = subprocess.run(
+            [sys.executable, "-c", _CHILD, workdir, *HEAVY_MODULES],
+            cwd=workdir, env=child_env(), capture_output=True, text=True, check=True,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_profile(top: int) -> List[str]:
+    """The slowest modules (cumulative time) of ``import spot2ytm.app``, from ``-X importtime``."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import spot2ytm.app"],
+        cwd=ROOT, env=child_env(), capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.removeprefix("import time:").split("|"))
+        rows.append((int(cumulative), name))
+    return [f"{cumulative / 1000:8.1f} ms  {name}" for cumulative, name in sorted(rows, reverse=True)[:top]]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Spot2YTM start-up time benchmark.")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters to time.")
+    parser.add_argument("--importtime", action="store_true", help="Also list the slowest imports.")
+    parser.add_argument("--top", type=int, default=15, help="Imports listed with --importtime.")
+    parser.add_argument("--json", help="Also write the raw results to this file.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    runs = [run_once() for _ in range(args.runs)]
+
+    summary = {}
+    for phase in PHASES + ("total",):
+        samples = sorted(sum(run[p] for p in PHASES) if phase == "total" else run[phase] for run in runs)
+        summary[phase] = {"p50_ms": percentile(samples, 0.50) * 1000, "p90_ms": percentile(samples, 0.90) * 1000}
+        print(f"{phase:<10}  p50 {summary[phase]['p50_ms']:7.1f} ms  p90 {summary[phase]['p90_ms']:7.1f} ms")
+
+    loaded = sorted({name for run in runs for name in run["modules"]})
+    print(f"heavy modules loaded at start-up: {', '.join(loaded) or 'none'}")
+
+    if args.importtime:
+        print("\nslowest imports of spot2ytm.app (cumulative):")
+        for line in import_profile(args.top):
+            print(f"  {line}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"runs": runs, "summary": summary, "heavy_modules": loaded}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
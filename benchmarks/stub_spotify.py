@@ -0,0 +1,189 @@
+"""Local stand-in for the Spotify Web API and token endpoint.
+
+Serves the subset of endpoints SpotifyClient and SpotifyAuthenticationManager use,
+with configurable per-request latency and error rate. Playlist IDs encode their tracks:
+``bench-5000`` is a playlist of catalog tracks 0..4999, ``bench-5000-1000`` one of
+tracks 5000..5999. GET responses carry an ETag
+and are answered with 304 Not Modified when ``If-None-Match`` matches it.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from urllib.parse import parse_qs, urlparse
+from benchmarks import catalog
+
+_PLAYLIST_PATH = re.compile(r"^/v1/playlists/([^/]+)(/tracks)?$")
+PAGE_LIMIT = 100
+
+
+def playlist_id(size: int, first: int = 0) -> str:
+    return f"bench-{first}-{size}" if first else f"bench-{size}"
+
+
+def playlist_ids(size: int, count: int) -> List[str]:
+    """IDs of ``count`` playlists of ``size`` tracks each, without shared tracks."""
+    return [playlist_id(size, number * size) for number in range(count)]
+
+
+def playlist_size(spotify_playlist_id: str) -> int:
+    return int(spotify_playlist_id.rsplit("-", 1)[-1])
+
+
+def playlist_first(spotify_playlist_id: str) -> int:
+    parts = spotify_playlist_id.split("-")
+    return int(parts[1]) if len(parts) == 3 else 0
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the stub server.
+
+    Attributes:
+        latency: Mean added latency per request, in seconds.
+        jitter: Latency varies uniformly by this fraction around the mean.
+        error_rate: Probability of answering a request with HTTP 503.
+        library: Sizes of the playlists listed under /v1/me/playlists.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.5
+    error_rate: float = 0.0
+    library: List[int] = field(default_factory=list)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "StubSpotifyServer"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        if status == 200 and self.command == "GET":
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            if self.headers.get("If-None-Match") == etag:
+                with self.server.lock:
+                    self.server.not_modified += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+        else:
+            etag = None
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _delay(self) -> bool:
+        """Apply latency and decide whether this request fails."""
+        config = self.server.config
+        if config.latency:
+            time.sleep(config.latency * random.uniform(1 - config.jitter, 1 + config.jitter))
+        failed = bool(config.error_rate) and random.random() < config.error_rate
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.errors += failed
+        if failed:
+            self._send(503, {"error": {"status": 503, "message": "stub error"}})
+            return False
+        return True
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if not self._delay():
+            return
+        if self.path.startswith("/api/token"):
+            self._send(200, {"access_token": "bench-token", "token_type": "Bearer", "expires_in": 3600})
+        else:
+            self._send(404, {"error": {"status": 404, "message": "not found"}})
+
+    def do_GET(self) -> None:
+        if not self._delay():
+            return
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if url.path == "/v1/me/playlists":
+            self._send(200, self._my_playlists(int(query.get("offset", 0)), int(query.get("limit", 50))))
+            return
+
+        match = _PLAYLIST_PATH.match(url.path)
+        if not match:
+            self._send(404, {"error": {"status": 404, "message": "not found"}})
+            return
+        spotify_playlist_id, tracks = match.groups()
+        size = playlist_size(spotify_playlist_id)
+        if tracks:
+            offset = int(query.get("offset", 0))
+            limit = min(int(query.get("limit", PAGE_LIMIT)), PAGE_LIMIT)
+            self._send(200, self._tracks_page(spotify_playlist_id, size, offset, limit))
+        else:
+            self._send(200, {
+                "id": spotify_playlist_id,
+                "name": f"Benchmark {spotify_playlist_id}",
+                "description": "Synthetic benchmark playlist",
+                "snapshot_id": f"snap-{spotify_playlist_id}",
+                "tracks": {"total": size},
+            })
+
+    def _tracks_page(self, spotify_playlist_id: str, size: int, offset: int, limit: int) -> dict:
+        end = min(size, offset + limit)
+        first = playlist_first(spotify_playlist_id)
+        base = f"http://{self.headers.get('Host')}/v1/playlists/{spotify_playlist_id}/tracks"
+        return {
+            "items": [catalog.spotify_item(first + index) for index in range(offset, end)],
+            "total": size,
+            "limit": limit,
+            "offset": offset,
+            "next": f"{base}?offset={end}&limit={limit}" if end < size else None,
+            "previous": None,
+        }
+
+    def _my_playlists(self, offset: int, limit: int) -> dict:
+        sizes = self.server.config.library
+        items = [
+            {"id": playlist_id(size), "name": f"Benchmark bench-{size}", "tracks": {"total": size}}
+            for size in sizes[offset:offset + limit]
+        ]
+        return {"items": items, "total": len(sizes), "limit": limit, "offset": offset}
+
+
+class StubSpotifyServer(ThreadingHTTPServer):
+    """Threaded stub server, started in the background on a free local port."""
+
+    daemon_threads = True
+
+    def __init__(self, config: StubConfig | None = None) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.config = config or StubConfig()
+        self.requests = 0
+        self.errors = 0
+        self.not_modified = 0
+        self.lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, name="stub-spotify", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubSpotifyServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+        self.server_close()
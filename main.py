@@ -1,16 +1,123 @@
+import argparse
+import logging
+
 from spot2ytm.config.settings import settings
 from spot2ytm.config.logging_config import LoggingConfigurator
 from spot2ytm.app import create_app
+from spot2ytm.clients.spotfiy_client import USER_TOKEN_REQUIRED, is_unauthorized
+from spot2ytm.services.sharded_migrator import ShardedMigrator
+from spot2ytm.storage.playlist_snapshot import PlaylistSnapshot
+from spot2ytm.telemetry.metrics import MetricsReporter, metrics
+from spot2ytm.telemetry.profiling import profiler
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Migrate Spotify playlists to YT Music.")
+    parser.add_argument(
+        "playlist_ids",
+        nargs="*",
+        help="Spotify playlist IDs to migrate. Several IDs are migrated together, "
+             "searching songs shared between them only once.",
+    )
+    parser.add_argument("--sync", action="store_true", help="Incrementally sync instead of a full migration.")
+    parser.add_argument(
+        "--library",
+        action="store_true",
+        help="Migrate every playlist in the Spotify library (largest first) instead of given IDs.",
+    )
+    phase = parser.add_mutually_exclusive_group()
+    phase.add_argument(
+        "--export",
+        action="store_true",
+        help="Only export the playlists (or --library) to snapshot files under DATA_DIR/snapshots.",
+    )
+    phase.add_argument(
+        "--from-snapshots",
+        action="store_true",
+        help="Migrate exported snapshots without calling Spotify. Arguments are playlist IDs or "
+             "snapshot files; without arguments every exported snapshot is migrated.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.MIGRATION_PROCESSES,
+        help="Worker processes for --library or several playlist IDs (default: MIGRATION_PROCESSES).",
+    )
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
     LoggingConfigurator(settings.DEBUG).configure()
-    migrator = create_app()
+    with profiler.stage("create_app"):
+        migrator = create_app()
 
-    migrator.migrate(
-        spotify_playlist_id=settings.MY_PL_ID
-    )
+    # Metrics are written to settings.METRICS_FILE every METRICS_INTERVAL seconds and at exit
+    with MetricsReporter(metrics, settings.METRICS_INTERVAL):
+        run(migrator, args)
+
+
+def run(migrator, args):
+    if args.export:
+        if args.library:
+            migrator.export_library()
+        else:
+            for playlist_id in args.playlist_ids or [settings.MY_PL_ID]:
+                try:
+                    migrator.export(playlist_id)
+                except Exception:
+                    logger.exception("Exporting spotify playlist %s failed, continuing with the next one", playlist_id)
+        return
+
+    if args.from_snapshots:
+        snapshots = [
+            PlaylistSnapshot(argument) if argument.endswith(".jsonl.gz") else PlaylistSnapshot.for_playlist(argument)
+            for argument in args.playlist_ids
+        ] or list(PlaylistSnapshot.all())
+        for snapshot in snapshots:
+            try:
+                yt_playlist_id = migrator.migrate_snapshot(snapshot)
+            except (FileNotFoundError, ValueError) as e:
+                logger.error("Skipping snapshot %s: %s", snapshot.path, e)
+                continue
+            except Exception:
+                logger.exception("Migrating snapshot %s failed, continuing with the next one", snapshot.path)
+                continue
+            if not yt_playlist_id:
+                logger.error("Migrating snapshot %s failed, continuing with the next one", snapshot.path)
+        return
+
+    if args.processes > 1 and (args.library or len(args.playlist_ids) > 1):
+        sharded = ShardedMigrator(args.processes)
+        if args.library:
+            try:
+                sharded.migrate_library(migrator.spotify_client, sync=args.sync)
+            except OSError as e:
+                if not is_unauthorized(e):
+                    raise
+                logger.error("%s (%s)", USER_TOKEN_REQUIRED, e)
+        else:
+            sharded.migrate(args.playlist_ids, sync=args.sync)
+        return
+
+    if args.library:
+        migrator.migrate_library(sync=args.sync)
+        return
+
+    playlist_ids = args.playlist_ids or [settings.MY_PL_ID]
+
+    if args.sync:
+        for playlist_id in playlist_ids:
+            migrator.sync(spotify_playlist_id=playlist_id)
+    elif len(playlist_ids) > 1:
+        migrator.migrate_many(playlist_ids)
+    else:
+        migrator.migrate(
+            spotify_playlist_id=playlist_ids[0]
+        )
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -5,12 +5,23 @@ It assembles all the necessary components (authentication managers, API clients,
 into a complete PlaylistMigrator instance.
 """
 
+from spot2ytm.config.settings import settings
+
 from spot2ytm.auth.spotify_authentication_manager import SpotifyAuthenticationManager
 from spot2ytm.auth.ytmusic_client_factory import YtMusicAuthenticationManager
 
+from spot2ytm.clients.http_transport import HttpTransport
 from spot2ytm.clients.spotfiy_client import SpotifyClient
 from spot2ytm.clients.ytmusic_client import YTMusicClient
 
+from spot2ytm.storage.http_cache import HttpCache
+from spot2ytm.storage.match_cache import MatchCache
+from spot2ytm.storage.migration_journal import MigrationJournal
+from spot2ytm.storage.review_list import ReviewList
+from spot2ytm.storage.sync_state import SyncStateStore
+
+from spot2ytm.services.library_index import LibraryIndex
+from spot2ytm.services.match_scoring import MatchScorer
 from spot2ytm.services.playlist_fetcher import PlaylistFetcher
 from spot2ytm.services.track_matcher import TrackMatcher
 from spot2ytm.services.playlist_migrator import PlaylistMigrator
@@ -26,13 +37,36 @@ def create_app():
     Returns:
         PlaylistMigrator: Fully configured playlist migrator instance ready for use.
     """
-    spotify_auth = SpotifyAuthenticationManager()
-    spotify_client = SpotifyClient(spotify_auth)
+    transport = HttpTransport()
+    spotify_auth = SpotifyAuthenticationManager(transport=transport)
+    http_cache = HttpCache() if settings.HTTP_CACHE_ENABLED else None
+    spotify_client = SpotifyClient(spotify_auth, transport=transport, http_cache=http_cache)
 
-    ytmusic = YtMusicAuthenticationManager().create()
-    ytmusic_client = YTMusicClient(ytmusic)
+    ytmusic_auth = YtMusicAuthenticationManager()
+    # The primary YT Music session is created on the first call, not here
+    ytmusic_client = YTMusicClient(None, ytmusic_factory=ytmusic_auth.create)
 
     fetcher = PlaylistFetcher(spotify_client)
-    matcher = TrackMatcher(ytmusic_client)
+    match_cache = MatchCache() if settings.MATCH_CACHE_ENABLED else None
+    library_index = LibraryIndex(ytmusic_client) if settings.YTM_LIBRARY_MATCHING else None
+    matcher = TrackMatcher(
+        ytmusic_client,
+        workers=settings.YTM_SEARCH_WORKERS,
+        cache=match_cache,
+        library_index=library_index,
+        album_batch_min_tracks=settings.YTM_ALBUM_BATCH_MIN_TRACKS,
+        scorer=MatchScorer(settings.YTM_MATCH_THRESHOLD) if settings.YTM_MATCH_SCORING else None,
+        candidates=settings.YTM_SEARCH_CANDIDATES,
+    )
+
+    journal = MigrationJournal() if settings.MIGRATION_JOURNAL_ENABLED else None
 
-    return PlaylistMigrator(fetcher, matcher, ytmusic_client, spotify_client)
+    return PlaylistMigrator(
+        fetcher,
+        matcher,
+        ytmusic_client,
+        spotify_client,
+        journal=journal,
+        sync_store=SyncStateStore(),
+        review_list=ReviewList(),
+    )
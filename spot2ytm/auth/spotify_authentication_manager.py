@@ -2,18 +2,29 @@
 
 This module handles OAuth 2.0 authentication with Spotify's API, including token
 requests, caching, expiration checking, and credential persistence.
+
+The token is cached in memory and shared by all threads. Within
+settings.SPOTIFY_TOKEN_EXPIRY_BUFFER seconds of expiry it is refreshed by one
+background thread while callers keep using the still-valid token; only a missing or
+expired token makes callers wait, and then a single request is sent for all of them.
 """
 
-import requests
 import os
 import json
+import tempfile
+import threading
 import time
 from spot2ytm.config.settings import settings
 from spot2ytm.auth.exceptions import SpotifyAuthenticationError
+from spot2ytm.clients.http_transport import HttpTransport
+from spot2ytm.telemetry.metrics import metrics
 import logging
 
 logger = logging.getLogger(__name__)
 
+TOKEN_REQUESTS = metrics.counter("spotify_token_requests_total", "Spotify access tokens requested")
+BACKGROUND_REFRESHES = metrics.counter("spotify_token_background_refreshes_total", "Spotify tokens refreshed ahead of expiry")
+
 
 class SpotifyAuthenticationManager:
     """Manages Spotify OAuth 2.0 authentication and token lifecycle.
@@ -21,6 +32,8 @@ class SpotifyAuthenticationManager:
     Implements a singleton pattern to ensure only one authentication manager instance exists.
     Handles token acquisition, caching, expiration tracking, and automatic renewal.
     Uses the Client Credentials OAuth 2.0 flow for server-to-server authentication.
+    Thread-safe: concurrent callers share one token and at most one token request
+    is in flight at a time.
     """
     
     _instance = None
@@ -31,39 +44,68 @@ class SpotifyAuthenticationManager:
         the application's lifetime.
         """
         if not cls._instance:
-            cls._instance = super(SpotifyAuthenticationManager, cls).__new__(cls, *args, **kwargs)
+            cls._instance = super(SpotifyAuthenticationManager, cls).__new__(cls)
         return cls._instance
         
-    def __init__(self, token_file=settings.SPOTIFY_TOKEN_FILE):
+    def __init__(self, token_file=None, transport: HttpTransport | None = None):
         """Initialize the authentication manager.
+        \n        The cached token is read on the first ``get_token`` call.
         \n        Args:
             token_file: Path to the file where tokens are cached. Defaults to settings.SPOTIFY_TOKEN_FILE.
+            transport: Pooled HTTP transport for token requests. A new one is created if not given.
         """
-        self.token_file = token_file
-        self.token = None
-        self.expiry = 0
-        self._load_token()
+        self.token_file = token_file or settings.SPOTIFY_TOKEN_FILE
+        self.transport = transport or HttpTransport()
+        # (token, expiry) replaced as one tuple, so lock-free readers never see a mix
+        self._state: tuple = (None, 0)
+        self._token_loaded = False
+        # Serializes token requests (single flight); waiters reuse the result
+        self._refresh_lock = threading.Lock()
+        self._background: threading.Thread | None = None
+        self._background_lock = threading.Lock()
+
+    @property
+    def token(self) -> str | None:
+        return self._state[0]
+
+    @property
+    def expiry(self) -> int:
+        return self._state[1]
 
     def _load_token(self):
         """Load a cached token and expiry time from the token file.
         \n        If the token file exists, reads and loads the stored token and expiry timestamp.
+        An unreadable file is ignored; a new token is requested instead.
         """
         if os.path.exists(self.token_file):
-            with open(self.token_file, 'r') as file:
-                data = json.load(file)
-                self.token = data.get("token")
-                self.expiry = data.get("expiry")
+            try:
+                with open(self.token_file, 'r') as file:
+                    data = json.load(file)
+                self._state = (data.get("token"), data.get("expiry") or 0)
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable Spotify token file %s: %s", self.token_file, e)
+        self._token_loaded = True
     
     def _save_token(self):
         """Save the current token and expiry time to the token file.
         \n        Persists the token to disk so it can be reused across application restarts
-        without requiring new authentication requests.
+        without requiring new authentication requests. The file is replaced atomically,
+        so a crash or a concurrent reader never sees a half-written token.
         """
-        with open(self.token_file, 'w') as file:
-            json.dump({
-                "token": self.token,
-                "expiry": self.expiry
-            }, file)
+        token, expiry = self._state
+        directory = os.path.dirname(os.path.abspath(self.token_file))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".spotify_token.")
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump({
+                    "token": token,
+                    "expiry": expiry
+                }, file)
+            os.replace(tmp, self.token_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
     
     def _get_current_time(self) -> int:
         """Get the current Unix timestamp.
@@ -78,6 +120,13 @@ class SpotifyAuthenticationManager:
             bool: True if the token has expired, False otherwise.
         """
         return self._get_current_time() >= self.expiry
+
+    def _is_token_expiring(self) -> bool:
+        """Check if the current token expires within settings.SPOTIFY_TOKEN_EXPIRY_BUFFER.
+        \n        Returns:
+            bool: True if the token should be refreshed, False otherwise.
+        """
+        return self._get_current_time() >= self.expiry - settings.SPOTIFY_TOKEN_EXPIRY_BUFFER
     
     def _request_new_token(self) -> str:
         """Request a new access token from Spotify's token endpoint.
@@ -92,6 +141,8 @@ class SpotifyAuthenticationManager:
             SpotifyAuthenticationError: If the token request fails due to invalid
                 credentials, network issues, or API errors.
         """
+        import requests
+
         data = {
             'grant_type': 'client_credentials',
             'client_id': settings.SPOTIFY_CLIENT_ID,
@@ -99,7 +150,7 @@ class SpotifyAuthenticationManager:
         }
 
         try:
-            response = requests.post(
+            response = self.transport.post(
                 url=settings.SPOTIFY_TOKEN_URL,
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
                 data=data
@@ -115,9 +166,12 @@ class SpotifyAuthenticationManager:
                     "Spotify API returned an invalid response: missing access token"
                 )
             
-            self.token = new_token
-            self.expiry = self._get_current_time() + payload.get("expires_in", 3600)
-            self._save_token()
+            self._state = (new_token, self._get_current_time() + payload.get("expires_in", 3600))
+            TOKEN_REQUESTS.inc()
+            try:
+                self._save_token()
+            except OSError as e:
+                logger.warning("Could not cache the Spotify token in %s: %s", self.token_file, e)
             logger.info("Successfully obtained new Spotify access token")
             return new_token
             
@@ -151,6 +205,51 @@ class SpotifyAuthenticationManager:
                 - Network connectivity issues
                 - Spotify API server errors
         """
-        if self.token is None or self._is_token_expired():
+        # Fast path: no lock while the token is not close to expiry
+        token, expiry = self._state
+        if token is not None and self._get_current_time() < expiry - settings.SPOTIFY_TOKEN_EXPIRY_BUFFER:
+            return token
+
+        if not self._token_loaded:
+            with self._refresh_lock:
+                if not self._token_loaded:
+                    self._load_token()
+            token = self.token
+
+        if token is not None and not self._is_token_expired():
+            # Still valid: refresh ahead of expiry without making the caller wait
+            if self._is_token_expiring():
+                self._refresh_in_background()
+            return token
+        return self._refresh()
+
+    def _refresh(self) -> str:
+        """Request a new token unless another thread did while this one waited.
+        \n        Returns:
+            str: A valid access token.
+        """
+        with self._refresh_lock:
+            token = self.token
+            if token is not None and not self._is_token_expired():
+                return token
             return self._request_new_token()
-        return self.token
\ No newline at end of file
+
+    def _refresh_in_background(self) -> None:
+        """Start the background refresh thread unless one is already running."""
+        with self._background_lock:
+            if self._background is not None and self._background.is_alive():
+                return
+            if not self._is_token_expiring():
+                return
+            self._background = threading.Thread(target=self._background_refresh, name="spotify-token-refresh", daemon=True)
+            self._background.start()
+
+    def _background_refresh(self) -> None:
+        """Refresh the token ahead of expiry; on failure the next caller retries."""
+        try:
+            with self._refresh_lock:
+                if self._is_token_expiring():
+                    self._request_new_token()
+                    BACKGROUND_REFRESHES.inc()
+        except (SpotifyAuthenticationError, RuntimeError) as e:
+            logger.warning("Background Spotify token refresh failed: %s", e)
\ No newline at end of file
@@ -4,9 +4,13 @@ This module manages authentication with YouTube Music using stored browser crede
 It provides a factory for creating authenticated YTMusic client instances.
 """
 
-from ytmusicapi import YTMusic
+from pathlib import Path
+from typing import TYPE_CHECKING
 from spot2ytm.config.settings import settings
 
+if TYPE_CHECKING:
+    from ytmusicapi import YTMusic
+
 
 class YtMusicAuthenticationManager:
     """Creates authenticated YouTube Music client instances.
@@ -24,23 +28,27 @@ class YtMusicAuthenticationManager:
         the application's lifetime.
         """
         if not cls._instance:
-            cls._instance = super(YtMusicAuthenticationManager, cls).__new__(cls, *args, **kwargs)
+            cls._instance = super(YtMusicAuthenticationManager, cls).__new__(cls)
         return cls._instance
     
-    def __init__(self, credentials_path=settings.YTMUSIC_AUTH_FILE) -> None:
+    def __init__(self, credentials_path: Path | None = None) -> None:
         """Initialize the YouTube Music authentication manager.
+        \n        The credentials file is only read when a client is created.
         \n        Args:
             credentials_path: Path to the browser JSON credentials file.
                             Defaults to settings.YTMUSIC_AUTH_FILE.
         """
-        self.credentials_path = credentials_path
+        self.credentials_path = credentials_path or settings.YTMUSIC_AUTH_FILE
 
     
-    def create(self) -> YTMusic:
+    def create(self) -> "YTMusic":
         """Create and return an authenticated YTMusic client.
         \n        Uses the stored browser credentials to authenticate with YouTube Music.
+        ytmusicapi is imported here, on first use, to keep start-up fast.
         \n        Returns:
             YTMusic: An authenticated YouTube Music client instance.
         """
+        from ytmusicapi import YTMusic
+
         return YTMusic(str(self.credentials_path))
     
@@ -0,0 +1,126 @@
+"""Shared HTTP transport for Spotify API calls.
+
+This module provides a pooled ``requests.Session`` with keep-alive, gzip, default
+timeouts and automatic retries with exponential backoff (honoring ``Retry-After`` on
+429 responses). It is shared by the Spotify client and authentication manager so
+connections are reused instead of opening a new TCP+TLS handshake per request.
+The session (and the requests library) is only loaded by the first request.
+"""
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+from spot2ytm.config.settings import settings
+from spot2ytm.telemetry.metrics import metrics
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = metrics.counter("spotify_requests_total", "HTTP requests sent to Spotify (token endpoint included)")
+RETRIES = metrics.counter("spotify_retries_total", "Spotify requests retried after a connection error or 429/5xx")
+REQUEST_SECONDS = metrics.histogram("spotify_request_seconds", "Spotify request latency including retries")
+
+
+class HttpTransport:
+    """Pooled, retrying HTTP session wrapper.
+
+    Retries connection errors and 429/5xx responses with exponential backoff.
+    When Spotify answers 429 with a ``Retry-After`` header, the retry waits for
+    the time the server asked for.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        max_retries: int | None = None,
+        backoff_factor: float | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Initialize the transport.
+        \n        Args:
+            pool_size: Max pooled connections per host. Defaults to settings.HTTP_POOL_SIZE.
+            max_retries: Max retries per request. Defaults to settings.HTTP_MAX_RETRIES.
+            backoff_factor: Exponential backoff factor in seconds. Defaults to settings.HTTP_BACKOFF_FACTOR.
+            timeout: Default request timeout in seconds. Defaults to settings.HTTP_TIMEOUT.
+        """
+        self.pool_size = pool_size or settings.HTTP_POOL_SIZE
+        self.max_retries = settings.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_factor = settings.HTTP_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        self.timeout = timeout or settings.HTTP_TIMEOUT
+        self._session: "requests.Session | None" = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """The pooled session, built on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> "requests.Session":
+        """Create the session with the retrying, pooled adapter mounted."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        return session
+
+    def get(self, url: str, **kwargs) -> "requests.Response":
+        """Send a GET request through the pooled session.
+        \n        Args:
+            url: The request URL.
+            **kwargs: Extra arguments passed to ``requests.Session.get``.
+            \n        Returns:
+            requests.Response: The final response after any retries.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        with REQUEST_SECONDS.time():
+            response = self.session.get(url, **kwargs)
+        self._count(response)
+        return response
+
+    def post(self, url: str, **kwargs) -> "requests.Response":
+        """Send a POST request through the pooled session.
+        \n        Args:
+            url: The request URL.
+            **kwargs: Extra arguments passed to ``requests.Session.post``.
+            \n        Returns:
+            requests.Response: The final response after any retries.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        with REQUEST_SECONDS.time():
+            response = self.session.post(url, **kwargs)
+        self._count(response)
+        return response
+
+    def _count(self, response: "requests.Response") -> None:
+        """Update the request and retry counters for a finished request."""
+        REQUESTS.inc()
+        retries = getattr(response.raw, "retries", None)
+        if retries is not None and retries.history:
+            RETRIES.inc(len(retries.history))
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        if self._session is not None:
+            self._session.close()
@@ -0,0 +1,120 @@
+"""Adaptive rate limiting for YouTube Music calls.
+
+This module provides a thread-safe token bucket whose refill rate adapts AIMD-style:
+it grows additively while calls succeed and is cut multiplicatively when the service
+throttles or returns errors. YTMusicClient keeps one limiter per operation class
+(searches vs. playlist mutations) so each runs at the highest rate the service accepts.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict
+from spot2ytm.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SEARCH = "search"
+WRITE = "write"
+
+
+class AdaptiveRateLimiter:
+    """Token bucket with an additive-increase / multiplicative-decrease refill rate.
+
+    ``acquire`` blocks until a token is available. ``on_success`` raises the rate by
+    roughly ``increase`` requests/second for every second of successful calls, and
+    ``on_throttle`` multiplies it by ``decrease_factor`` (at most once per cooldown,
+    so one burst of failures does not collapse the rate to the minimum).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        min_rate: float,
+        max_rate: float,
+        increase: float = 0.5,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ) -> None:
+        """Initialize the limiter.
+        \n        Args:
+            name: Operation class name, used in logs.
+            rate: Initial rate in requests per second.
+            min_rate: Lower bound for the rate.
+            max_rate: Upper bound for the rate. Also the bucket capacity (max burst).
+            increase: Additive increase in requests/second per second of success.
+            decrease_factor: Multiplier applied to the rate on throttling.
+            cooldown: Minimum seconds between two decreases.
+        """
+        self.name = name
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+
+        self._tokens = 1.0
+        self._capacity = max(1.0, self.rate)
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last refill. Caller holds the lock."""
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful call."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+                self._capacity = max(1.0, self.rate)
+
+    def on_throttle(self) -> None:
+        """Multiplicatively decrease the rate after a throttled or failed call."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._capacity = max(1.0, self.rate)
+            self._tokens = min(self._tokens, 0.0)
+            logger.warning("YTMusic %s rate lowered to %.2f req/s", self.name, self.rate)
+
+
+def default_limiters() -> Dict[str, AdaptiveRateLimiter]:
+    """Build the per-operation-class limiters configured in settings.
+    \n    Returns:
+        Dict[str, AdaptiveRateLimiter]: Limiters keyed on SEARCH and WRITE.
+    """
+    return {
+        SEARCH: AdaptiveRateLimiter(
+            SEARCH,
+            rate=settings.YTM_SEARCH_RATE,
+            min_rate=settings.YTM_MIN_RATE,
+            max_rate=settings.YTM_SEARCH_MAX_RATE,
+        ),
+        WRITE: AdaptiveRateLimiter(
+            WRITE,
+            rate=settings.YTM_WRITE_RATE,
+            min_rate=settings.YTM_MIN_RATE,
+            max_rate=settings.YTM_WRITE_MAX_RATE,
+        ),
+    }
@@ -4,11 +4,39 @@ This module provides a client interface for interacting with the Spotify Web API
 including user profile access, playlist management, and track retrieval.
 """
 
-from typing import List
-import requests
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
+from urllib.parse import urlencode
 from spot2ytm.auth.spotify_authentication_manager import SpotifyAuthenticationManager
+from spot2ytm.clients.http_transport import HttpTransport
 from spot2ytm.config.settings import settings
 from spot2ytm.domain.track import Track
+from spot2ytm.domain.track_batch import TrackBatch
+from spot2ytm.storage.http_cache import HttpCache
+from spot2ytm.telemetry.metrics import metrics
+
+PAGE_SECONDS = metrics.histogram("spotify_page_seconds", "Latency of one playlist tracks page, download and parsing")
+TRACKS_FETCHED = metrics.counter("spotify_tracks_fetched_total", "Tracks fetched from Spotify playlists")
+HTTP_CACHE_HITS = metrics.counter("spotify_http_cache_hits_total", "Spotify responses served from the HTTP cache after a 304")
+HTTP_CACHE_MISSES = metrics.counter("spotify_http_cache_misses_total", "Spotify responses downloaded in full with the HTTP cache enabled")
+
+USER_TOKEN_REQUIRED = (
+    "Listing the Spotify library requires a user-authorized token; the client-credentials "
+    "token cannot read /me/playlists. Pass playlist IDs instead."
+)
+
+
+def is_unauthorized(error: BaseException) -> bool:
+    """Whether an error is Spotify refusing the access token (HTTP 401 or 403).
+    \n    Args:
+        error: The raised exception, e.g. a requests.HTTPError from raise_for_status.
+        \n    Returns:
+        bool: True if the error carries a 401 or 403 response.
+    """
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) in (401, 403)
 
 
 class SpotifyClient:
@@ -17,13 +45,27 @@ class SpotifyClient:
     Provides methods to fetch user profiles, retrieve playlists, and get track information
     from Spotify using authenticated API requests.
     """
+
+    # Track fields requested for every playlist page.
+    TRACK_ITEM_FIELDS = 'items(track(id,name,type,duration_ms,external_ids(isrc),album(name),artists(name)))'
     
-    def __init__(self, auth_manager: SpotifyAuthenticationManager):
+    def __init__(
+        self,
+        auth_manager: SpotifyAuthenticationManager,
+        transport: HttpTransport | None = None,
+        http_cache: HttpCache | None = None,
+    ):
         """Initialize the Spotify client.
         \n        Args:
             auth_manager: SpotifyAuthenticationManager instance for handling OAuth tokens.
+            transport: Pooled HTTP transport used for every request. A new one is
+                       created if not given.
+            http_cache: Optional response cache. When given, requests carry the cached
+                        ETag in ``If-None-Match`` and 304 answers are served from it.
         """
         self.auth_manager = auth_manager
+        self.transport = transport or HttpTransport()
+        self.http_cache = http_cache
 
     def _headers(self) -> dict:
         """Generate authorization headers for API requests.
@@ -33,13 +75,51 @@ class SpotifyClient:
         return {
             'Authorization': 'Bearer ' +  self.auth_manager.get_token()  # type: ignore
             }
+
+    def _get_json(self, url: str, params: dict | None = None) -> dict:
+        """Send an authorized GET request and decode the JSON response.
+        \n        With an HTTP cache, the request is made conditional on the cached ETag and
+        a 304 Not Modified answer is served from the cached body.
+        \n        Args:
+            url: The request URL.
+            params: Optional query parameters.
+            \n        Returns:
+            dict: The decoded response body.
+            \n        Raises:
+            requests.HTTPError: If Spotify answered with an error status (after the
+                                transport's retries).
+        """
+        if self.http_cache is None:
+            response = self.transport.get(url=url, headers=self._headers(), params=params)
+            response.raise_for_status()
+            return response.json()
+
+        key = url
+        if params:
+            key += ('&' if '?' in url else '?') + urlencode(sorted(params.items()))
+        cached = self.http_cache.get(key)
+        headers = self._headers()
+        if cached:
+            headers['If-None-Match'] = cached[0]
+
+        response = self.transport.get(url=url, headers=headers, params=params)
+        if response.status_code == 304 and cached:
+            HTTP_CACHE_HITS.inc()
+            return json.loads(cached[1])
+
+        HTTP_CACHE_MISSES.inc()
+        response.raise_for_status()
+        etag = response.headers.get('ETag')
+        if response.status_code == 200 and etag:
+            self.http_cache.put(key, etag, response.content)
+        return response.json()
             
     def get_profile(self) -> dict:
         """Retrieve the authenticated user's profile information.
         \n        Returns:
             dict: User profile data including display name, email, and ID.
         """
-        response = requests.get(url='https://api.spotify.com/v1/me', headers=self._headers()).json()
+        response = self._get_json('https://api.spotify.com/v1/me')
         return response
     
     def get_my_playlists(self) -> dict:
@@ -47,9 +127,40 @@ class SpotifyClient:
         \n        Returns:
             dict: Paginated list of user's playlists.
         """
-        response = requests.get(url='https://api.spotify.com/v1/me/playlists', headers=self._headers()).json()
+        response = self._get_json('https://api.spotify.com/v1/me/playlists')
         return response
 
+    def get_all_my_playlists(self, max_workers: int = 4) -> List[dict]:
+        """Retrieve every playlist in the authenticated user's library.
+        \n        The first page gives the total count; the remaining pages are then fetched
+        in parallel by offset. Playlists are returned largest first (by track
+        count), so the longest migrations can be started first.
+        \n        Needs a user-authorized token; with the client-credentials token Spotify
+        answers 401 (see is_unauthorized).
+        \n        Args:
+            max_workers: Maximum number of concurrent page requests.
+            \n        Returns:
+            List[dict]: Simplified playlist objects ('id', 'name', 'tracks'...), sorted by
+            track count in descending order.
+        """
+        url = 'https://api.spotify.com/v1/me/playlists'
+        limit = 50
+        first = self._get_json(url, params={'limit': limit, 'offset': 0})
+        playlists = list(first.get('items', []))
+        offsets = range(limit, first.get('total', 0), limit)
+
+        def fetch_page(offset: int) -> list:
+            response = self._get_json(url, params={'limit': limit, 'offset': offset})
+            return response.get('items', [])
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="spotify-library") as executor:
+            for page in executor.map(fetch_page, offsets):
+                playlists.extend(page)
+
+        playlists = [playlist for playlist in playlists if playlist]
+        playlists.sort(key=lambda playlist: (playlist.get('tracks') or {}).get('total', 0), reverse=True)
+        return playlists
+
     def get_playlist_name_desc(self, playlist_id: str) -> tuple:
         """Retrieve a playlist's name and description.
         \n        Args:
@@ -60,9 +171,24 @@ class SpotifyClient:
         params = {
             'fields': 'name,description'
         }
-        response = requests.get(url=f'https://api.spotify.com/v1/playlists/{playlist_id}', headers=self._headers(), params=params).json()
+        response = self._get_json(f'https://api.spotify.com/v1/playlists/{playlist_id}', params=params)
         return response['name'], response['description']
 
+    def get_playlist_snapshot_id(self, playlist_id: str) -> str:
+        """Retrieve a playlist's current snapshot ID.
+        \n        The snapshot ID changes whenever the playlist's tracks change, so it can be
+        used to detect whether a playlist needs to be synced again.
+        \n        Args:
+            playlist_id: The Spotify playlist ID.
+            \n        Returns:
+            str: The playlist's snapshot ID.
+        """
+        params = {
+            'fields': 'snapshot_id'
+        }
+        response = self._get_json(f'https://api.spotify.com/v1/playlists/{playlist_id}', params=params)
+        return response['snapshot_id']
+
     def get_playlist(self, playlist_id: str) -> dict:
         """Retrieve a playlist with its track information.
         \n        Args:
@@ -71,9 +197,9 @@ class SpotifyClient:
             dict: Playlist data including name and tracks with track details.
         """
         params = {
-            'fields': 'name,tracks(items(track(name,album(name))))'
+            'fields': f'name,tracks({self.TRACK_ITEM_FIELDS})'
         }
-        response = requests.get(url=f'https://api.spotify.com/v1/playlists/{playlist_id}', headers=self._headers(), params=params).json()
+        response = self._get_json(f'https://api.spotify.com/v1/playlists/{playlist_id}', params=params)
         return response
 
     def get_playlist_songs_count(self, playlist_id: str) -> tuple:
@@ -86,24 +212,115 @@ class SpotifyClient:
         params = {
             'fields': 'total,limit'
         }
-        response = requests.get(url=f'https://api.spotify.com/v1/playlists/{playlist_id}/tracks', headers=self._headers(), params=params).json()
+        response = self._get_json(f'https://api.spotify.com/v1/playlists/{playlist_id}/tracks', params=params)
         return response['total'], response['limit']    
 
-    def get_playlist_songs(self, playlist_id: str) -> List[Track]:
-        """Retrieve all songs from a Spotify playlist with pagination.
+    def _parse_tracks(self, items: list) -> TrackBatch:
+        """Convert playlist track items into Track objects.
+        \n        Items without a track (removed or unavailable tracks) and podcast episodes
+        are skipped. Local files are kept; they have no Spotify ID or ISRC.
         \n        Args:
-            playlist_id: The Spotify playlist ID.
+            items: The 'items' array of a playlist tracks page.
             \n        Returns:
-            List[Track]: List of Track objects containing title and album information.
+            TrackBatch: The tracks of the page, in order.
+        """
+        songs = TrackBatch()
+        for item in items:
+            track = item.get('track')
+            if not track or track.get('type', 'track') != 'track' or not track.get('name'):
+                continue
+            songs.append(Track(
+                title=track['name'],
+                album=(track.get('album') or {}).get('name') or "",
+                id=track.get('id') or "",
+                isrc=(track.get('external_ids') or {}).get('isrc') or "",
+                artists=tuple(artist['name'] for artist in track.get('artists') or [] if artist.get('name')),
+                duration_ms=track.get('duration_ms') or 0,
+            ))
+        return songs
+
+    def iter_playlist_pages(self, playlist_id: str) -> Iterator[TrackBatch]:
+        """Yield the songs of a Spotify playlist one page at a time.
+        \n        Each page is yielded as soon as it is downloaded, so callers can start
+        processing before the whole playlist has been fetched.
+        \n        Args:
+            playlist_id: The Spotify playlist ID.
+            \n        Yields:
+            TrackBatch: The tracks of one page, in playlist order.
         """
         params = {
-            'fields': 'next,previous,items(track(name,album(name)))',
+            'fields': f'next,previous,{self.TRACK_ITEM_FIELDS}',
         }
         url = f'https://api.spotify.com/v1/playlists/{playlist_id}/tracks'
-        songs = []
         while url:
-            response = requests.get(url=url, headers=self._headers(), params=params).json()
-            for item in response['items']:
-                songs.append(Track(title=item['track']['name'], album=item['track']['album']['name']))
+            with PAGE_SECONDS.time():
+                response = self._get_json(url, params=params)
+                page = self._parse_tracks(response['items'])
+            TRACKS_FETCHED.inc(len(page))
+            yield page
             url = response['next']
-        return songs
\ No newline at end of file
+
+    def get_playlist_page(self, playlist_id: str, offset: int, limit: int) -> TrackBatch:
+        """Retrieve one page of a playlist's songs by offset.
+        \n        Args:
+            playlist_id: The Spotify playlist ID.
+            offset: Index of the first track to return.
+            limit: Maximum number of tracks to return.
+            \n        Returns:
+            TrackBatch: The tracks of the page.
+        """
+        params = {
+            'fields': self.TRACK_ITEM_FIELDS,
+            'offset': offset,
+            'limit': limit,
+        }
+        with PAGE_SECONDS.time():
+            response = self._get_json(f'https://api.spotify.com/v1/playlists/{playlist_id}/tracks', params=params)
+            page = self._parse_tracks(response['items'])
+        TRACKS_FETCHED.inc(len(page))
+        return page
+
+    def iter_playlist_pages_parallel(self, playlist_id: str, max_workers: int = 4) -> Iterator[TrackBatch]:
+        """Yield a playlist's pages in order while fetching several of them in parallel.
+        \n        Uses get_playlist_songs_count to compute every page offset up front, then
+        downloads pages concurrently. At most ``2 * max_workers`` pages are in flight
+        or buffered at a time, so memory stays bounded for very large playlists.
+        \n        Args:
+            playlist_id: The Spotify playlist ID.
+            max_workers: Maximum number of concurrent page requests.
+            \n        Yields:
+            TrackBatch: The tracks of one page, in playlist order.
+        """
+        total, limit = self.get_playlist_songs_count(playlist_id)
+        offsets = iter(range(0, total, limit or 100))
+        window = max(1, max_workers) * 2
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="spotify-page") as executor:
+            pending = deque()
+            for offset in offsets:
+                pending.append(executor.submit(self.get_playlist_page, playlist_id, offset, limit))
+                if len(pending) >= window:
+                    break
+            while pending:
+                page = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(self.get_playlist_page, playlist_id, next_offset, limit))
+                yield page
+
+    def get_playlist_songs(self, playlist_id: str, max_workers: int = 1) -> TrackBatch:
+        """Retrieve all songs from a Spotify playlist with pagination.
+        \n        Args:
+            playlist_id: The Spotify playlist ID.
+            max_workers: Number of pages fetched in parallel. 1 follows the 'next' links sequentially.
+            \n        Returns:
+            TrackBatch: The tracks with title, album, artists, ID, ISRC and duration.
+        """
+        pages = (
+            self.iter_playlist_pages_parallel(playlist_id, max_workers)
+            if max_workers > 1
+            else self.iter_playlist_pages(playlist_id)
+        )
+        songs = TrackBatch()
+        for page in pages:
+            songs.extend(page)
+        return songs
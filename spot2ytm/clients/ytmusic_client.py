@@ -5,59 +5,225 @@ including playlist management, song searching, and track addition.
 """
 
 import logging
-from ytmusicapi import YTMusic
-from typing import List
-import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+from spot2ytm.clients.rate_limiter import SEARCH, WRITE, AdaptiveRateLimiter, default_limiters
+from spot2ytm.config.settings import settings
+from spot2ytm.domain.insert_result import InsertResult
+from spot2ytm.domain.normalization import normalize_text
+from spot2ytm.telemetry.metrics import metrics
+
+if TYPE_CHECKING:
+    from ytmusicapi import YTMusic
 
 logger = logging.getLogger(__name__)
 
+SEARCHES = metrics.counter("ytmusic_searches_total", "YT Music song searches")
+SEARCH_SECONDS = metrics.histogram("ytmusic_search_seconds", "YT Music song search latency including retries")
+RETRIES = metrics.counter("ytmusic_retries_total", "YT Music calls retried after a server or throttling error")
+ERRORS = metrics.counter("ytmusic_errors_total", "YT Music calls that failed after all retries")
+INSERT_SECONDS = metrics.histogram("ytmusic_insert_seconds", "Latency of one add_playlist_items request including retries")
+SONGS_ADDED = metrics.counter("ytmusic_songs_added_total", "Songs added to YT Music playlists")
+SONGS_REJECTED = metrics.counter("ytmusic_songs_rejected_total", "Songs YT Music could not add to a playlist")
+SONGS_ERRORED = metrics.counter("ytmusic_songs_errored_total", "Songs not added to a playlist because the request failed")
+
 
 class YTMusicClient:
     """Client for interacting with YouTube Music.
     
     Provides methods to search for songs, create and manage playlists,
     and add tracks to YouTube Music playlists.
+
+    A single YTMusic session is not safe to share across threads. When a
+    ``ytmusic_factory`` is supplied, every worker thread other than the one that
+    created the client lazily gets its own YTMusic instance from the factory, so the
+    client can be called concurrently (e.g. by TrackMatcher's search workers).
+
+    Every YTMusic call goes through an adaptive rate limiter for its operation class
+    (SEARCH for reads, WRITE for playlist mutations). Server errors such as HTTP 429
+    lower the rate and are retried; successful calls ramp the rate back up.
     """
     
-    def __init__(self, ytmusic: YTMusic) -> None:
+    def __init__(
+        self,
+        ytmusic: "YTMusic | None",
+        ytmusic_factory: "Callable[[], YTMusic] | None" = None,
+        limiters: Dict[str, AdaptiveRateLimiter] | None = None,
+    ) -> None:
         """Initialize the YouTube Music client.
         \n        Args:
-            ytmusic: An authenticated YTMusic instance.
+            ytmusic: An authenticated YTMusic instance, or None to create the primary
+                     session from ``ytmusic_factory`` on the first call.
+            ytmusic_factory: Optional callable returning a new authenticated YTMusic
+                             instance, used to give each worker thread its own session.
+            limiters: Rate limiters keyed on operation class. Defaults to the limits
+                      configured in settings.
+        """
+        if ytmusic is None and ytmusic_factory is None:
+            raise ValueError("Either a YTMusic instance or a ytmusic_factory is required")
+        self._client = ytmusic
+        self._client_lock = threading.Lock()
+        self.ytmusic_factory = ytmusic_factory
+        self.limiters = limiters if limiters is not None else default_limiters()
+        self._playlists_by_name: Dict[str, dict] | None = None
+        self._playlist_index_built_at = 0.0
+        self._playlist_lock = threading.RLock()
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()
+        self._insert_executor: ThreadPoolExecutor | None = None
+        self._insert_workers = 0
+        self._insert_pool_lock = threading.Lock()
+
+    @property
+    def client(self) -> "YTMusic":
+        """The primary YTMusic session, created from the factory on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self.ytmusic_factory()  # type: ignore[misc]
+        return self._client
+
+    def _session(self) -> "YTMusic":
+        """Return the YTMusic session bound to the calling thread.
+        \n        The owning thread (and every thread, if no factory was given) uses the
+        primary instance. Other threads get a per-thread instance from the factory.
+        \n        Returns:
+            YTMusic: The YTMusic instance to use from the current thread.
         """
-        self.client = ytmusic
+        if self.ytmusic_factory is None or threading.get_ident() == self._owner_thread:
+            return self.client
+        session = getattr(self._local, "client", None)
+        if session is None:
+            session = self.ytmusic_factory()
+            self._local.client = session
+            logger.debug("Created YTMusic session for thread %s", threading.current_thread().name)
+        return session
+
+    def _insert_pool(self, workers: int) -> ThreadPoolExecutor:
+        """Return the chunk insert pool, creating it on first use.
+        \n        The pool is kept for the client's lifetime so worker threads (and their
+        YTMusic sessions) are reused from batch to batch. It is only rebuilt if a
+        call asks for a different number of chunks in flight.
+        \n        Args:
+            workers: Concurrent chunk requests.
+            \n        Returns:
+            ThreadPoolExecutor: The insert worker pool.
+        """
+        with self._insert_pool_lock:
+            if self._insert_executor is None or self._insert_workers != workers:
+                if self._insert_executor is not None:
+                    self._insert_executor.shutdown(wait=True)
+                self._insert_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ytm-insert")
+                self._insert_workers = workers
+            return self._insert_executor
+
+    def close(self) -> None:
+        """Shut down the chunk insert pool, if it was started."""
+        with self._insert_pool_lock:
+            if self._insert_executor is not None:
+                self._insert_executor.shutdown(wait=True)
+                self._insert_executor = None
+
+    def _call(self, operation: str, method: str, *args, **kwargs) -> Any:
+        """Invoke a YTMusic method behind the rate limiter of its operation class.
+        \n        YTMusicServerError responses (throttling, 5xx) slow the limiter down and
+        are retried up to settings.YTM_THROTTLE_RETRIES times before being re-raised.
+        \n        Args:
+            operation: Operation class, SEARCH or WRITE.
+            method: Name of the YTMusic method to call.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+            \n        Returns:
+            Any: The method's return value.
+        """
+        from ytmusicapi.exceptions import YTMusicServerError
+
+        limiter = self.limiters.get(operation)
+        attempt = 0
+        while True:
+            if limiter:
+                limiter.acquire()
+            try:
+                result = getattr(self._session(), method)(*args, **kwargs)
+            except YTMusicServerError as e:
+                if limiter:
+                    limiter.on_throttle()
+                attempt += 1
+                if attempt > settings.YTM_THROTTLE_RETRIES:
+                    ERRORS.inc()
+                    raise
+                RETRIES.inc()
+                logger.warning("YTMusic %s failed (attempt %d), retrying: %s", method, attempt, str(e).splitlines()[0])
+                time.sleep(min(2 ** attempt, 30) * 0.5)
+                continue
+            if limiter:
+                limiter.on_success()
+            return result
 
     def get_all_user_playlists(self) -> list:
         """Retrieve all playlists from the user's YouTube Music library.
         \n        Returns:
             list: List of playlist objects with metadata.
         """
-        response = self.client.get_library_playlists()
-        playlists = json.loads(json.dumps(response))
-        return playlists
+        response = self._call(SEARCH, "get_library_playlists", limit=None)
+        return list(response)
+
+    def get_library_tracks(self) -> List[dict]:
+        """Retrieve every song in the user's library and liked songs.
+        \n        Returns:
+            List[dict]: Song objects with 'videoId', 'title', 'artists' and 'album'.
+        """
+        songs = list(self._call(SEARCH, "get_library_songs", limit=None))
+        liked = self._call(SEARCH, "get_liked_songs", limit=None)
+        songs.extend(liked.get('tracks', []) if isinstance(liked, dict) else [])
+        return songs
+
+    def _playlist_index(self) -> Dict[str, dict]:
+        """Return the name -> playlist index, (re)building it when missing or expired.
+        \n        Caller must hold ``_playlist_lock``.
+        \n        Returns:
+            Dict[str, dict]: Library playlists keyed on title (first one wins on duplicates).
+        """
+        expired = time.monotonic() - self._playlist_index_built_at >= settings.YTM_PLAYLIST_INDEX_TTL
+        if self._playlists_by_name is None or expired:
+            index: Dict[str, dict] = {}
+            for playlist in self.get_all_user_playlists():
+                index.setdefault(playlist['title'], playlist)
+            self._playlists_by_name = index
+            self._playlist_index_built_at = time.monotonic()
+            logger.debug("Indexed %d YTMusic library playlists", len(index))
+        return self._playlists_by_name
+
+    def invalidate_playlist_index(self) -> None:
+        """Drop the cached playlist index so the next lookup refetches the library."""
+        with self._playlist_lock:
+            self._playlists_by_name = None
     
     def get_playlist_by_name(self, name: str) -> dict | None:
         """Find a playlist by its name in the user's library.
+        \n        Served from an in-memory index built from one library fetch and refreshed
+        after settings.YTM_PLAYLIST_INDEX_TTL seconds or invalidate_playlist_index().
         \n        Args:
             name: The name of the playlist to search for.
             \n        Returns:
             dict | None: The playlist object if found, None otherwise.
         """
-        playlists = self.get_all_user_playlists()
-        for playlist in playlists:
-            if playlist['title'] == name:
-                return playlist
-        return None
+        with self._playlist_lock:
+            return self._playlist_index().get(name)
 
-    def search_song(self, name: str, album: str = "", artist: str = "") -> str:
-        """Search for a song on YouTube Music.
-        \n        Constructs a search query from song name and album information,
-        then returns the video ID of the first matching song.
+    def search_candidates(self, name: str, album: str = "", artist: str = "", limit: int = 5) -> List[dict]:
+        """Search for a song on YouTube Music and return the top results.
+        \n        Constructs a search query from song name and album information and
+        returns up to ``limit`` song results from that single search.
         \n        Args:
             name: The name/title of the song to search for.
             album: Optional album name to improve search accuracy.
             artist: Currently unused parameter (kept for API compatibility).
+            limit: Maximum number of results to return.
             \n        Returns:
-            str: The YouTube Music video ID of the song.
+            List[dict]: Song results in YT Music's order (empty if nothing was found).
         """
         if not album:
             query = name  
@@ -65,8 +231,56 @@ class YTMusicClient:
             query = name  
         else: 
             query = f"{name} from {album}"
-        results = self.client.search(query=query, filter="songs")
-        return results[0]['videoId']
+        SEARCHES.inc()
+        with SEARCH_SECONDS.time():
+            results = self._call(SEARCH, "search", query=query, filter="songs")
+        return [result for result in results if result.get('videoId')][:limit]
+
+    def search_song(self, name: str, album: str = "", artist: str = "") -> str:
+        """Search for a song on YouTube Music.
+        \n        Constructs a search query from song name and album information,
+        then returns the video ID of the first matching song.
+        \n        Args:
+            name: The name/title of the song to search for.
+            album: Optional album name to improve search accuracy.
+            artist: Currently unused parameter (kept for API compatibility).
+            \n        Returns:
+            str: The YouTube Music video ID of the song, or empty string if nothing was found.
+        """
+        results = self.search_candidates(name, album, artist, limit=1)
+        return results[0]['videoId'] if results else ""
+
+    def get_album_tracks(self, album: str, artist: str = "") -> List[dict]:
+        """Look up an album on YouTube Music and return its tracklist.
+        \n        An album search result is only accepted if its title matches the requested
+        album name after normalization and, when an artist is given, that artist is
+        among the album's artists.
+        \n        Args:
+            album: The album name.
+            artist: Optional main artist of the album.
+            \n        Returns:
+            List[dict]: Album tracks shaped like song search results ('title', 'videoId',
+            'artists', 'album' and 'duration_seconds'), or an empty list if the album
+            was not found.
+        """
+        results = self._call(SEARCH, "search", query=f"{album} {artist}".strip(), filter="albums")
+        wanted = normalize_text(album)
+        wanted_artist = normalize_text(artist)
+        for result in results[:3]:
+            if not result.get('browseId') or normalize_text(result.get('title', "")) != wanted:
+                continue
+            if wanted_artist and wanted_artist not in {
+                normalize_text(found.get('name', "")) for found in result.get('artists') or []
+            }:
+                continue
+            response = self._call(SEARCH, "get_album", browseId=result['browseId'])
+            tracks = response.get('tracks', [])
+            for track in tracks:
+                # get_album gives the album as a plain title string
+                if not isinstance(track.get('album'), dict):
+                    track['album'] = {'name': response.get('title') or result.get('title', "")}
+            return tracks
+        return []
 
     def get_or_create_playlist(self, name: str, description: str, video_ids: List[str] = []) -> str:
         """Get an existing playlist by name or create a new one.
@@ -80,15 +294,17 @@ class YTMusicClient:
             \n        Returns:
             str: The playlist ID, or empty string if creation failed.
         """
-        playlist = self.get_playlist_by_name(name)
+        with self._playlist_lock:
+            playlist = self._playlist_index().get(name)
 
-        if playlist:
-            return playlist.get('playlistId', "")
-        
-        response = self.client.create_playlist(title=name, description=description, video_ids=video_ids)
-        
-        if isinstance(response, str):
-            return response
+            if playlist:
+                return playlist.get('playlistId', "")
+            
+            response = self._call(WRITE, "create_playlist", title=name, description=description, video_ids=video_ids)
+            
+            if isinstance(response, str):
+                self._playlists_by_name[name] = {'title': name, 'playlistId': response}  # type: ignore[index]
+                return response
 
         if isinstance(response, dict):
             logger.error(
@@ -106,17 +322,132 @@ class YTMusicClient:
         )
         return ""
 
-    def add_songs_to_playlist(self, playlist_id: str, song_ids: List[str]) -> bool:
-        """Add songs to a YouTube Music playlist.
+    def get_playlist_items(self, playlist_id: str) -> List[dict]:
+        """Retrieve every song currently in a YouTube Music playlist.
+        \n        Args:
+            playlist_id: The ID of the playlist.
+            \n        Returns:
+            List[dict]: Playlist items with at least 'videoId' and 'setVideoId'.
+        """
+        response = self._call(SEARCH, "get_playlist", playlistId=playlist_id, limit=None)
+        return [track for track in response.get('tracks', []) if track.get('videoId')]
+
+    def remove_songs_from_playlist(self, playlist_id: str, items: List[dict]) -> bool:
+        """Remove songs from a YouTube Music playlist.
+        \n        Args:
+            playlist_id: The ID of the playlist.
+            items: Playlist items as returned by get_playlist_items (need 'videoId' and 'setVideoId').
+            \n        Returns:
+            bool: True if YT Music reported success.
+        """
+        if not items:
+            return True
+        response = self._call(WRITE, "remove_playlist_items", playlistId=playlist_id, videos=items)
+        status = response.get('status', '') if isinstance(response, dict) else str(response)
+        if "succeed" in status.lower():
+            return True
+        logger.warning("Error response from YTMusic while removing songs from playlist.\n %s", response)
+        return False
+
+    def _add_items(self, playlist_id: str, song_ids: List[str]) -> bool:
+        """Send one add_playlist_items request.
         \n        Args:
             playlist_id: The ID of the target playlist.
-            song_ids: List of YouTube Music video IDs to add.
+            song_ids: Video IDs to add in this request.
             \n        Returns:
-            bool: True if songs were added successfully, False otherwise.
+            bool: True if YT Music reported success, False on an error status.
         """
-        response = self.client.add_playlist_items(playlistId=playlist_id, videoIds=song_ids, duplicates=True)
-        if "succeed" in response['status'].lower(): # type: ignore
+        with INSERT_SECONDS.time():
+            response = self._call(WRITE, "add_playlist_items", playlistId=playlist_id, videoIds=song_ids, duplicates=True)
+        status = response.get('status', '') if isinstance(response, dict) else ''
+        if "succeed" in status.lower():
             return True
+        logger.warning("Error response from YTMusic while adding song to playlist.\n %s",  response) # type: ignore
+        return False
+
+    def _insert_chunk(self, playlist_id: str, song_ids: List[str]) -> Tuple[List[str], List[str], List[str]]:
+        """Add one chunk with retries, bisecting it to isolate rejected IDs.
+        \n        A chunk that still fails after settings.YTM_INSERT_RETRIES retries is split
+        in half and each half is tried on its own, down to single IDs. Exceptions
+        (network or server trouble rather than a bad ID) are reported as errored
+        for the whole chunk, without bisecting, so the caller can retry them.
+        \n        Args:
+            playlist_id: The ID of the target playlist.
+            song_ids: Video IDs of the chunk.
+            \n        Returns:
+            Tuple[List[str], List[str], List[str]]: The added, rejected and errored IDs.
+        """
+        from ytmusicapi.exceptions import YTMusicError
+
+        try:
+            for _ in range(settings.YTM_INSERT_RETRIES + 1):
+                if self._add_items(playlist_id, song_ids):
+                    return song_ids, [], []
+        except (YTMusicError, OSError) as e:
+            logger.error("Adding %d songs to playlist %s failed: %s", len(song_ids), playlist_id, e)
+            return [], [], song_ids
+
+        if len(song_ids) == 1:
+            logger.warning("YTMusic rejected video %s for playlist %s", song_ids[0], playlist_id)
+            return [], song_ids, []
+
+        middle = len(song_ids) // 2
+        left_added, left_failed, left_errored = self._insert_chunk(playlist_id, song_ids[:middle])
+        right_added, right_failed, right_errored = self._insert_chunk(playlist_id, song_ids[middle:])
+        return left_added + right_added, left_failed + right_failed, left_errored + right_errored
+
+    def add_songs_to_playlist(
+        self,
+        playlist_id: str,
+        song_ids: List[str],
+        chunk_size: int | None = None,
+        max_in_flight: int | None = None,
+    ) -> InsertResult:
+        """Add songs to a YouTube Music playlist in chunks.
+        \n        Splits ``song_ids`` into chunks, retries failing chunks and bisects them to
+        isolate the IDs YT Music rejects, so one bad ID does not lose the rest.
+        With more than one chunk in flight, chunks are sent concurrently (each
+        worker thread on its own session) and may land out of order in the playlist.
+        \n        Args:
+            playlist_id: The ID of the target playlist.
+            song_ids: List of YouTube Music video IDs to add.
+            chunk_size: Video IDs per request. Defaults to settings.YTM_INSERT_CHUNK_SIZE.
+            max_in_flight: Concurrent chunk requests. Defaults to settings.YTM_INSERT_IN_FLIGHT.
+            \n        Returns:
+            InsertResult: Which IDs were added, rejected or errored. Truthy if all were added.
+        """
+        chunk_size = max(1, chunk_size or settings.YTM_INSERT_CHUNK_SIZE)
+        max_in_flight = max(1, max_in_flight or settings.YTM_INSERT_IN_FLIGHT)
+        chunks = [song_ids[start:start + chunk_size] for start in range(0, len(song_ids), chunk_size)]
+
+        if max_in_flight == 1 or len(chunks) <= 1:
+            outcomes = []
+            for index, chunk in enumerate(chunks):
+                outcome = self._insert_chunk(playlist_id, chunk)
+                outcomes.append(outcome)
+                if outcome[2]:
+                    # Stop at the first request error so nothing after it lands out of order
+                    outcomes.extend(([], [], later) for later in chunks[index + 1:])
+                    break
         else:
-            logger.warning("Error response from YTMusic while adding song to playlist.\n %s",  response) # type: ignore
-            return False
\ No newline at end of file
+            executor = self._insert_pool(max_in_flight)
+            outcomes = list(executor.map(lambda chunk: self._insert_chunk(playlist_id, chunk), chunks))
+
+        result = InsertResult(playlist_id=playlist_id)
+        for added, failed, errored in outcomes:
+            result.added.extend(added)
+            result.failed.extend(failed)
+            result.errored.extend(errored)
+        SONGS_ADDED.inc(len(result.added))
+        SONGS_REJECTED.inc(len(result.failed))
+        SONGS_ERRORED.inc(len(result.errored))
+        if not result.ok:
+            logger.warning(
+                "Added %d of %d songs to playlist %s; rejected: %s; errored: %d",
+                len(result.added),
+                len(song_ids),
+                playlist_id,
+                result.failed,
+                len(result.errored)
+            )
+        return result
@@ -3,11 +3,16 @@
 This module defines and manages all configuration settings for the Spot2YTM application,
 including API credentials, file paths, and behavior flags. It loads environment variables
 and provides a centralized Settings object for use throughout the application.
+
+The shared ``settings`` object is lazy: the .env file is loaded and the environment read
+on first attribute access, not at import, and the Spotify credentials are only
+validated when a Spotify call needs them.
 """
 
 import os
+import threading
+from functools import cached_property
 from pathlib import Path
-from dotenv import load_dotenv
 
 
 class Settings:
@@ -21,6 +26,7 @@ class Settings:
     - Debug and encoding settings
     
     Settings are loaded from environment variables and cached for efficient access.
+    Required credentials are read (and validated) on first access only.
     """
 
     def __init__(self):
@@ -34,15 +40,21 @@ class Settings:
 
         self.CREDS_DIR = self.BASE_DIR / "spot2ytm" / "creds"
 
-        # Spotify
-        self.SPOTIFY_CLIENT_ID = self._get_env("SPOTIFY_CLIENT_ID")
-        self.SPOTIFY_CLIENT_SECRET = self._get_env("SPOTIFY_CLIENT_SECRET")
+        # Spotify (SPOTIFY_CLIENT_ID / SPOTIFY_CLIENT_SECRET are properties below)
         self.SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
         self.SPOTIFY_API_BASE = "https://api.spotify.com/v1"
+        self.SPOTIFY_FETCH_WORKERS = self._get_int("SPOTIFY_FETCH_WORKERS", default=1)
+
+        # HTTP transport (Spotify API + token endpoint)
+        self.HTTP_POOL_SIZE = self._get_int("HTTP_POOL_SIZE", default=10)
+        self.HTTP_MAX_RETRIES = self._get_int("HTTP_MAX_RETRIES", default=5)
+        self.HTTP_BACKOFF_FACTOR = self._get_float("HTTP_BACKOFF_FACTOR", default=0.5)
+        self.HTTP_TIMEOUT = self._get_float("HTTP_TIMEOUT", default=15.0)
 
         # Auth / Token management
         self.SPOTIFY_TOKEN_FILE = self.CREDS_DIR / "spotify_token.json"
-        self.SPOTIFY_TOKEN_EXPIRY_BUFFER = 30  # seconds
+        # Seconds before expiry at which the token is refreshed in the background
+        self.SPOTIFY_TOKEN_EXPIRY_BUFFER = self._get_int("SPOTIFY_TOKEN_EXPIRY_BUFFER", default=30)
         self.YTMUSIC_AUTH_FILE = self.CREDS_DIR / "ytm_browser.json"
 
         self.GYM_PL_ID = "1R7k82T5vm2pOBcmVPVVbT"
@@ -53,13 +65,93 @@ class Settings:
         # App behavior
         self.DEBUG = self._get_bool("DEBUG", default=False)
 
+        # YT Music matching
+        self.YTM_SEARCH_WORKERS = self._get_int("YTM_SEARCH_WORKERS", default=1)
+
+        self.YTM_LIBRARY_MATCHING = self._get_bool("YTM_LIBRARY_MATCHING", default=False)
+        self.YTM_ALBUM_BATCH_MIN_TRACKS = self._get_int("YTM_ALBUM_BATCH_MIN_TRACKS", default=0)
+
+        # Ranking of search results
+        self.YTM_MATCH_SCORING = self._get_bool("YTM_MATCH_SCORING", default=True)
+        self.YTM_SEARCH_CANDIDATES = self._get_int("YTM_SEARCH_CANDIDATES", default=5)
+        self.YTM_MATCH_THRESHOLD = self._get_float("YTM_MATCH_THRESHOLD", default=0.5)
+        self.REVIEW_FILE = self.DATA_DIR / "review.jsonl"
+
+        # YT Music rate limiting (requests/second, adapted AIMD-style between min and max)
+        self.YTM_SEARCH_RATE = self._get_float("YTM_SEARCH_RATE", default=5.0)
+        self.YTM_SEARCH_MAX_RATE = self._get_float("YTM_SEARCH_MAX_RATE", default=20.0)
+        self.YTM_WRITE_RATE = self._get_float("YTM_WRITE_RATE", default=1.0)
+        self.YTM_WRITE_MAX_RATE = self._get_float("YTM_WRITE_MAX_RATE", default=5.0)
+        self.YTM_MIN_RATE = self._get_float("YTM_MIN_RATE", default=0.2)
+        self.YTM_THROTTLE_RETRIES = self._get_int("YTM_THROTTLE_RETRIES", default=3)
+
+        # Seconds before the in-memory library playlist index is rebuilt
+        self.YTM_PLAYLIST_INDEX_TTL = self._get_int("YTM_PLAYLIST_INDEX_TTL", default=600)
+
+        # YT Music playlist insertion
+        self.YTM_INSERT_CHUNK_SIZE = self._get_int("YTM_INSERT_CHUNK_SIZE", default=50)
+        self.YTM_INSERT_IN_FLIGHT = self._get_int("YTM_INSERT_IN_FLIGHT", default=1)
+        self.YTM_INSERT_RETRIES = self._get_int("YTM_INSERT_RETRIES", default=1)
+
+        # Match cache (Spotify track -> YT Music videoId)
+        self.MATCH_CACHE_ENABLED = self._get_bool("MATCH_CACHE_ENABLED", default=True)
+        self.MATCH_CACHE_FILE = self.DATA_DIR / "match_cache.sqlite3"
+        self.MATCH_CACHE_TTL_DAYS = self._get_int("MATCH_CACHE_TTL_DAYS", default=30)
+        self.MATCH_CACHE_MAX_ENTRIES = self._get_int("MATCH_CACHE_MAX_ENTRIES", default=100000)
+
+        # Spotify HTTP response cache (ETag / If-None-Match)
+        self.HTTP_CACHE_ENABLED = self._get_bool("HTTP_CACHE_ENABLED", default=True)
+        self.HTTP_CACHE_FILE = self.DATA_DIR / "http_cache.sqlite3"
+        self.HTTP_CACHE_MAX_MB = self._get_int("HTTP_CACHE_MAX_MB", default=64)
+
+        # Migration journal (resume after crash/restart)
+        self.MIGRATION_JOURNAL_ENABLED = self._get_bool("MIGRATION_JOURNAL_ENABLED", default=True)
+        self.MIGRATION_JOURNAL_FILE = self.DATA_DIR / "migrations.sqlite3"
+        self.MIGRATION_INSERT_BATCH_SIZE = self._get_int("MIGRATION_INSERT_BATCH_SIZE", default=100)
+
+        # Incremental sync
+        self.SYNC_STATE_FILE = self.DATA_DIR / "sync_state.sqlite3"
+        self.SYNC_REMOVE_DELETED = self._get_bool("SYNC_REMOVE_DELETED", default=False)
+
+        # Streaming fetch -> match -> insert pipeline
+        self.MIGRATION_STREAMING = self._get_bool("MIGRATION_STREAMING", default=False)
+        self.MIGRATION_STREAM_PREFETCH_PAGES = self._get_int("MIGRATION_STREAM_PREFETCH_PAGES", default=2)
+
+        # Exported playlist snapshots (export once, match later without Spotify)
+        self.SNAPSHOT_DIR = self.DATA_DIR / "snapshots"
+
+        # Worker processes for runs over several playlists (1 = in-process)
+        self.MIGRATION_PROCESSES = self._get_int("MIGRATION_PROCESSES", default=1)
+
+        # Metrics export (JSON or Prometheus text format)
+        self.METRICS_FORMAT = self._get_env("METRICS_FORMAT", default="json").lower()
+        self.METRICS_FILE = self.DATA_DIR / ("metrics.prom" if self.METRICS_FORMAT == "prometheus" else "metrics.json")
+        self.METRICS_INTERVAL = self._get_int("METRICS_INTERVAL", default=0)
+
+        # Profiling (cProfile + tracemalloc per stage, reports under logs/profiles/)
+        self.PROFILING = self._get_bool("PROFILING", default=False)
+        self.PROFILING_DIR = self.BASE_DIR / "logs" / "profiles"
+        self.PROFILING_TOP = self._get_int("PROFILING_TOP", default=25)
+
         self.DEFAULT_ENCODING = "utf-8"
 
 
+    @cached_property
+    def SPOTIFY_CLIENT_ID(self) -> str:
+        """Spotify app client ID, required once a Spotify token is requested."""
+        return self._get_env("SPOTIFY_CLIENT_ID")
+
+    @cached_property
+    def SPOTIFY_CLIENT_SECRET(self) -> str:
+        """Spotify app client secret, required once a Spotify token is requested."""
+        return self._get_env("SPOTIFY_CLIENT_SECRET")
+
     # ---------- internal helpers ----------
 
     def _load_env(self):
         """Load environment variables from .env file."""
+        from dotenv import load_dotenv
+
         load_dotenv()
 
     def _get_env(self, key: str, default=None) -> str:
@@ -87,6 +179,71 @@ class Settings:
         """
         return os.getenv(key, str(default)).lower() in ("1", "true", "yes")
 
+    def _get_int(self, key: str, default: int = 0) -> int:
+        """Retrieve an environment variable as an integer value.
+        \n        Args:
+            key: The environment variable name to retrieve.
+            default: Default integer value if key is not found.
+            \n        Returns:
+            int: The parsed integer value.
+            \n        Raises:
+            RuntimeError: If the value is not a valid integer.
+        """
+        value = os.getenv(key)
+        if value is None or value == "":
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise RuntimeError(f"Invalid integer for env var {key}: {value!r}")
+
+    def _get_float(self, key: str, default: float = 0.0) -> float:
+        """Retrieve an environment variable as a float value.
+        \n        Args:
+            key: The environment variable name to retrieve.
+            default: Default float value if key is not found.
+            \n        Returns:
+            float: The parsed float value.
+            \n        Raises:
+            RuntimeError: If the value is not a valid number.
+        """
+        value = os.getenv(key)
+        if value is None or value == "":
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            raise RuntimeError(f"Invalid number for env var {key}: {value!r}")
+
+
+class LazySettings:
+    """Proxy that builds the Settings object on first attribute access.
+
+    Importing this module stays cheap; the .env file is loaded and the environment
+    read once, by whichever attribute access comes first (thread-safe).
+    """
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_settings", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _load(self) -> Settings:
+        """Return the Settings object, creating it on the first call."""
+        loaded = self._settings
+        if loaded is None:
+            with self._lock:
+                loaded = self._settings
+                if loaded is None:
+                    loaded = Settings()
+                    object.__setattr__(self, "_settings", loaded)
+        return loaded
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._load(), name, value)
+
 
-# Singleton-style settings object
-settings = Settings()
+# Singleton-style settings object, loaded on first use
+settings = LazySettings()
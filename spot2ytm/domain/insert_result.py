@@ -0,0 +1,37 @@
+"""Domain model for playlist insertion outcomes.
+
+This module defines the InsertResult data class reporting which video IDs were added
+to a YouTube Music playlist, which were rejected and which were not added because
+the request itself failed.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class InsertResult:
+    """Outcome of adding songs to a YouTube Music playlist.
+    
+    Evaluates to True only when every requested video ID was added.
+    
+    Attributes:
+        playlist_id: The target playlist ID.
+        added: Video IDs that landed in the playlist, in request order.
+        failed: Video IDs YT Music rejected on their own (retrying will not help).
+        errored: Video IDs not added because of a network, server or throttling error;
+                 they should be retried later.
+    """
+
+    playlist_id: str
+    added: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    errored: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every requested video ID was added."""
+        return not self.failed and not self.errored
+
+    def __bool__(self) -> bool:
+        return self.ok
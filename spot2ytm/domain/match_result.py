@@ -0,0 +1,41 @@
+"""Domain model for track match outcomes.
+
+This module defines the MatchResult data class describing how a single Spotify track
+was resolved (or failed to resolve) to a YouTube Music video.
+"""
+
+from dataclasses import dataclass
+from spot2ytm.domain.track import Track
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """Outcome of matching one track against YouTube Music.
+    
+    Attributes:
+        position: Index of the track in the source playlist.
+        track: The Spotify track that was matched.
+        video_id: The matched YouTube Music video ID, empty if no match was found.
+        error: Error description if the search failed, empty otherwise.
+        source: Where the video ID came from ("search", "cache", "library" or "album").
+        confidence: Score of the chosen search result, when results were ranked.
+        candidate: Best search result of a low-confidence match, left for manual review.
+    """
+
+    position: int
+    track: Track
+    video_id: str = ""
+    error: str = ""
+    source: str = "search"
+    confidence: float | None = None
+    candidate: str = ""
+
+    @property
+    def matched(self) -> bool:
+        """Whether the track was resolved to a video ID."""
+        return bool(self.video_id)
+
+    @property
+    def needs_review(self) -> bool:
+        """Whether a candidate was found but scored below the confidence threshold."""
+        return not self.video_id and bool(self.candidate)
@@ -0,0 +1,39 @@
+"""Text normalization helpers for track metadata.
+
+This module provides functions to normalize titles, albums and artist names so that
+the same song spelled slightly differently (case, accents, punctuation) produces the
+same lookup key.
+"""
+
+import re
+import unicodedata
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize a piece of track metadata for comparison.
+    \n    Strips accents, case-folds, and collapses punctuation and whitespace runs
+    into single spaces.
+    \n    Args:
+        text: The raw text to normalize.
+        \n    Returns:
+        str: The normalized text.
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", stripped.casefold()).strip()
+
+
+def track_key(title: str, album: str = "", artist: str = "") -> str:
+    """Build a normalized title/album/artist lookup key.
+    \n    Args:
+        title: The track title.
+        album: The album name.
+        artist: The artist name(s).
+        \n    Returns:
+        str: A key of the form ``title|album|artist`` with each part normalized.
+    """
+    return "|".join((normalize_text(title), normalize_text(album), normalize_text(artist)))
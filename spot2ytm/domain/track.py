@@ -3,20 +3,57 @@
 This module defines the Track data class representing a music track with essential metadata.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Tuple
+from spot2ytm.domain.normalization import track_key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Track:
     """Represents a music track with immutable metadata.
     
     This is a frozen dataclass that represents a track from a music streaming service.
-    The immutable nature ensures track data cannot be accidentally modified.
+    The immutable nature ensures track data cannot be accidentally modified. It uses
+    ``__slots__`` so each instance carries no per-object ``__dict__``; see TrackBatch
+    for holding many tracks at once.
     
     Attributes:
         title: The name/title of the track.
         album: The album name the track belongs to.
+        id: The Spotify track ID (empty for local files).
+        isrc: The International Standard Recording Code, if Spotify knows it.
+        artists: The artist names, main artist first.
+        duration_ms: The track duration in milliseconds (0 if unknown).
     """
     
     title: str
-    album: str
\ No newline at end of file
+    album: str
+    id: str = ""
+    isrc: str = ""
+    artists: Tuple[str, ...] = ()
+    duration_ms: int = 0
+
+    @property
+    def artist(self) -> str:
+        """The main artist name, or empty string if unknown."""
+        return self.artists[0] if self.artists else ""
+
+    @property
+    def key(self) -> str:
+        """Normalized title/album/artist key identifying this track across runs."""
+        return track_key(self.title, self.album, self.artist)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Track":
+        """Build a Track from a dict (e.g. a JSON round trip of ``asdict``).
+        \n        Unknown keys are ignored and list values are converted back to tuples.
+        \n        Args:
+            data: Mapping of field names to values.
+            \n        Returns:
+            Track: The reconstructed track.
+        """
+        names = {field.name for field in fields(cls)}
+        values = {name: value for name, value in data.items() if name in names}
+        if 'artists' in values:
+            values['artists'] = tuple(values['artists'] or ())
+        return cls(**values)
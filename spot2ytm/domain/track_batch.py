@@ -0,0 +1,131 @@
+"""Columnar container for large numbers of tracks.
+
+This module defines TrackBatch, a list-compatible sequence of tracks that stores each
+field in its own column instead of keeping one object per track. Album and artist
+strings are interned, so the thousands of tracks sharing an album or artist across a
+library migration share a single copy of each name.
+"""
+
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Tuple, overload
+from spot2ytm.domain.track import Track
+
+
+class TrackBatch(Sequence):
+    """Ordered, columnar batch of tracks.
+
+    Behaves like a read-mostly ``List[Track]``: it supports ``len``, indexing,
+    slicing (which returns a TrackBatch), iteration and ``append``/``extend``.
+    Track objects are only materialized when an item is accessed.
+    """
+
+    __slots__ = ("titles", "albums", "ids", "isrcs", "artists", "durations", "_artist_pool")
+
+    def __init__(self, tracks: Iterable[Track] = ()) -> None:
+        """Initialize the batch.
+        \n        Args:
+            tracks: Tracks to add, in order.
+        """
+        self.titles: List[str] = []
+        self.albums: List[str] = []
+        self.ids: List[str] = []
+        self.isrcs: List[str] = []
+        self.artists: List[Tuple[str, ...]] = []
+        self.durations = array("l")
+        self._artist_pool: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self.extend(tracks)
+
+    def append(self, track: Track) -> None:
+        """Add a track at the end of the batch.
+        \n        Args:
+            track: The track to add.
+        """
+        artists = track.artists
+        if artists:
+            artists = tuple(sys.intern(artist) for artist in artists)
+            artists = self._artist_pool.setdefault(artists, artists)
+        self.titles.append(track.title)
+        self.albums.append(sys.intern(track.album))
+        self.ids.append(track.id)
+        self.isrcs.append(track.isrc)
+        self.artists.append(artists)
+        self.durations.append(track.duration_ms)
+
+    def extend(self, tracks: Iterable[Track]) -> None:
+        """Add tracks at the end of the batch.
+        \n        Args:
+            tracks: The tracks to add, in order.
+        """
+        if isinstance(tracks, TrackBatch):
+            self.titles.extend(tracks.titles)
+            self.albums.extend(tracks.albums)
+            self.ids.extend(tracks.ids)
+            self.isrcs.extend(tracks.isrcs)
+            self.artists.extend(tracks.artists)
+            self.durations.extend(tracks.durations)
+            return
+        for track in tracks:
+            self.append(track)
+
+    def keys(self) -> List[str]:
+        """Return the key of every track, in order.
+        \n        Returns:
+            List[str]: One Track.key per track.
+        """
+        return [track.key for track in self]
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @overload
+    def __getitem__(self, index: int) -> Track: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TrackBatch": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            batch = TrackBatch()
+            batch.titles = self.titles[index]
+            batch.albums = self.albums[index]
+            batch.ids = self.ids[index]
+            batch.isrcs = self.isrcs[index]
+            batch.artists = self.artists[index]
+            batch.durations = self.durations[index]
+            return batch
+        return Track(
+            self.titles[index],
+            self.albums[index],
+            self.ids[index],
+            self.isrcs[index],
+            self.artists[index],
+            self.durations[index],
+        )
+
+    def __iter__(self) -> Iterator[Track]:
+        for row in zip(self.titles, self.albums, self.ids, self.isrcs, self.artists, self.durations):
+            yield Track(*row)
+
+    def __add__(self, other: Iterable[Track]) -> "TrackBatch":
+        batch = self[:]
+        batch.extend(other)
+        return batch
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TrackBatch):
+            return (
+                self.titles == other.titles
+                and self.albums == other.albums
+                and self.ids == other.ids
+                and self.isrcs == other.isrcs
+                and self.artists == other.artists
+                and self.durations == other.durations
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TrackBatch({len(self)} tracks)"
@@ -0,0 +1,108 @@
+"""YouTube Music library index for local-first matching.
+
+This module builds an in-memory index of the songs already in the user's YouTube Music
+library (library songs and liked songs), keyed on normalized title/album/artist, so
+TrackMatcher can resolve tracks the user already has without a live search.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Tuple
+from spot2ytm.clients.ytmusic_client import YTMusicClient
+from spot2ytm.domain.normalization import normalize_text, track_key
+from spot2ytm.domain.track import Track
+
+logger = logging.getLogger(__name__)
+
+
+class LibraryIndex:
+    """Normalized lookup index over the user's YouTube Music library.
+
+    The library is pulled in bulk once, on the first lookup. A track is looked up by
+    its title/album/artist key first, then its title/album key and, failing that, by
+    title and main artist (ignoring the album) when exactly one library song matches.
+    If pulling the library fails, lookups find nothing for RETRY_INTERVAL seconds and
+    the next lookup after that tries again.
+    """
+
+    # Seconds to wait before pulling the library again after a failed attempt.
+    RETRY_INTERVAL = 60
+
+    def __init__(self, ytmusic: YTMusicClient) -> None:
+        """Initialize the index. Nothing is fetched until the first lookup.
+        \n        Args:
+            ytmusic: YTMusicClient used to pull the library.
+        """
+        self.ytmusic_client = ytmusic
+        self._by_key: Dict[str, str] | None = None
+        self._by_title_artist: Dict[Tuple[str, str], str] = {}
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build(songs: Iterable[dict]) -> Tuple[Dict[str, str], Dict[Tuple[str, str], str]]:
+        """Index library song objects.
+        \n        Args:
+            songs: Library song objects as returned by YTMusicClient.get_library_tracks.
+            \n        Returns:
+            Tuple[Dict[str, str], Dict[Tuple[str, str], str]]: Track key -> video ID, and
+            (title, artist) -> video ID for the pairs only one library song carries.
+        """
+        by_key: Dict[str, str] = {}
+        by_title_artist: Dict[Tuple[str, str], str] = {}
+        ambiguous = set()
+        for song in songs:
+            video_id = song.get('videoId')
+            title = song.get('title') or ""
+            if not video_id or not title:
+                continue
+            album = (song.get('album') or {}).get('name', "")
+            by_key.setdefault(track_key(title, album), video_id)
+            for artist in song.get('artists') or []:
+                name = artist.get('name', "")
+                by_key.setdefault(track_key(title, album, name), video_id)
+                if not name:
+                    continue
+                pair = (normalize_text(title), normalize_text(name))
+                if by_title_artist.setdefault(pair, video_id) != video_id:
+                    ambiguous.add(pair)
+        for pair in ambiguous:
+            del by_title_artist[pair]
+        return by_key, by_title_artist
+
+    def load(self) -> None:
+        """Pull the library and build the index, if not done yet.
+        \n        Raises:
+            Exception: Whatever pulling the library raised; the index stays unloaded so a
+                       later call (after RETRY_INTERVAL) can try again.
+        """
+        with self._lock:
+            if self._by_key is not None or time.monotonic() < self._retry_at:
+                return
+            try:
+                songs = self.ytmusic_client.get_library_tracks()
+                by_key, by_title_artist = self._build(songs)
+            except Exception:
+                self._retry_at = time.monotonic() + self.RETRY_INTERVAL
+                raise
+            self._by_key, self._by_title_artist = by_key, by_title_artist
+            logger.info("Indexed %d YTMusic library songs for local matching", len(songs))
+
+    def lookup(self, track: Track) -> str | None:
+        """Find a track in the user's library.
+        \n        Args:
+            track: The Spotify track to look up.
+            \n        Returns:
+            str | None: The video ID of the library song, or None if not in the library.
+        """
+        self.load()
+        by_key = self._by_key
+        if by_key is None:
+            return None
+        video_id = by_key.get(track.key)
+        if not video_id and track.artists:
+            video_id = by_key.get(track_key(track.title, track.album))
+        if video_id or not track.artist:
+            return video_id
+        return self._by_title_artist.get((normalize_text(track.title), normalize_text(track.artist)))
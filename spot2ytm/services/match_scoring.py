@@ -0,0 +1,146 @@
+"""Ranking of YouTube Music search results against a Spotify track.
+
+This module scores the top search results returned by a single YT Music search by
+title, artist, album and duration similarity, so the best candidate is picked instead
+of blindly taking the first result. Track-side normalization is done once per track.
+"""
+
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import List, Tuple
+from spot2ytm.domain.normalization import normalize_text
+from spot2ytm.domain.track import Track
+
+# "(feat. X)", "[Remastered]", " - 2011 Remaster" and similar decorations.
+_DECORATIONS = re.compile(r"\([^)]*\)|\[[^\]]*\]|\s-\s.*$")
+
+
+def core_title(title: str) -> str:
+    """Normalize a title with bracketed and dash-suffixed decorations removed.
+    \n    Args:
+        title: The raw song title.
+        \n    Returns:
+        str: The normalized core title (falls back to the full title if nothing is left).
+    """
+    return normalize_text(_DECORATIONS.sub(" ", title or "")) or normalize_text(title)
+
+
+def similarity(left: str, right: str) -> float:
+    """Similarity of two normalized strings in [0, 1].
+    \n    Args:
+        left: First normalized string.
+        right: Second normalized string.
+        \n    Returns:
+        float: 1.0 for equal strings, 0.0 for nothing in common.
+    """
+    if not left or not right:
+        return 0.0
+    if left == right:
+        return 1.0
+    return SequenceMatcher(None, left, right).ratio()
+
+
+@dataclass(frozen=True)
+class TrackProfile:
+    """Normalized, precomputed view of a track used for scoring.
+
+    Attributes:
+        title: Normalized core title.
+        album: Normalized album name.
+        artists: Normalized artist names.
+        duration: Duration in seconds, 0 if unknown.
+    """
+
+    title: str
+    album: str
+    artists: Tuple[str, ...] = ()
+    duration: int = 0
+
+    @classmethod
+    def from_track(cls, track: Track) -> "TrackProfile":
+        """Build the profile of a Spotify track.
+        \n        Args:
+            track: The track to profile.
+            \n        Returns:
+            TrackProfile: The normalized profile.
+        """
+        return cls(
+            title=core_title(track.title),
+            album=normalize_text(track.album),
+            artists=tuple(normalize_text(artist) for artist in track.artists),
+            duration=round(track.duration_ms / 1000),
+        )
+
+    @classmethod
+    def from_result(cls, result: dict) -> "TrackProfile":
+        """Build the profile of a YT Music song search result.
+        \n        Args:
+            result: A search result with 'title', 'artists', 'album' and 'duration_seconds'.
+            \n        Returns:
+            TrackProfile: The normalized profile.
+        """
+        return cls(
+            title=core_title(result.get('title', "")),
+            album=normalize_text((result.get('album') or {}).get('name', "")),
+            artists=tuple(normalize_text(artist.get('name', "")) for artist in result.get('artists') or []),
+            duration=int(result.get('duration_seconds') or 0),
+        )
+
+
+class MatchScorer:
+    """Scores YT Music search results against a Spotify track.
+
+    The score is a weighted average of title, artist, album and duration similarity
+    in [0, 1]. Components the Spotify track has no data for are left out and the
+    remaining weights renormalized.
+    """
+
+    WEIGHTS = {"title": 0.55, "artist": 0.25, "album": 0.1, "duration": 0.1}
+
+    def __init__(self, threshold: float) -> None:
+        """Initialize the scorer.
+        \n        Args:
+            threshold: Minimum score for a candidate to be accepted as a match.
+        """
+        self.threshold = threshold
+
+    def score(self, track: TrackProfile, candidate: TrackProfile) -> float:
+        """Score one candidate against a track.
+        \n        Args:
+            track: Profile of the Spotify track.
+            candidate: Profile of the YT Music search result.
+            \n        Returns:
+            float: The match score in [0, 1].
+        """
+        components = {"title": similarity(track.title, candidate.title)}
+        if track.artists:
+            components["artist"] = max(
+                (similarity(wanted, found) for wanted in track.artists for found in candidate.artists),
+                default=0.0,
+            )
+        if track.album:
+            components["album"] = similarity(track.album, candidate.album)
+        if track.duration:
+            difference = abs(track.duration - candidate.duration) if candidate.duration else 30
+            components["duration"] = max(0.0, 1.0 - max(0, difference - 3) / 27)
+
+        total_weight = sum(self.WEIGHTS[name] for name in components)
+        return sum(self.WEIGHTS[name] * value for name, value in components.items()) / total_weight
+
+    def rank(self, track: Track, results: List[dict]) -> List[Tuple[float, dict]]:
+        """Rank search results for a track, best first.
+        \n        Args:
+            track: The Spotify track.
+            results: YT Music song search results.
+            \n        Returns:
+            List[Tuple[float, dict]]: (score, result) pairs sorted by descending score.
+        """
+        profile = TrackProfile.from_track(track)
+        scored = [
+            (self.score(profile, TrackProfile.from_result(result)), result)
+            for result in results
+            if result.get('videoId')
+        ]
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return scored
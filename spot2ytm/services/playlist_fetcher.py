@@ -3,9 +3,10 @@
 This module provides functionality to fetch songs from Spotify playlists.
 """
 
-from typing import List
+from typing import Iterator
 from spot2ytm.clients.spotfiy_client import SpotifyClient
-from spot2ytm.domain.track import Track
+from spot2ytm.config.settings import settings
+from spot2ytm.domain.track_batch import TrackBatch
 
 
 class PlaylistFetcher:
@@ -22,11 +23,30 @@ class PlaylistFetcher:
         """
         self.spotify_client = spotify_client
 
-    def fetch(self, playlist_id: str) -> List[Track]:
+    def fetch(self, playlist_id: str, workers: int | None = None) -> TrackBatch:
         """Fetch all songs from a Spotify playlist.
         \n        Args:
             playlist_id: The ID of the Spotify playlist to fetch songs from.
+            workers: Number of pages fetched in parallel. Defaults to settings.SPOTIFY_FETCH_WORKERS;
+                     1 follows the pagination links one page after another.
             \n        Returns:
-            List[Track]: List of Track objects from the playlist.
+            TrackBatch: The tracks of the playlist, in order.
         """
-        return self.spotify_client.get_playlist_songs(playlist_id)
\ No newline at end of file
+        if workers is None:
+            workers = settings.SPOTIFY_FETCH_WORKERS
+        return self.spotify_client.get_playlist_songs(playlist_id, max_workers=workers)
+
+    def iter_pages(self, playlist_id: str, workers: int | None = None) -> Iterator[TrackBatch]:
+        """Stream songs from a Spotify playlist page by page.
+        \n        Args:
+            playlist_id: The ID of the Spotify playlist to fetch songs from.
+            workers: Number of pages fetched in parallel. Defaults to settings.SPOTIFY_FETCH_WORKERS.
+            \n        Yields:
+            TrackBatch: One page of tracks, in playlist order.
+        """
+        if workers is None:
+            workers = settings.SPOTIFY_FETCH_WORKERS
+        if workers > 1:
+            yield from self.spotify_client.iter_playlist_pages_parallel(playlist_id, workers)
+        else:
+            yield from self.spotify_client.iter_playlist_pages(playlist_id)
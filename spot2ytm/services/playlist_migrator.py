@@ -5,13 +5,40 @@ to YouTube Music, including fetching songs, matching them, and creating playlist
 """
 
 import logging
-from spot2ytm.clients.spotfiy_client import SpotifyClient
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+from spot2ytm.clients.spotfiy_client import USER_TOKEN_REQUIRED, SpotifyClient, is_unauthorized
 from spot2ytm.clients.ytmusic_client import YTMusicClient
+from spot2ytm.config.settings import settings
+from spot2ytm.domain.insert_result import InsertResult
+from spot2ytm.domain.match_result import MatchResult
+from spot2ytm.domain.normalization import normalize_text
+from spot2ytm.domain.track import Track
+from spot2ytm.domain.track_batch import TrackBatch
 from spot2ytm.services.playlist_fetcher import PlaylistFetcher
 from spot2ytm.services.track_matcher import TrackMatcher
+from spot2ytm.storage.migration_journal import MigrationJournal, MigrationState
+from spot2ytm.storage.playlist_snapshot import PlaylistSnapshot, SnapshotHeader
+from spot2ytm.storage.review_list import ReviewList
+from spot2ytm.storage.sync_state import SyncStateStore
+from spot2ytm.telemetry.metrics import metrics
+from spot2ytm.telemetry.profiling import profiler
 
 logger = logging.getLogger(__name__)
 
+MIGRATIONS_COMPLETED = metrics.counter("migrations_completed_total", "Playlist migrations that finished")
+MIGRATIONS_FAILED = metrics.counter("migrations_failed_total", "Playlist migrations that stopped before finishing")
+MIGRATION_SECONDS = metrics.histogram("migration_seconds", "Duration of one playlist migration")
+FETCH_STAGE_SECONDS = metrics.histogram("migration_fetch_seconds", "Duration of the fetch stage of a migration")
+MATCH_STAGE_SECONDS = metrics.histogram("migration_match_seconds", "Duration of the match stage of a migration")
+INSERT_STAGE_SECONDS = metrics.histogram("migration_insert_seconds", "Duration of the insert stage of a migration")
+REVIEW_TRACKS = metrics.counter("review_tracks_total", "Low-confidence matches written to the review list")
+TRACKS_EXPORTED = metrics.counter("snapshot_tracks_exported_total", "Tracks written to playlist snapshots")
+
 
 class PlaylistMigrator:
     """Orchestrates the migration of playlists from Spotify to YouTube Music.
@@ -21,34 +48,425 @@ class PlaylistMigrator:
     and populating them with the matched songs.
     """
 
-    def __init__(self, fetcher: PlaylistFetcher, matcher: TrackMatcher, ytmusic_client: YTMusicClient, spotify_client: SpotifyClient) -> None:
+    def __init__(
+        self,
+        fetcher: PlaylistFetcher,
+        matcher: TrackMatcher,
+        ytmusic_client: YTMusicClient,
+        spotify_client: SpotifyClient,
+        journal: MigrationJournal | None = None,
+        sync_store: SyncStateStore | None = None,
+        review_list: ReviewList | None = None,
+    ) -> None:
         """Initialize the playlist migrator with required components.
         \n        Args:
             fetcher: PlaylistFetcher instance for fetching Spotify playlists.
             matcher: TrackMatcher instance for finding YouTube Music equivalents.
             ytmusic_client: YTMusicClient instance for YouTube Music operations.
             spotify_client: SpotifyClient instance for Spotify operations.
+            journal: Optional MigrationJournal used to resume interrupted migrations.
+            sync_store: Optional SyncStateStore enabling incremental sync().
+            review_list: Optional ReviewList collecting low-confidence matches.
         """
         self.spotify_client = spotify_client
         self.ytmusic_client = ytmusic_client
         self.fetcher = fetcher
         self.matcher = matcher
+        self.journal = journal
+        self.sync_store = sync_store
+        self.review_list = review_list
     
-    def migrate(self, spotify_playlist_id: str, ytmusic_playlist_name: str = "") -> str | None:
+    def migrate(self, spotify_playlist_id: str, ytmusic_playlist_name: str = "", streaming: bool | None = None) -> str | None:
         """Migrate a Spotify playlist to YouTube Music.
         \n        Fetches all songs from a Spotify playlist, searches for equivalent songs in
         YouTube Music, creates a new YouTube Music playlist with the same metadata,
         and populates it with the matched songs.
+        \n        When a MigrationJournal is configured, every step is journaled. Calling
+        migrate again for the same Spotify playlist after a crash reuses the journaled
+        tracks and matches and only inserts songs past the last committed watermark.
+        \n        In streaming mode the fetch, match and insert stages overlap: each Spotify
+        page is matched as soon as it arrives and matched songs are added in bounded
+        batches, so memory use does not grow with the playlist size.
         \n        Args:
             spotify_playlist_id: The ID of the Spotify playlist to migrate.
             ytmusic_playlist_name: Optional custom name for the YouTube Music playlist.
                                    If not provided, uses the original Spotify playlist name.
+            streaming: Run the streaming pipeline. Defaults to settings.MIGRATION_STREAMING.
+            \n        Returns:
+            str | None: The YouTube Music playlist ID if migration succeeded, None otherwise.
+        """
+        return self._migrate_one(spotify_playlist_id, ytmusic_playlist_name, streaming)
+
+    def migrate_many(self, spotify_playlist_ids: List[str]) -> Dict[str, str | None]:
+        """Migrate several Spotify playlists, searching each unique track only once.
+        \n        Fetches every playlist (settings.SPOTIFY_FETCH_WORKERS playlists at a time),
+        collects the unique tracks across all of them, resolves those once through
+        the matcher (bounded by its worker count) and then fills each target YT Music
+        playlist from the shared results.
+        \n        Args:
+            spotify_playlist_ids: IDs of the Spotify playlists to migrate.
+            \n        Returns:
+            Dict[str, str | None]: Spotify playlist ID -> YT Music playlist ID (None on failure).
+        """
+        playlist_ids = list(dict.fromkeys(spotify_playlist_ids))
+        fetched = self._fetch_many(playlist_ids)
+
+        unique: Dict[str, Track] = {}
+        for songs in fetched.values():
+            for song in songs:
+                unique.setdefault(song.key, song)
+        total = sum(len(songs) for songs in fetched.values())
+        logger.info("Fetched %d songs (%d unique) from %d playlists", total, len(unique), len(fetched))
+
+        matched = self.matcher.match_all(TrackBatch(unique.values()))
+        self._review(None, matched)
+        known = {result.track.key: result.video_id for result in matched if not result.error}
+        logger.info("Resolved %d of %d unique songs", len(known), len(unique))
+
+        results: Dict[str, str | None] = {}
+        for playlist_id in playlist_ids:
+            if playlist_id not in fetched:
+                results[playlist_id] = None
+                continue
+            results[playlist_id] = self._migrate_one(playlist_id, streaming=False, songs=fetched[playlist_id], known=known)
+        return results
+
+    def migrate_library(self, sync: bool = False) -> Dict[str, str | None]:
+        """Migrate (or sync) every playlist in the user's Spotify library.
+        \n        Discovers all library playlists with parallel pagination and feeds them to
+        migrate/sync one after another, largest first, so the longest jobs start
+        while throughput is freshest and the tail is made of short ones.
+        \n        Args:
+            sync: Use incremental sync() instead of migrate() for each playlist.
+            \n        Returns:
+            Dict[str, str | None]: Spotify playlist ID -> YT Music playlist ID (None on failure).
+            Empty if the library could not be listed.
+        """
+        playlists = self._library_playlists()
+        logger.info("Found %d playlists in the spotify library", len(playlists))
+
+        results: Dict[str, str | None] = {}
+        for index, playlist in enumerate(playlists, start=1):
+            playlist_id = playlist['id']
+            logger.info(
+                "Library playlist %d/%d: %s (%d songs)",
+                index,
+                len(playlists),
+                playlist.get('name', playlist_id),
+                (playlist.get('tracks') or {}).get('total', 0)
+            )
+            try:
+                results[playlist_id] = self.sync(playlist_id) if sync else self.migrate(playlist_id)
+            except Exception:
+                logger.exception("Migrating spotify playlist %s failed, continuing with the next one", playlist_id)
+                results[playlist_id] = None
+        return results
+
+    def _library_playlists(self) -> List[dict]:
+        """List the user's Spotify library playlists, largest first.
+        \n        Returns:
+            List[dict]: The library playlists, or an empty list (after logging why) if
+            Spotify refused the token, as it does for the client-credentials token.
+        """
+        try:
+            return self.spotify_client.get_all_my_playlists(max_workers=settings.SPOTIFY_FETCH_WORKERS)
+        except OSError as e:
+            if not is_unauthorized(e):
+                raise
+            logger.error("%s (%s)", USER_TOKEN_REQUIRED, e)
+            return []
+
+    def export(self, spotify_playlist_id: str) -> Path:
+        """Export a Spotify playlist to a snapshot file, without touching YouTube Music.
+        \n        The playlist is streamed page by page into
+        ``settings.SNAPSHOT_DIR/<playlist ID>.jsonl.gz``, replacing an older snapshot.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist to export.
+            \n        Returns:
+            Path: The written snapshot file.
+        """
+        name, description = self.spotify_client.get_playlist_name_desc(spotify_playlist_id)
+        header = SnapshotHeader(
+            playlist_id=spotify_playlist_id,
+            name=name,
+            description=description or "",
+            snapshot_id=self.spotify_client.get_playlist_snapshot_id(spotify_playlist_id),
+        )
+        snapshot = PlaylistSnapshot.for_playlist(spotify_playlist_id)
+        with FETCH_STAGE_SECONDS.time(), profiler.stage("export", spotify_playlist_id):
+            count = snapshot.write(header, self.fetcher.iter_pages(spotify_playlist_id))
+        TRACKS_EXPORTED.inc(count)
+        logger.info("Exported %d songs of spotify playlist %s to %s", count, spotify_playlist_id, snapshot.path)
+        return snapshot.path
+
+    def export_library(self) -> Dict[str, Path | None]:
+        """Export every playlist in the user's Spotify library to snapshot files.
+        \n        Returns:
+            Dict[str, Path | None]: Spotify playlist ID -> snapshot file (None on failure).
+            Empty if the library could not be listed.
+        """
+        playlists = self._library_playlists()
+        logger.info("Exporting %d playlists from the spotify library", len(playlists))
+        results: Dict[str, Path | None] = {}
+        for playlist in playlists:
+            try:
+                results[playlist['id']] = self.export(playlist['id'])
+            except Exception:
+                logger.exception("Exporting spotify playlist %s failed, continuing with the next one", playlist['id'])
+                results[playlist['id']] = None
+        return results
+
+    def migrate_snapshot(self, snapshot: PlaylistSnapshot, ytmusic_playlist_name: str = "") -> str | None:
+        """Migrate an exported playlist snapshot to YouTube Music, without calling Spotify.
+        \n        The snapshot is read incrementally and fed through the streaming pipeline.
+        Progress is journaled under the snapshot's Spotify playlist ID, so re-running
+        after a failure resumes with the matches found so far.
+        \n        Args:
+            snapshot: The snapshot to migrate.
+            ytmusic_playlist_name: Optional custom name for the YouTube Music playlist.
+                                   If not provided, uses the name stored in the snapshot.
+            \n        Returns:
+            str | None: The YouTube Music playlist ID if migration succeeded, None otherwise.
+        """
+        header = snapshot.header()
+        return self._migrate_one(header.playlist_id, ytmusic_playlist_name, streaming=True, snapshot=snapshot)
+
+    def _fetch_many(self, spotify_playlist_ids: List[str]) -> Dict[str, TrackBatch]:
+        """Fetch several playlists concurrently.
+        \n        Playlists are fetched settings.SPOTIFY_FETCH_WORKERS at a time, each one
+        page after another, which keeps the total number of concurrent Spotify
+        requests at that bound.
+        \n        Args:
+            spotify_playlist_ids: IDs of the Spotify playlists to fetch.
+            \n        Returns:
+            Dict[str, TrackBatch]: Playlist ID -> tracks, for playlists fetched successfully.
+        """
+        fetched: Dict[str, TrackBatch] = {}
+        workers = max(1, settings.SPOTIFY_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="spotify-playlist") as executor:
+            futures = {executor.submit(self.fetcher.fetch, playlist_id, 1): playlist_id for playlist_id in spotify_playlist_ids}
+            for future in as_completed(futures):
+                playlist_id = futures[future]
+                try:
+                    fetched[playlist_id] = future.result()
+                except Exception:
+                    logger.exception("Fetching spotify playlist %s failed, skipping it", playlist_id)
+        return fetched
+
+    def _migrate_one(
+        self,
+        spotify_playlist_id: str,
+        ytmusic_playlist_name: str = "",
+        streaming: bool | None = None,
+        songs: TrackBatch | None = None,
+        known: Dict[str, str] | None = None,
+        snapshot: PlaylistSnapshot | None = None,
+    ) -> str | None:
+        """Migrate one playlist and record its outcome and duration in the metrics.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist to migrate.
+            ytmusic_playlist_name: Optional custom name for the YouTube Music playlist.
+            streaming: Run the streaming pipeline. Defaults to settings.MIGRATION_STREAMING.
+            songs: Already fetched tracks of the playlist. Implies the batch pipeline.
+            known: Track key -> video ID resolved beforehand; these songs are not searched again.
+            snapshot: Exported playlist to read the tracks and metadata from instead of Spotify.
+            \n        Returns:
+            str | None: The YouTube Music playlist ID if migration succeeded, None otherwise.
+        """
+        try:
+            with MIGRATION_SECONDS.time():
+                yt_playlist_id = self._migrate_playlist(spotify_playlist_id, ytmusic_playlist_name, streaming, songs, known, snapshot)
+        except Exception:
+            MIGRATIONS_FAILED.inc()
+            raise
+        (MIGRATIONS_COMPLETED if yt_playlist_id else MIGRATIONS_FAILED).inc()
+        return yt_playlist_id
+
+    def _migrate_playlist(
+        self,
+        spotify_playlist_id: str,
+        ytmusic_playlist_name: str = "",
+        streaming: bool | None = None,
+        songs: TrackBatch | None = None,
+        known: Dict[str, str] | None = None,
+        snapshot: PlaylistSnapshot | None = None,
+    ) -> str | None:
+        """Migrate one playlist, optionally with prefetched songs and pre-resolved matches.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist to migrate.
+            ytmusic_playlist_name: Optional custom name for the YouTube Music playlist.
+            streaming: Run the streaming pipeline. Defaults to settings.MIGRATION_STREAMING.
+            songs: Already fetched tracks of the playlist. Implies the batch pipeline.
+            known: Track key -> video ID resolved beforehand; these songs are not searched again.
+            snapshot: Exported playlist to read the tracks and metadata from instead of Spotify.
             \n        Returns:
             str | None: The YouTube Music playlist ID if migration succeeded, None otherwise.
         """
+        state = self.journal.load(spotify_playlist_id) if self.journal else None
+
+        if state and not state.completed:
+            yt_playlist_id = state.yt_playlist_id
+            logger.info(
+                "Resuming migration of %s into YTMusic playlist %s (inserted up to %d)",
+                spotify_playlist_id,
+                yt_playlist_id,
+                state.inserted_upto
+            )
+        else:
+            state = None
+            yt_playlist_id = self._create_playlist(spotify_playlist_id, ytmusic_playlist_name, snapshot.header() if snapshot else None)
+            if not yt_playlist_id:
+                return
+            if self.journal:
+                self.journal.start(spotify_playlist_id, yt_playlist_id)
+
+        if streaming is None:
+            streaming = settings.MIGRATION_STREAMING
+        start = state.inserted_upto if state else 0
+
+        if streaming and songs is None:
+            with profiler.stage("stream", spotify_playlist_id):
+                pages = snapshot.iter_batches() if snapshot else None
+                completed = self._migrate_streaming(spotify_playlist_id, yt_playlist_id, start, source=pages)
+        else:
+            completed = self._migrate_batch(spotify_playlist_id, yt_playlist_id, state, songs, known)
+        if not completed:
+            return
+
+        if self.journal:
+            self.journal.complete(spotify_playlist_id)
+        return yt_playlist_id
+
+    def sync(self, spotify_playlist_id: str, ytmusic_playlist_name: str = "", remove_deleted: bool | None = None) -> str | None:
+        """Incrementally sync a Spotify playlist into its YouTube Music playlist.
+        \n        Skips the playlist entirely if its Spotify snapshot_id has not changed since
+        the last sync (and no unmatched track is due for another search). Otherwise
+        reads the current YT Music playlist, diffs it against the Spotify tracks and
+        only searches and inserts tracks that are not there yet, so the work scales
+        with the size of the change rather than of the playlist. Tracks without a
+        synced video ID are first looked for in the YT Music playlist by normalized
+        title and main artist, so the first sync of a playlist that migrate() filled
+        does not search every track again.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist to sync.
+            ytmusic_playlist_name: Optional custom name for the YouTube Music playlist.
+            remove_deleted: Also remove songs whose tracks were deleted on Spotify.
+                            Defaults to settings.SYNC_REMOVE_DELETED.
+            \n        Returns:
+            str | None: The YouTube Music playlist ID if the sync succeeded, None otherwise.
+        """
+        if self.sync_store is None:
+            raise RuntimeError("PlaylistMigrator.sync requires a SyncStateStore")
+        if remove_deleted is None:
+            remove_deleted = settings.SYNC_REMOVE_DELETED
+
+        state = self.sync_store.load(spotify_playlist_id)
+        snapshot_id = self.spotify_client.get_playlist_snapshot_id(spotify_playlist_id)
+        if state and state.snapshot_id == snapshot_id and not self.sync_store.expired_unmatched(spotify_playlist_id):
+            logger.info("Spotify playlist %s unchanged since last sync, skipping", spotify_playlist_id)
+            return state.yt_playlist_id
+
+        yt_playlist_id = state.yt_playlist_id if state else self._create_playlist(spotify_playlist_id, ytmusic_playlist_name)
+        if not yt_playlist_id:
+            return
 
+        songs = self.fetcher.fetch(spotify_playlist_id)
+        synced = self.sync_store.tracks(spotify_playlist_id) if state else {}
+        yt_items = self.ytmusic_client.get_playlist_items(yt_playlist_id)
+        present = {item['videoId'] for item in yt_items}
+        in_playlist = self._index_items(yt_items)
+
+        current: Dict[str, str] = {}
+        new_songs = TrackBatch()
+        found = 0
+        for song in songs:
+            key = song.key
+            if key in current:
+                continue
+            video_id = synced.get(key)
+            if video_id and video_id in present:
+                current[key] = video_id
+                continue
+            in_yt = in_playlist.get((normalize_text(song.title), normalize_text(song.artist)))
+            if in_yt:
+                found += 1
+                current[key] = in_yt
+            elif video_id == "":
+                # Searched before without a match, and not expired yet
+                current[key] = ""
+            else:
+                current[key] = ""
+                new_songs.append(song)
+
+        to_add: List[str] = []
+        matched = self.matcher.match_all(new_songs)
+        self._review(spotify_playlist_id, matched)
+        for result in matched:
+            if result.error:
+                current.pop(result.track.key, None)
+                continue
+            current[result.track.key] = result.video_id
+            if result.video_id and result.video_id not in present:
+                present.add(result.video_id)
+                to_add.append(result.video_id)
+        logger.info(
+            "Sync %s: %d of %d songs new, %d found in the YTMusic playlist, %d to add",
+            spotify_playlist_id,
+            len(new_songs),
+            len(songs),
+            found,
+            len(to_add)
+        )
+
+        batch_size = max(1, settings.MIGRATION_INSERT_BATCH_SIZE)
+        for start in range(0, len(to_add), batch_size):
+            # Songs of a failed batch that did land are in the playlist on the next
+            # sync and are not added again
+            if not self._batch_ok(self._add_batch(yt_playlist_id, to_add[start:start + batch_size])):
+                logger.error("Sync of %s stopped while adding songs. Re-run to retry.", spotify_playlist_id)
+                return
+
+        if remove_deleted:
+            deleted = {video_id for key, video_id in synced.items() if video_id and key not in current}
+            deleted -= set(current.values())
+            stale = [item for item in yt_items if item['videoId'] in deleted]
+            if stale and self.ytmusic_client.remove_songs_from_playlist(yt_playlist_id, stale):
+                logger.info("Removed %d songs deleted from spotify playlist %s", len(stale), spotify_playlist_id)
+
+        self.sync_store.save(spotify_playlist_id, yt_playlist_id, snapshot_id, current)
+        return yt_playlist_id
+
+    @staticmethod
+    def _index_items(yt_items: List[dict]) -> Dict[Tuple[str, str], str]:
+        """Index YT Music playlist items by normalized title and artist.
+        \n        Args:
+            yt_items: Playlist items as returned by YTMusicClient.get_playlist_items.
+            \n        Returns:
+            Dict[Tuple[str, str], str]: (title, artist) -> video ID, one entry per artist of an item.
+        """
+        index: Dict[Tuple[str, str], str] = {}
+        for item in yt_items:
+            title = normalize_text(item.get('title', ""))
+            if not title:
+                continue
+            for artist in item.get('artists') or []:
+                index.setdefault((title, normalize_text(artist.get('name', ""))), item['videoId'])
+        return index
+
+    def _create_playlist(self, spotify_playlist_id: str, ytmusic_playlist_name: str = "", header: SnapshotHeader | None = None) -> str:
+        """Get or create the target YT Music playlist for a Spotify playlist.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist to migrate.
+            ytmusic_playlist_name: Optional custom name for the YouTube Music playlist.
+            header: Exported playlist metadata to use instead of asking Spotify.
+            \n        Returns:
+            str: The YouTube Music playlist ID, or empty string on failure.
+        """
         #  create playlist in YTM
-        pl_name, pl_desc = self.spotify_client.get_playlist_name_desc(spotify_playlist_id)
+        if header:
+            pl_name, pl_desc = header.name, header.description
+        else:
+            pl_name, pl_desc = self.spotify_client.get_playlist_name_desc(spotify_playlist_id)
         
         if ytmusic_playlist_name:
             pl_name = ytmusic_playlist_name
@@ -62,21 +480,333 @@ class PlaylistMigrator:
                 spotify_playlist_id,
                 pl_name
             )
-            return
+            return ""
         
         logger.info("YTMusic Playlist created. ID: %s, Name: %s", yt_playlist_id, pl_name)
+        return yt_playlist_id
 
+    def _migrate_batch(
+        self,
+        spotify_playlist_id: str,
+        yt_playlist_id: str,
+        state: MigrationState | None,
+        songs: TrackBatch | None = None,
+        known: Dict[str, str] | None = None,
+    ) -> bool:
+        """Run fetch, match and insert as three consecutive stages.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist to migrate.
+            yt_playlist_id: The target YouTube Music playlist ID.
+            state: The journaled state being resumed, or None for a fresh migration.
+            songs: Already fetched tracks of the playlist, if any.
+            known: Track key -> video ID resolved beforehand, if any.
+            \n        Returns:
+            bool: True if every matched song was added.
+        """
         # Fetch songs(Track) from spotify playlist
-        songs = self.fetcher.fetch(spotify_playlist_id)
-
-        logger.info("All song names are fetched from spotify playlist")
+        with FETCH_STAGE_SECONDS.time(), profiler.stage("fetch", spotify_playlist_id):
+            if state and state.fetched:
+                songs = self.journal.tracks(spotify_playlist_id)  # type: ignore[union-attr]
+                logger.info("Loaded %d journaled songs for spotify playlist", len(songs))
+            else:
+                if songs is None:
+                    songs = self.fetcher.fetch(spotify_playlist_id)
+                if self.journal:
+                    self.journal.record_tracks(spotify_playlist_id, songs)
+                logger.info("All song names are fetched from spotify playlist")
 
         # Search those songs in YTM, get ID
-        song_ids = self.matcher.match(songs)
+        with MATCH_STAGE_SECONDS.time(), profiler.stage("match", spotify_playlist_id):
+            song_ids = self._match(spotify_playlist_id, songs, known=known)
         logger.info("Songs are searched in YTM and collected YTM song IDs")
 
         # Add those IDs to YTM Playlist
-        self.ytmusic_client.add_songs_to_playlist(yt_playlist_id, song_ids)
+        with INSERT_STAGE_SECONDS.time(), profiler.stage("insert", spotify_playlist_id):
+            inserted = self._insert(spotify_playlist_id, yt_playlist_id, song_ids, state.inserted_upto if state else 0)
+        if not inserted:
+            return False
         logger.info("Songs are added to playlist")
+        return True
 
-        return yt_playlist_id
+    def _migrate_streaming(
+        self,
+        spotify_playlist_id: str,
+        yt_playlist_id: str,
+        start: int = 0,
+        source: Iterable[TrackBatch] | None = None,
+    ) -> bool:
+        """Run fetch, match and insert as an overlapping pipeline.
+        \n        A fetcher thread pushes Spotify pages (or the batches of ``source``) into a
+        bounded queue, the calling thread matches each page, and an inserter thread
+        adds matched songs in batches of settings.MIGRATION_INSERT_BATCH_SIZE. Bounded
+        queues between the stages keep memory constant regardless of playlist size.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist to migrate.
+            yt_playlist_id: The target YouTube Music playlist ID.
+            start: Insert watermark to resume from; earlier songs are skipped.
+            source: Track batches to migrate instead of fetching the playlist from Spotify.
+            \n        Returns:
+            bool: True if the whole playlist was fetched and every matched song was added.
+        """
+        pages: queue.Queue = queue.Queue(maxsize=max(1, settings.MIGRATION_STREAM_PREFETCH_PAGES))
+        batches: queue.Queue = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        errors: List[str] = []
+
+        def fetch_pages() -> None:
+            offset = 0
+            try:
+                for page in source if source is not None else self.fetcher.iter_pages(spotify_playlist_id):
+                    if stop.is_set():
+                        break
+                    pages.put((offset, page))
+                    offset += len(page)
+            except Exception as e:
+                logger.exception("Fetching spotify playlist %s failed", spotify_playlist_id)
+                errors.append(f"fetch failed: {e}")
+                stop.set()
+            finally:
+                pages.put(None)
+
+        def insert_batches() -> None:
+            while (item := batches.get()) is not None:
+                batch_end, entries = item
+                if stop.is_set():
+                    continue
+                try:
+                    if entries:
+                        result = self._add_batch(yt_playlist_id, [video_id for _, video_id in entries])
+                        if not self._commit_batch(spotify_playlist_id, entries, result, batch_end):
+                            errors.append(f"insert failed before position {batch_end}")
+                            stop.set()
+                            continue
+                    elif self.journal:
+                        self.journal.advance_watermark(spotify_playlist_id, batch_end)
+                except Exception as e:
+                    # Keep draining until the sentinel, so producers never block on a full queue
+                    logger.exception("Adding songs to YTMusic playlist %s failed", yt_playlist_id)
+                    errors.append(f"insert failed before position {batch_end}: {e}")
+                    stop.set()
+
+        fetcher = threading.Thread(target=fetch_pages, name="spotify-fetch", daemon=True)
+        inserter = threading.Thread(target=insert_batches, name="ytm-insert", daemon=True)
+        fetcher.start()
+        inserter.start()
+
+        batch_size = max(1, settings.MIGRATION_INSERT_BATCH_SIZE)
+        landed = self.journal.inserted_positions(spotify_playlist_id, start) if self.journal else set()
+        buffer: List[Tuple[int, str]] = []
+        covered = start
+        total = 0
+        fetch_done = False
+        try:
+            while (item := pages.get()) is not None:
+                offset, page = item
+                total = offset + len(page)
+                if stop.is_set() or total <= start:
+                    continue
+                if self.journal:
+                    self.journal.record_tracks(spotify_playlist_id, page, offset=offset, fetched=False)
+
+                song_ids = self._match(spotify_playlist_id, page, offset)
+                for position in range(max(offset, start), total):
+                    video_id = song_ids[position - offset]
+                    if video_id and position not in landed:
+                        buffer.append((position, video_id))
+                    covered = position + 1
+                    if len(buffer) >= batch_size:
+                        batches.put((covered, buffer))
+                        buffer = []
+                logger.info("Streamed songs %d-%d of spotify playlist %s", offset, total, spotify_playlist_id)
+            fetch_done = True
+
+            if not stop.is_set() and (buffer or covered > start):
+                batches.put((covered, buffer))
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            # Release both threads: the inserter stops at the sentinel, the fetcher
+            # stops after its next put once the pages queue is drained.
+            batches.put(None)
+            if not fetch_done:
+                while pages.get() is not None:
+                    pass
+            fetcher.join()
+            inserter.join()
+
+        if errors:
+            logger.error(
+                "Streaming migration stopped: %s. Re-run to resume. spotify_playlist_id=%s",
+                "; ".join(errors),
+                spotify_playlist_id
+            )
+            return False
+        if self.journal:
+            self.journal.mark_fetched(spotify_playlist_id)
+        logger.info("Streamed %d songs into YTMusic playlist %s", total, yt_playlist_id)
+        return True
+
+    def _match(self, spotify_playlist_id: str, songs: TrackBatch, offset: int = 0, known: Dict[str, str] | None = None) -> List[str]:
+        """Resolve songs to video IDs, reusing and updating journaled matches.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist being migrated.
+            songs: Consecutive tracks of the playlist, in order.
+            offset: Playlist position of the first song in ``songs``.
+            known: Track key -> video ID resolved beforehand; matching songs skip the search.
+            \n        Returns:
+            List[str]: One video ID per song ('' where nothing matched), aligned with ``songs``.
+        """
+        end = offset + len(songs)
+        resolved = self.journal.matches(spotify_playlist_id, offset, end) if self.journal else {}
+        if known:
+            for position in range(offset, end):
+                video_id = known.get(songs[position - offset].key)
+                if position not in resolved and video_id is not None:
+                    resolved[position] = video_id
+                    if self.journal:
+                        self.journal.record_match(spotify_playlist_id, position, video_id)
+        pending_positions = [position for position in range(offset, end) if position not in resolved]
+        if resolved:
+            logger.info("Reusing %d known matches, %d songs left to search", len(resolved), len(pending_positions))
+
+        def record(result: MatchResult) -> None:
+            position = pending_positions[result.position]
+            if not result.error:
+                resolved[position] = result.video_id
+                if self.journal:
+                    self.journal.record_match(spotify_playlist_id, position, result.video_id)
+
+        results = self.matcher.match_all(TrackBatch(songs[position - offset] for position in pending_positions), on_result=record)
+        self._review(spotify_playlist_id, results)
+        failures = [result for result in results if result.error]
+        if failures:
+            logger.warning("%d of %d songs failed to match and will be skipped", len(failures), len(results))
+        return [resolved.get(position, "") for position in range(offset, end)]
+
+    def _review(self, spotify_playlist_id: str | None, results: List[MatchResult]) -> None:
+        """Send low-confidence matches to the review list, if one is configured.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist the tracks came from, if known.
+            results: Match results to check.
+        """
+        if self.review_list:
+            count = self.review_list.add(spotify_playlist_id, results)
+            REVIEW_TRACKS.inc(count)
+            if count:
+                logger.warning("%d low-confidence matches were left out and written to %s", count, self.review_list.path)
+
+    def _add_batch(self, yt_playlist_id: str, video_ids: List[str]) -> InsertResult:
+        """Add one batch of songs, tolerating individually rejected IDs.
+        \n        IDs that YT Music rejects on their own are logged and skipped. IDs lost to a
+        request error (network, server or throttling trouble) are resent on their
+        own, up to settings.YTM_INSERT_RETRIES times, so songs that already landed
+        are never sent twice.
+        \n        Args:
+            yt_playlist_id: The target YouTube Music playlist ID.
+            video_ids: Video IDs to add.
+            \n        Returns:
+            InsertResult: The outcome of the batch; ``errored`` holds the IDs still not added.
+        """
+        result = self.ytmusic_client.add_songs_to_playlist(yt_playlist_id, video_ids)
+        for _ in range(settings.YTM_INSERT_RETRIES):
+            if not result.errored:
+                break
+            logger.warning("Resending %d songs whose request failed", len(result.errored))
+            retry = self.ytmusic_client.add_songs_to_playlist(yt_playlist_id, result.errored)
+            result = InsertResult(
+                playlist_id=yt_playlist_id,
+                added=result.added + retry.added,
+                failed=result.failed + retry.failed,
+                errored=retry.errored,
+            )
+        if result.errored:
+            logger.error("%d songs were not added because the request failed", len(result.errored))
+        if result.failed:
+            logger.warning("Skipping %d songs YTMusic rejected: %s", len(result.failed), result.failed)
+        return result
+
+    @staticmethod
+    def _batch_ok(result: InsertResult) -> bool:
+        """Whether insertion can go on after a batch: nothing errored and not every song was rejected."""
+        return not result.errored and not (result.failed and not result.added)
+
+    def _commit_batch(
+        self,
+        spotify_playlist_id: str,
+        entries: List[Tuple[int, str]],
+        result: InsertResult,
+        batch_end: int,
+    ) -> bool:
+        """Journal the outcome of one inserted batch.
+        \n        A complete batch moves the insert watermark to ``batch_end``. After a request
+        error the watermark moves to the first song that was not added, and songs
+        that landed past it (later chunks, or chunks sent concurrently) are marked
+        inserted, so a resume neither adds a song twice nor skips one.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist being migrated.
+            entries: (playlist position, video ID) of the songs sent, in playlist order.
+            result: The outcome of _add_batch for ``entries``.
+            batch_end: Playlist position just past the batch.
+            \n        Returns:
+            bool: True if insertion can go on past the batch.
+        """
+        if not result.errored:
+            if not self._batch_ok(result):
+                return False
+            if self.journal:
+                self.journal.advance_watermark(spotify_playlist_id, batch_end)
+            return True
+
+        if self.journal:
+            added, errored = Counter(result.added), Counter(result.errored)
+            watermark: int | None = None
+            landed: List[int] = []
+            for position, video_id in entries:
+                if added[video_id]:
+                    added[video_id] -= 1
+                    if watermark is not None:
+                        landed.append(position)
+                elif errored[video_id]:
+                    errored[video_id] -= 1
+                    if watermark is None:
+                        watermark = position
+            if landed:
+                self.journal.mark_inserted(spotify_playlist_id, landed)
+            if watermark is not None:
+                self.journal.advance_watermark(spotify_playlist_id, watermark)
+        return False
+
+    def _insert(self, spotify_playlist_id: str, yt_playlist_id: str, song_ids: List[str], start: int = 0) -> bool:
+        """Add matched songs to the playlist in batches, advancing the insert watermark.
+        \n        Args:
+            spotify_playlist_id: The ID of the Spotify playlist being migrated.
+            yt_playlist_id: The target YouTube Music playlist ID.
+            song_ids: One video ID per song position ('' where nothing matched).
+            start: Position of the first song not yet inserted.
+            \n        Returns:
+            bool: True if every batch was added, False if insertion stopped on an error.
+        """
+        batch_size = max(1, settings.MIGRATION_INSERT_BATCH_SIZE)
+        landed = self.journal.inserted_positions(spotify_playlist_id, start) if self.journal else set()
+        for batch_start in range(start, len(song_ids), batch_size):
+            batch_end = min(batch_start + batch_size, len(song_ids))
+            entries = [
+                (position, song_ids[position])
+                for position in range(batch_start, batch_end)
+                if song_ids[position] and position not in landed
+            ]
+            if not entries:
+                if self.journal:
+                    self.journal.advance_watermark(spotify_playlist_id, batch_end)
+                continue
+            result = self._add_batch(yt_playlist_id, [video_id for _, video_id in entries])
+            if not self._commit_batch(spotify_playlist_id, entries, result, batch_end):
+                logger.error(
+                    "Stopped adding songs at position %d of %d. Re-run to resume. spotify_playlist_id=%s",
+                    batch_start,
+                    len(song_ids),
+                    spotify_playlist_id
+                )
+                return False
+        return True
@@ -0,0 +1,130 @@
+"""Multi-process playlist migration.
+
+This module spreads the playlists of one run over a pool of worker processes. Every
+worker builds its own clients and services with ``create_app`` (its own Spotify token,
+YTMusic sessions and database connections), so migrations run in parallel on all
+cores instead of sharing one interpreter's GIL and one YTMusic session. The on-disk
+stores are SQLite databases in WAL mode, so the workers share the match cache,
+migration journal and sync state safely.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from typing import Callable, Dict, List, Tuple
+from spot2ytm.clients.spotfiy_client import SpotifyClient
+from spot2ytm.config.logging_config import LoggingConfigurator
+from spot2ytm.config.settings import settings
+from spot2ytm.telemetry.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# The PlaylistMigrator of this worker process, built once by _init_worker
+_migrator = None
+
+
+def _init_worker(app_factory: Callable | None, configure_logging: bool) -> None:
+    """Build the worker's own application (runs once in every worker process)."""
+    global _migrator
+    if configure_logging:
+        LoggingConfigurator(settings.DEBUG).configure()
+    if app_factory is None:
+        from spot2ytm.app import create_app
+
+        app_factory = create_app
+    _migrator = app_factory()
+
+
+def _run_playlist(spotify_playlist_id: str, sync: bool) -> Tuple[str | None, Dict[str, int]]:
+    """Migrate (or sync) one playlist in a worker process.
+    \n    Returns:
+        Tuple[str | None, Dict[str, int]]: The YT Music playlist ID (None on failure) and
+        the counter increments of this playlist, to be merged into the parent's metrics.
+    """
+    before = metrics.snapshot()["counters"]
+    try:
+        if sync:
+            yt_playlist_id = _migrator.sync(spotify_playlist_id)  # type: ignore[union-attr]
+        else:
+            yt_playlist_id = _migrator.migrate(spotify_playlist_id)  # type: ignore[union-attr]
+    except Exception:
+        logger.exception("Migrating spotify playlist %s failed", spotify_playlist_id)
+        yt_playlist_id = None
+    after = metrics.snapshot()["counters"]
+    increments = {name: value - before.get(name, 0) for name, value in after.items() if value != before.get(name, 0)}
+    return yt_playlist_id, increments
+
+
+class ShardedMigrator:
+    """Migrates many playlists across a pool of worker processes.
+
+    Playlists are handed out one at a time, in the given order, to whichever worker is
+    free. Passing them largest first (as ``migrate_library`` does) keeps every worker
+    busy until the end. The parent collects each result as it arrives, logs progress
+    and adds the workers' counter increments to its own metrics registry (histograms
+    stay per process).
+    """
+
+    def __init__(self, processes: int | None = None, app_factory: Callable | None = None) -> None:
+        """Initialize the sharded migrator.
+        \n        Args:
+            processes: Number of worker processes. Defaults to settings.MIGRATION_PROCESSES.
+            app_factory: Picklable callable returning a PlaylistMigrator, called once in
+                         every worker. Defaults to spot2ytm.app.create_app.
+        """
+        self.processes = max(1, processes or settings.MIGRATION_PROCESSES)
+        self.app_factory = app_factory
+
+    def migrate(self, spotify_playlist_ids: List[str], sync: bool = False) -> Dict[str, str | None]:
+        """Migrate (or sync) several Spotify playlists in parallel processes.
+        \n        Args:
+            spotify_playlist_ids: IDs of the Spotify playlists, in the order they are started.
+            sync: Use incremental sync() instead of migrate() for each playlist.
+            \n        Returns:
+            Dict[str, str | None]: Spotify playlist ID -> YT Music playlist ID (None on failure),
+            in the order of ``spotify_playlist_ids``.
+        """
+        playlist_ids = list(dict.fromkeys(spotify_playlist_ids))
+        results: Dict[str, str | None] = dict.fromkeys(playlist_ids)
+        if not playlist_ids:
+            return results
+
+        processes = min(self.processes, len(playlist_ids))
+        logger.info("Migrating %d playlists in %d processes", len(playlist_ids), processes)
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            # spawn: workers must not inherit the parent's threads, locks or SQLite connections
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.app_factory, logging.getLogger().hasHandlers()),
+        ) as executor:
+            futures = {executor.submit(_run_playlist, playlist_id, sync): playlist_id for playlist_id in playlist_ids}
+            for done, future in enumerate(as_completed(futures), start=1):
+                playlist_id = futures[future]
+                try:
+                    yt_playlist_id, increments = future.result()
+                except Exception:
+                    logger.exception("Worker migrating spotify playlist %s failed", playlist_id)
+                    yt_playlist_id, increments = None, {}
+                results[playlist_id] = yt_playlist_id
+                for name, amount in increments.items():
+                    metrics.counter(name).inc(amount)
+                logger.info(
+                    "Playlist %d/%d finished: %s -> %s", done, len(playlist_ids), playlist_id, yt_playlist_id or "failed"
+                )
+
+        failed = sum(1 for yt_playlist_id in results.values() if not yt_playlist_id)
+        logger.info("Migrated %d of %d playlists (%d failed)", len(results) - failed, len(results), failed)
+        return results
+
+    def migrate_library(self, spotify_client: SpotifyClient, sync: bool = False) -> Dict[str, str | None]:
+        """Migrate (or sync) every playlist in the user's Spotify library in parallel processes.
+        \n        Args:
+            spotify_client: Client used to list the library (largest playlists first).
+            sync: Use incremental sync() instead of migrate() for each playlist.
+            \n        Returns:
+            Dict[str, str | None]: Spotify playlist ID -> YT Music playlist ID (None on failure).
+        """
+        playlists = spotify_client.get_all_my_playlists(max_workers=settings.SPOTIFY_FETCH_WORKERS)
+        logger.info("Found %d playlists in the spotify library", len(playlists))
+        return self.migrate([playlist['id'] for playlist in playlists], sync=sync)
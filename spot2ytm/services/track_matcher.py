@@ -4,27 +4,300 @@ This module provides functionality to match Spotify tracks with their equivalent
 in YouTube Music using search and metadata matching.
 """
 
-from typing import List
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 from spot2ytm.clients.ytmusic_client import YTMusicClient
+from spot2ytm.domain.match_result import MatchResult
+from spot2ytm.domain.normalization import normalize_text
 from spot2ytm.domain.track import Track
+from spot2ytm.services.library_index import LibraryIndex
+from spot2ytm.services.match_scoring import MatchScorer
+from spot2ytm.storage.match_cache import MatchCache
+from spot2ytm.telemetry.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CACHE_HITS = metrics.counter("match_cache_hits_total", "Tracks resolved from the match cache")
+CACHE_MISSES = metrics.counter("match_cache_misses_total", "Match cache lookups that found nothing")
+LIBRARY_HITS = metrics.counter("match_library_hits_total", "Tracks resolved from the YT Music library index")
+ALBUM_HITS = metrics.counter("match_album_hits_total", "Tracks resolved from an album tracklist")
+MATCH_FAILURES = metrics.counter("match_failures_total", "Tracks whose search failed with an error")
+NOT_FOUND = metrics.counter("match_not_found_total", "Tracks searched without any result")
+LOW_CONFIDENCE = metrics.counter("match_low_confidence_total", "Tracks whose best result scored below the threshold")
 
 
 class TrackMatcher:
     """Matches Spotify tracks to YouTube Music videos.
-    
+
     Searches for YouTube Music equivalents of Spotify tracks and collects their
     video IDs for playlist population. Currently uses track title for matching,
     with album information available for future enhancements.
+
+    With more than one worker, searches run concurrently on a thread pool. Each
+    worker thread uses its own YTMusic session (see YTMusicClient), and results are
+    reassembled in playlist order regardless of completion order.
+
+    If a MatchCache is given, it is consulted before every search and updated with
+    every new match, so tracks resolved in earlier runs cost no network round trip.
+    If a LibraryIndex is given, tracks already in the user's YT Music library are
+    resolved from it and only the misses go to live search.
+
+    With album batching, tracks sharing an album and main artist are resolved from a single album
+    lookup (search + tracklist, about two calls for the whole group) and matched
+    locally by title; only unmatched tracks fall back to per-track search.
+
+    With a MatchScorer, the top results of the one search are ranked by title, artist,
+    album and duration similarity. Tracks whose best result scores below the
+    scorer's threshold are left unmatched with the candidate kept for review, rather
+    than triggering further searches.
     """
-    
-    def __init__(self, ytmusic: YTMusicClient) -> None:
+
+    def __init__(
+        self,
+        ytmusic: YTMusicClient,
+        workers: int = 1,
+        cache: MatchCache | None = None,
+        library_index: LibraryIndex | None = None,
+        album_batch_min_tracks: int = 0,
+        scorer: MatchScorer | None = None,
+        candidates: int = 5,
+    ) -> None:
         """Initialize the track matcher.
         \n        Args:
             ytmusic: YTMusicClient instance for searching songs.
+            workers: Number of concurrent search workers. 1 searches sequentially.
+            cache: Optional persistent match cache consulted before searching.
+            library_index: Optional index of the user's YT Music library consulted before searching.
+            album_batch_min_tracks: Resolve albums with at least this many tracks through one
+                                    album lookup instead of per-track searches. 0 disables it.
+            scorer: Optional MatchScorer ranking the top search results. Without it the
+                    first result is taken.
+            candidates: Number of search results ranked by the scorer.
         """
         self.ytmusic_client = ytmusic
+        self.workers = max(1, workers)
+        self.cache = cache
+        self.library_index = library_index
+        self.album_batch_min_tracks = album_batch_min_tracks
+        self.scorer = scorer
+        self.candidates = max(1, candidates)
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """Return the search worker pool, creating it on first use.
+        \n        The pool is kept for the matcher's lifetime so worker threads (and their
+        YTMusic sessions) are reused across calls, e.g. page by page when streaming.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ytm-search")
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the search worker pool, if it was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _resolve_local(self, position: int, track: Track) -> MatchResult | None:
+        """Resolve a track from the match cache or library index, without a search.
+        \n        A failing cache or library lookup is logged and treated as a miss, so the
+        track falls through to a search.
+        \n        Args:
+            position: Index of the track in the source playlist.
+            track: The track to resolve.
+            \n        Returns:
+            MatchResult | None: The match, or None if neither source knows the track.
+        """
+        if self.cache:
+            try:
+                cached = self.cache.get(track.key)
+            except Exception as e:
+                logger.warning("Match cache lookup failed for '%s', searching instead: %s", track.title, e)
+                cached = None
+            if cached:
+                CACHE_HITS.inc()
+                return MatchResult(position=position, track=track, video_id=cached, source="cache")
+            CACHE_MISSES.inc()
+
+        if self.library_index:
+            try:
+                owned = self.library_index.lookup(track)
+            except Exception as e:
+                logger.warning("Library lookup failed for '%s', searching instead: %s", track.title, e)
+                owned = None
+            if owned:
+                LIBRARY_HITS.inc()
+                return MatchResult(position=position, track=track, video_id=owned, source="library")
+        return None
+
+    def _remember(self, track: Track, video_id: str) -> None:
+        """Store a match in the match cache, if one is configured.
+        \n        A failing write (e.g. "database is locked" while other processes share the
+        cache) is logged and ignored; the match itself still stands.
+        \n        Args:
+            track: The matched track.
+            video_id: Its video ID.
+        """
+        if not self.cache:
+            return
+        try:
+            self.cache.put(track.key, video_id)
+        except Exception as e:
+            logger.warning("Match cache write failed for '%s': %s", track.title, e)
+
+    def _search(self, position: int, track: Track) -> MatchResult:
+        """Search a single track on YT Music, capturing any failure in the result.
+        \n        Args:
+            position: Index of the track in the source playlist.
+            track: The track to search for.
+            \n        Returns:
+            MatchResult: The match outcome for the track.
+        """
+        confidence = None
+        try:
+            # video_id = self.ytmusic_client.search_song(track.title, track.album)
+            ###  search only with name for now
+            if self.scorer:
+                ranked = self.scorer.rank(track, self.ytmusic_client.search_candidates(track.title, limit=self.candidates))
+                confidence, best = ranked[0] if ranked else (0.0, {})
+                video_id = best.get('videoId', "")
+                if video_id and confidence < self.scorer.threshold:
+                    LOW_CONFIDENCE.inc()
+                    logger.info("Low-confidence match %.2f for track %r, leaving it for review", confidence, track.title)
+                    return MatchResult(position=position, track=track, confidence=confidence, candidate=video_id)
+            else:
+                video_id = self.ytmusic_client.search_song(track.title)
+        except Exception as e:
+            logger.warning("Search failed for track %r: %s", track.title, e)
+            MATCH_FAILURES.inc()
+            return MatchResult(position=position, track=track, error=str(e) or type(e).__name__)
 
-    def match(self, tracks: List[Track]) -> List[str]:
+        if not video_id:
+            NOT_FOUND.inc()
+        else:
+            self._remember(track, video_id)
+        return MatchResult(position=position, track=track, video_id=video_id or "", confidence=confidence)
+
+    def _resolve(self, position: int, track: Track) -> MatchResult:
+        """Resolve a single track locally if possible, otherwise by search.
+        \n        Args:
+            position: Index of the track in the source playlist.
+            track: The track to resolve.
+            \n        Returns:
+            MatchResult: The match outcome for the track.
+        """
+        return self._resolve_local(position, track) or self._search(position, track)
+
+    def _resolve_album(self, group: List[Tuple[int, Track]]) -> List[MatchResult]:
+        """Resolve tracks sharing an album with one album lookup.
+        \n        Tracks known locally are resolved first. If enough remain, the album is
+        looked up once on YT Music (by album name and main artist) and the rest are
+        matched by normalized title against its tracklist. With a MatchScorer, a
+        tracklist hit is only accepted if it scores at or above the threshold.
+        Anything still unmatched falls back to a per-track search, which also
+        leaves low-confidence tracks for review.
+        \n        Args:
+            group: (position, track) pairs of tracks from the same album and main artist.
+            \n        Returns:
+            List[MatchResult]: One result per track in ``group``.
+        """
+        results: List[MatchResult] = []
+        remaining: List[Tuple[int, Track]] = []
+        for position, track in group:
+            local = self._resolve_local(position, track)
+            if local:
+                results.append(local)
+            else:
+                remaining.append((position, track))
+
+        by_title: Dict[str, dict] = {}
+        if len(remaining) >= self.album_batch_min_tracks:
+            album, artist = remaining[0][1].album, remaining[0][1].artist
+            try:
+                for album_track in self.ytmusic_client.get_album_tracks(album, artist):
+                    if album_track.get('videoId'):
+                        by_title.setdefault(normalize_text(album_track.get('title', "")), album_track)
+            except Exception as e:
+                logger.warning("Album lookup failed for %r, searching its tracks one by one: %s", album, e)
+
+        for position, track in remaining:
+            album_track = by_title.get(normalize_text(track.title))
+            confidence = None
+            if album_track and self.scorer:
+                confidence, _ = self.scorer.rank(track, [album_track])[0]
+                if confidence < self.scorer.threshold:
+                    album_track = None
+            if album_track:
+                ALBUM_HITS.inc()
+                video_id = album_track['videoId']
+                self._remember(track, video_id)
+                results.append(
+                    MatchResult(position=position, track=track, video_id=video_id, confidence=confidence, source="album")
+                )
+            else:
+                results.append(self._search(position, track))
+        return results
+
+    def _plan(self, tracks: Sequence[Track]) -> List[Tuple[Callable[..., Any], tuple]]:
+        """Split tracks into work items: album groups and single-track resolutions.
+        \n        Args:
+            tracks: Tracks to match.
+            \n        Returns:
+            List[Tuple[Callable, tuple]]: (function, args) pairs, each returning
+            a MatchResult or a list of them.
+        """
+        if self.album_batch_min_tracks <= 0:
+            return [(self._resolve, (position, track)) for position, track in enumerate(tracks)]
+
+        groups: Dict[Tuple[str, str], List[Tuple[int, Track]]] = {}
+        for position, track in enumerate(tracks):
+            groups.setdefault((normalize_text(track.album), normalize_text(track.artist)), []).append((position, track))
+
+        plan: List[Tuple[Callable[..., Any], tuple]] = []
+        for (album, _), group in groups.items():
+            if album and len(group) >= self.album_batch_min_tracks:
+                plan.append((self._resolve_album, (group,)))
+            else:
+                plan.extend((self._resolve, (position, track)) for position, track in group)
+        return plan
+
+    def match_all(
+        self,
+        tracks: Sequence[Track],
+        on_result: Callable[[MatchResult], None] | None = None,
+    ) -> List[MatchResult]:
+        """Match tracks to YouTube Music and return one result per track.
+        \n        A failing search is recorded on its MatchResult and does not abort the
+        rest of the batch. With album batching enabled, tracks from the same album
+        are resolved together from one album tracklist.
+        \n        Args:
+            tracks: Tracks from Spotify to match, e.g. a TrackBatch.
+            on_result: Optional callback invoked on the calling thread as each
+                       result becomes available (in completion order).
+            \n        Returns:
+            List[MatchResult]: Match results in the same order as ``tracks``.
+        """
+        ordered: List[MatchResult | None] = [None] * len(tracks)
+
+        def collect(outcome: MatchResult | List[MatchResult]) -> None:
+            for result in outcome if isinstance(outcome, list) else [outcome]:
+                ordered[result.position] = result
+                if on_result:
+                    on_result(result)
+
+        plan = self._plan(tracks)
+        if self.workers == 1 or len(plan) <= 1:
+            for function, args in plan:
+                collect(function(*args))
+        else:
+            executor = self._pool()
+            futures = [executor.submit(function, *args) for function, args in plan]
+            for future in as_completed(futures):
+                collect(future.result())
+        return ordered  # type: ignore[return-value]
+
+    def match(self, tracks: Sequence[Track]) -> List[str]:
         """Match a list of Spotify tracks to YouTube Music video IDs.
         \n        Searches for each track in YouTube Music and collects the video IDs of
         successfully matched songs. Currently searches by track title only.
@@ -33,11 +306,13 @@ class TrackMatcher:
             \n        Returns:
             List[str]: List of YouTube Music video IDs for matched tracks.
         """
-        video_ids = []
-        for track in tracks:
-            # video_id = self.ytmusic_client.search_song(track.title, track.album)
-            ###  search only with name for now
-            video_id = self.ytmusic_client.search_song(track.title)
-            if video_id:
-                video_ids.append(video_id)
-        return video_ids
+        results = self.match_all(tracks)
+        failures = [result for result in results if result.error]
+        if failures:
+            logger.warning(
+                "%d of %d tracks failed to match: %s",
+                len(failures),
+                len(results),
+                ", ".join(result.track.title for result in failures)
+            )
+        return [result.video_id for result in results if result.matched]
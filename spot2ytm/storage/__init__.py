@@ -0,0 +1,5 @@
+"""Local persistence for Spot2YTM.
+
+This package contains on-disk stores (SQLite under ``settings.DATA_DIR``) used to avoid
+repeating work across runs, such as the Spotify track to YouTube Music match cache.
+"""
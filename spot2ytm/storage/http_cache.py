@@ -0,0 +1,108 @@
+"""Persistent cache of Spotify API responses for conditional requests.
+
+This module stores the body and ETag of Spotify API responses in a SQLite database
+keyed on the request URL, so a later request for the same resource can be sent with
+``If-None-Match`` and a ``304 Not Modified`` answer served from the local copy.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Tuple
+from spot2ytm.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """SQLite-backed cache of URL -> (ETag, response body).
+
+    Bodies are stored zlib-compressed. The total stored size is kept at or below
+    ``max_bytes`` by evicting the least recently used responses. The connection is
+    shared between threads and guarded by a lock, so the cache can be used from
+    parallel page fetches.
+    """
+
+    # Run the size check once every this many writes instead of on each one.
+    EVICTION_INTERVAL = 50
+
+    def __init__(self, path: Path | None = None, max_bytes: int | None = None) -> None:
+        """Open (and create if needed) the HTTP cache database.
+        \n        Args:
+            path: Path of the SQLite file. Defaults to settings.HTTP_CACHE_FILE.
+            max_bytes: Maximum total size of the stored (compressed) bodies.
+                       Defaults to settings.HTTP_CACHE_MAX_MB.
+        """
+        self.path = Path(path or settings.HTTP_CACHE_FILE)
+        self.max_bytes = max_bytes if max_bytes is not None else settings.HTTP_CACHE_MAX_MB * 1024 * 1024
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " url TEXT PRIMARY KEY,"
+                " etag TEXT NOT NULL,"
+                " body BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_used INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used)")
+            self._evict()
+
+    def get(self, url: str) -> Tuple[str, bytes] | None:
+        """Look up a cached response.
+        \n        Args:
+            url: The request URL, query string included.
+            \n        Returns:
+            Tuple[str, bytes] | None: The ETag and the (decompressed) body, or None on a miss.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT etag, body FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE url = ?", (int(time.time()), url))
+        etag, body = row
+        return etag, zlib.decompress(body)
+
+    def put(self, url: str, etag: str, body: bytes) -> None:
+        """Store a response body and its ETag.
+        \n        Args:
+            url: The request URL, query string included.
+            etag: The ETag header the server sent with the body.
+            body: The raw response body.
+        """
+        compressed = zlib.compress(body)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, body, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                (url, etag, compressed, len(compressed), int(time.time()))
+            )
+            self._writes += 1
+            if self._writes % self.EVICTION_INTERVAL == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Trim the stored bodies to ``max_bytes``, dropping the least recently used first.
+        \n        Must be called with the lock held inside a transaction.
+        """
+        cursor = self._conn.execute(
+            "DELETE FROM responses WHERE url IN ("
+            " SELECT url FROM (SELECT url, SUM(size) OVER (ORDER BY last_used DESC, url) AS kept FROM responses)"
+            " WHERE kept > ?)",
+            (self.max_bytes,)
+        )
+        if cursor.rowcount > 0:
+            logger.debug("Evicted %d responses from HTTP cache", cursor.rowcount)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,114 @@
+"""Persistent Spotify track to YouTube Music match cache.
+
+This module stores resolved YouTube Music video IDs in a SQLite database keyed on the
+normalized title/album/artist key of a track, so repeated migrations and overlapping
+playlists do not pay for the same YT Music search twice.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from spot2ytm.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MatchCache:
+    """SQLite-backed cache of track key -> YouTube Music video ID.
+
+    Entries expire after ``ttl_seconds`` and the table is kept at or below
+    ``max_entries`` by evicting the least recently used rows. The connection is
+    shared between threads and guarded by a lock, so the cache can be used from
+    TrackMatcher's concurrent search workers.
+    """
+
+    # Run the size check once every this many writes instead of on each one.
+    EVICTION_INTERVAL = 100
+
+    def __init__(self, path: Path | None = None, ttl_seconds: int | None = None, max_entries: int | None = None) -> None:
+        """Open (and create if needed) the match cache database.
+        \n        Args:
+            path: Path of the SQLite file. Defaults to settings.MATCH_CACHE_FILE.
+            ttl_seconds: Lifetime of an entry. Defaults to settings.MATCH_CACHE_TTL_DAYS.
+            max_entries: Maximum number of rows kept. Defaults to settings.MATCH_CACHE_MAX_ENTRIES.
+        """
+        self.path = Path(path or settings.MATCH_CACHE_FILE)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.MATCH_CACHE_TTL_DAYS * 86400
+        self.max_entries = max_entries if max_entries is not None else settings.MATCH_CACHE_MAX_ENTRIES
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS matches ("
+                " key TEXT PRIMARY KEY,"
+                " video_id TEXT NOT NULL,"
+                " created_at INTEGER NOT NULL,"
+                " last_used INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_matches_last_used ON matches(last_used)")
+            self._evict()
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached video ID.
+        \n        Expired entries are deleted and reported as misses.
+        \n        Args:
+            key: The normalized track key.
+            \n        Returns:
+            str | None: The cached video ID, or None on a miss.
+        """
+        now = int(time.time())
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT video_id, created_at FROM matches WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            video_id, created_at = row
+            if now - created_at >= self.ttl_seconds:
+                self._conn.execute("DELETE FROM matches WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE matches SET last_used = ? WHERE key = ?", (now, key))
+            return video_id
+
+    def put(self, key: str, video_id: str) -> None:
+        """Store a resolved video ID for a track key.
+        \n        Args:
+            key: The normalized track key.
+            video_id: The YouTube Music video ID the track resolved to.
+        """
+        if not video_id:
+            return
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO matches (key, video_id, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, video_id, now, now)
+            )
+            self._writes += 1
+            if self._writes % self.EVICTION_INTERVAL == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired rows and trim the table to ``max_entries`` (LRU).
+        \n        Must be called with the lock held inside a transaction.
+        """
+        cutoff = int(time.time()) - self.ttl_seconds
+        self._conn.execute("DELETE FROM matches WHERE created_at <= ?", (cutoff,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM matches").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM matches WHERE key IN (SELECT key FROM matches ORDER BY last_used ASC LIMIT ?)",
+                (overflow,)
+            )
+            logger.debug("Evicted %d entries from match cache", overflow)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,253 @@
+"""Crash-safe journal for resumable playlist migrations.
+
+This module persists the progress of each migration (fetched tracks, resolved video IDs
+and how far insertion into the YouTube Music playlist has got) in SQLite, so a restarted
+migration of the same Spotify playlist continues from its last committed point instead
+of searching and adding every song again.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Sequence, Set
+from spot2ytm.config.settings import settings
+from spot2ytm.domain.track import Track
+from spot2ytm.domain.track_batch import TrackBatch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MigrationState:
+    """Persisted progress of a single migration.
+
+    Attributes:
+        spotify_playlist_id: The source Spotify playlist ID.
+        yt_playlist_id: The target YouTube Music playlist ID.
+        fetched: Whether the full track list has been journaled.
+        inserted_upto: Insert watermark; tracks at positions below it are in the playlist.
+        completed: Whether the migration finished.
+    """
+
+    spotify_playlist_id: str
+    yt_playlist_id: str
+    fetched: bool
+    inserted_upto: int
+    completed: bool
+
+
+class MigrationJournal:
+    """SQLite-backed journal of migration progress keyed on Spotify playlist ID.
+
+    Every write is committed immediately, so the journal reflects the last finished
+    step even if the process is killed mid-migration.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Open (and create if needed) the journal database.
+        \n        Args:
+            path: Path of the SQLite file. Defaults to settings.MIGRATION_JOURNAL_FILE.
+        """
+        self.path = Path(path or settings.MIGRATION_JOURNAL_FILE)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS migrations ("
+                " spotify_playlist_id TEXT PRIMARY KEY,"
+                " yt_playlist_id TEXT NOT NULL,"
+                " fetched INTEGER NOT NULL DEFAULT 0,"
+                " inserted_upto INTEGER NOT NULL DEFAULT 0,"
+                " completed INTEGER NOT NULL DEFAULT 0,"
+                " updated_at INTEGER NOT NULL)"
+            )
+            # video_id: NULL = not resolved yet, '' = searched but no match.
+            # inserted: 1 = already in the playlist although past the insert watermark.
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS migration_tracks ("
+                " spotify_playlist_id TEXT NOT NULL,"
+                " position INTEGER NOT NULL,"
+                " track TEXT NOT NULL,"
+                " video_id TEXT,"
+                " inserted INTEGER NOT NULL DEFAULT 0,"
+                " PRIMARY KEY (spotify_playlist_id, position))"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(migration_tracks)")}
+            if "inserted" not in columns:
+                self._conn.execute("ALTER TABLE migration_tracks ADD COLUMN inserted INTEGER NOT NULL DEFAULT 0")
+
+    def load(self, spotify_playlist_id: str) -> MigrationState | None:
+        """Load the journaled state of a migration.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            \n        Returns:
+            MigrationState | None: The persisted state, or None if never started.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT yt_playlist_id, fetched, inserted_upto, completed FROM migrations WHERE spotify_playlist_id = ?",
+                (spotify_playlist_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        yt_playlist_id, fetched, inserted_upto, completed = row
+        return MigrationState(spotify_playlist_id, yt_playlist_id, bool(fetched), inserted_upto, bool(completed))
+
+    def start(self, spotify_playlist_id: str, yt_playlist_id: str) -> None:
+        """Begin a fresh journal for a migration, discarding any previous entry.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            yt_playlist_id: The target YouTube Music playlist ID.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM migration_tracks WHERE spotify_playlist_id = ?", (spotify_playlist_id,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO migrations (spotify_playlist_id, yt_playlist_id, updated_at) VALUES (?, ?, ?)",
+                (spotify_playlist_id, yt_playlist_id, int(time.time()))
+            )
+
+    def record_tracks(self, spotify_playlist_id: str, tracks: Sequence[Track], offset: int = 0, fetched: bool = True) -> None:
+        """Journal fetched tracks.
+        \n        Re-recording a position keeps its match if the track is unchanged, and clears
+        it (so the track is matched again) if the playlist changed since.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            tracks: Tracks to store, in playlist order.
+            offset: Playlist position of the first track in ``tracks``.
+            fetched: Whether these tracks complete the playlist fetch.
+        """
+        rows = [
+            (spotify_playlist_id, offset + index, json.dumps(asdict(track)))
+            for index, track in enumerate(tracks)
+        ]
+        with self._lock, self._conn:
+            # Keep the journaled match when a page is recorded again on resume, unless
+            # the playlist changed meanwhile and the position now holds another track.
+            self._conn.executemany(
+                "INSERT INTO migration_tracks (spotify_playlist_id, position, track) VALUES (?, ?, ?)"
+                " ON CONFLICT (spotify_playlist_id, position) DO UPDATE SET"
+                " video_id = CASE WHEN migration_tracks.track = excluded.track THEN migration_tracks.video_id END,"
+                " inserted = CASE WHEN migration_tracks.track = excluded.track THEN migration_tracks.inserted ELSE 0 END,"
+                " track = excluded.track",
+                rows
+            )
+            if fetched:
+                self._touch(spotify_playlist_id, "fetched = 1")
+
+    def tracks(self, spotify_playlist_id: str) -> TrackBatch:
+        """Return the journaled tracks of a migration in playlist order.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            \n        Returns:
+            TrackBatch: The journaled tracks.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT track FROM migration_tracks WHERE spotify_playlist_id = ? ORDER BY position",
+                (spotify_playlist_id,)
+            ).fetchall()
+        return TrackBatch(Track.from_dict(json.loads(track)) for (track,) in rows)
+
+    def record_match(self, spotify_playlist_id: str, position: int, video_id: str) -> None:
+        """Journal the resolved video ID of a track.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            position: Playlist position of the track.
+            video_id: The matched video ID, or empty string if nothing matched.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE migration_tracks SET video_id = ? WHERE spotify_playlist_id = ? AND position = ?",
+                (video_id, spotify_playlist_id, position)
+            )
+
+    def matches(self, spotify_playlist_id: str, start: int = 0, end: int | None = None) -> Dict[int, str]:
+        """Return the resolved video IDs of a migration.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            start: First playlist position to include.
+            end: Playlist position to stop before. None means until the end.
+            \n        Returns:
+            Dict[int, str]: Playlist position -> video ID ('' if no match) for resolved tracks.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT position, video_id FROM migration_tracks"
+                " WHERE spotify_playlist_id = ? AND video_id IS NOT NULL AND position >= ? AND position < ?",
+                (spotify_playlist_id, start, end if end is not None else 2**62)
+            ).fetchall()
+        return dict(rows)
+
+    def mark_inserted(self, spotify_playlist_id: str, positions: Iterable[int]) -> None:
+        """Record tracks that landed in the YT Music playlist past the insert watermark.
+        \n        A batch can partly land before a request error stops it. Its landed tracks
+        past the watermark are marked so a resume does not add them a second time.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            positions: Playlist positions of the landed tracks.
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE migration_tracks SET inserted = 1 WHERE spotify_playlist_id = ? AND position = ?",
+                [(spotify_playlist_id, position) for position in positions]
+            )
+
+    def inserted_positions(self, spotify_playlist_id: str, start: int = 0) -> Set[int]:
+        """Return the positions marked by mark_inserted at or past ``start``.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            start: First playlist position to include, usually the insert watermark.
+            \n        Returns:
+            Set[int]: Playlist positions already in the YT Music playlist.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT position FROM migration_tracks WHERE spotify_playlist_id = ? AND inserted = 1 AND position >= ?",
+                (spotify_playlist_id, start)
+            ).fetchall()
+        return {position for (position,) in rows}
+
+    def advance_watermark(self, spotify_playlist_id: str, inserted_upto: int) -> None:
+        """Record that every track below ``inserted_upto`` is in the YT Music playlist.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            inserted_upto: The new insert watermark (exclusive playlist position).
+        """
+        with self._lock, self._conn:
+            self._touch(spotify_playlist_id, "inserted_upto = ?", inserted_upto)
+
+    def mark_fetched(self, spotify_playlist_id: str) -> None:
+        """Record that every page of the playlist has been journaled.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+        """
+        with self._lock, self._conn:
+            self._touch(spotify_playlist_id, "fetched = 1")
+
+    def complete(self, spotify_playlist_id: str) -> None:
+        """Mark a migration as finished and drop its per-track rows.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM migration_tracks WHERE spotify_playlist_id = ?", (spotify_playlist_id,))
+            self._touch(spotify_playlist_id, "completed = 1")
+
+    def _touch(self, spotify_playlist_id: str, assignment: str, *params) -> None:
+        """Update a migration row and its timestamp. Caller holds the lock and transaction."""
+        self._conn.execute(
+            f"UPDATE migrations SET {assignment}, updated_at = ? WHERE spotify_playlist_id = ?",
+            (*params, int(time.time()), spotify_playlist_id)
+        )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
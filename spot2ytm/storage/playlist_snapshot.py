@@ -0,0 +1,163 @@
+"""Exported Spotify playlist snapshots.
+
+This module writes and reads snapshot files: a gzip-compressed, line-delimited JSON
+copy of one Spotify playlist. The first line is a header with the playlist metadata,
+every following line is one track as a compact JSON array. Snapshots are written and
+read as streams, so exporting or matching a playlist never holds the whole file in
+memory, and a snapshot can be matched (and re-matched) without calling Spotify.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+from spot2ytm.config.settings import settings
+from spot2ytm.domain.track import Track
+from spot2ytm.domain.track_batch import TrackBatch
+
+FORMAT = "spot2ytm-snapshot"
+VERSION = 1
+
+
+@dataclass(frozen=True)
+class SnapshotHeader:
+    """Metadata of an exported playlist.
+
+    Attributes:
+        playlist_id: The Spotify playlist ID.
+        name: The playlist name.
+        description: The playlist description.
+        snapshot_id: The Spotify snapshot ID at export time.
+        exported_at: Export time as a Unix timestamp.
+    """
+
+    playlist_id: str
+    name: str
+    description: str
+    snapshot_id: str = ""
+    exported_at: int = 0
+
+
+class PlaylistSnapshot:
+    """One snapshot file under settings.SNAPSHOT_DIR (or any given path)."""
+
+    # Tracks per batch when reading, like one Spotify playlist page.
+    BATCH_SIZE = 100
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the snapshot.
+        \n        Args:
+            path: Path of the snapshot file.
+        """
+        self.path = Path(path)
+
+    @classmethod
+    def for_playlist(cls, playlist_id: str) -> "PlaylistSnapshot":
+        """The snapshot of a Spotify playlist in settings.SNAPSHOT_DIR.
+        \n        Args:
+            playlist_id: The Spotify playlist ID.
+            \n        Returns:
+            PlaylistSnapshot: The snapshot (the file may not exist yet).
+        """
+        return cls(settings.SNAPSHOT_DIR / f"{playlist_id}.jsonl.gz")
+
+    @classmethod
+    def all(cls) -> Iterator["PlaylistSnapshot"]:
+        """Every snapshot in settings.SNAPSHOT_DIR, sorted by file name."""
+        for path in sorted(settings.SNAPSHOT_DIR.glob("*.jsonl.gz")):
+            yield cls(path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def write(self, header: SnapshotHeader, pages: Iterable[Iterable[Track]]) -> int:
+        """Stream a playlist into the snapshot file, replacing it atomically.
+        \n        The file only appears once every track has been written, so an export that
+        fails midway leaves the previous snapshot (if any) in place.
+        \n        Args:
+            header: The playlist metadata.
+            pages: The tracks, e.g. one TrackBatch per Spotify page.
+            \n        Returns:
+            int: The number of tracks written.
+        """
+        if not header.exported_at:
+            header = SnapshotHeader(**{**asdict(header), "exported_at": int(time.time())})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        count = 0
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding=settings.DEFAULT_ENCODING) as file:
+                file.write(json.dumps({"format": FORMAT, "version": VERSION, **asdict(header)}, ensure_ascii=False) + "\n")
+                for page in pages:
+                    for track in page:
+                        file.write(json.dumps(
+                            [track.title, track.album, track.id, track.isrc, list(track.artists), track.duration_ms],
+                            ensure_ascii=False,
+                            separators=(",", ":"),
+                        ) + "\n")
+                        count += 1
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return count
+
+    def _lines(self) -> Iterator[str]:
+        with gzip.open(self.path, 'rt', encoding=settings.DEFAULT_ENCODING) as file:
+            yield from file
+
+    def header(self) -> SnapshotHeader:
+        """Read the playlist metadata (only the first line of the file is read).
+        \n        Returns:
+            SnapshotHeader: The playlist metadata.
+            \n        Raises:
+            ValueError: If the file is not a snapshot in a supported version.
+        """
+        lines = self._lines()
+        try:
+            return self._parse_header(next(lines, ""))
+        finally:
+            lines.close()
+
+    def _parse_header(self, line: str) -> SnapshotHeader:
+        data = json.loads(line) if line.strip() else {}
+        if data.get("format") != FORMAT or data.get("version") != VERSION:
+            raise ValueError(f"{self.path} is not a {FORMAT} file (version {VERSION})")
+        return SnapshotHeader(**{field: data[field] for field in SnapshotHeader.__dataclass_fields__ if field in data})
+
+    def iter_tracks(self) -> Iterator[Track]:
+        """Yield the tracks in playlist order, reading the file incrementally.
+        \n        Yields:
+            Track: One track of the playlist.
+        """
+        lines = self._lines()
+        try:
+            self._parse_header(next(lines, ""))
+            for line in lines:
+                if not line.strip():
+                    continue
+                title, album, track_id, isrc, artists, duration_ms = json.loads(line)
+                yield Track(title=title, album=album, id=track_id, isrc=isrc, artists=tuple(artists), duration_ms=duration_ms)
+        finally:
+            lines.close()
+
+    def iter_batches(self, size: int | None = None) -> Iterator[TrackBatch]:
+        """Yield the tracks in consecutive batches, reading the file incrementally.
+        \n        Args:
+            size: Tracks per batch. Defaults to BATCH_SIZE.
+            \n        Yields:
+            TrackBatch: Up to ``size`` tracks, in playlist order.
+        """
+        size = size or self.BATCH_SIZE
+        batch = TrackBatch()
+        for track in self.iter_tracks():
+            batch.append(track)
+            if len(batch) >= size:
+                yield batch
+                batch = TrackBatch()
+        if len(batch):
+            yield batch
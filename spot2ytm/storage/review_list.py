@@ -0,0 +1,57 @@
+"""Review list of low-confidence track matches.
+
+This module appends tracks whose best YouTube Music search result scored below the
+confidence threshold to a line-delimited JSON file under ``settings.DATA_DIR``, so they
+can be checked by hand instead of being silently added or searched again.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+from spot2ytm.config.settings import settings
+from spot2ytm.domain.match_result import MatchResult
+
+
+class ReviewList:
+    """Append-only JSON-lines file of matches that need manual review."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the review list.
+        \n        Args:
+            path: Path of the review file. Defaults to settings.REVIEW_FILE.
+        """
+        self.path = Path(path or settings.REVIEW_FILE)
+        self._lock = threading.Lock()
+
+    def add(self, spotify_playlist_id: str | None, results: Iterable[MatchResult]) -> int:
+        """Append the results that need review.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist the tracks came from, if known.
+            results: Match results; only those with needs_review set are written.
+            \n        Returns:
+            int: Number of entries written.
+        """
+        lines = [
+            json.dumps({
+                "spotify_playlist_id": spotify_playlist_id,
+                "title": result.track.title,
+                "album": result.track.album,
+                "artists": list(result.track.artists),
+                "spotify_track_id": result.track.id,
+                "candidate": result.candidate,
+                "confidence": round(result.confidence or 0.0, 3),
+                "logged_at": int(time.time()),
+            }, ensure_ascii=False)
+            for result in results
+            if result.needs_review
+        ]
+        if not lines:
+            return 0
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # One write per batch, so batches appended by concurrent processes do not interleave
+            with open(self.path, 'ab') as file:
+                file.write(("\n".join(lines) + "\n").encode(settings.DEFAULT_ENCODING))
+        return len(lines)
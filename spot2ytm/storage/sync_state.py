@@ -0,0 +1,163 @@
+"""Persistent state for incremental playlist syncs.
+
+This module remembers, per Spotify playlist, the snapshot_id that was last synced, the
+target YouTube Music playlist and which video ID every synced track resolved to. The
+next sync can then skip unchanged playlists entirely and only search and insert the
+tracks that were added since. Tracks that found no match are searched again once their
+entry has expired.
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+from spot2ytm.config.settings import settings
+
+
+@dataclass(frozen=True)
+class SyncState:
+    """Last synced state of a Spotify playlist.
+
+    Attributes:
+        spotify_playlist_id: The source Spotify playlist ID.
+        yt_playlist_id: The target YouTube Music playlist ID.
+        snapshot_id: Spotify snapshot_id of the playlist at the last sync.
+        synced_at: Unix timestamp of the last sync.
+    """
+
+    spotify_playlist_id: str
+    yt_playlist_id: str
+    snapshot_id: str
+    synced_at: int
+
+
+class SyncStateStore:
+    """SQLite-backed store of sync state keyed on Spotify playlist ID."""
+
+    def __init__(self, path: Path | None = None, unmatched_ttl_seconds: int | None = None) -> None:
+        """Open (and create if needed) the sync state database.
+        \n        Args:
+            path: Path of the SQLite file. Defaults to settings.SYNC_STATE_FILE.
+            unmatched_ttl_seconds: How long a track without a match is left alone before
+                                   it is searched again. Defaults to settings.MATCH_CACHE_TTL_DAYS.
+        """
+        self.path = Path(path or settings.SYNC_STATE_FILE)
+        self.unmatched_ttl_seconds = (
+            unmatched_ttl_seconds if unmatched_ttl_seconds is not None else settings.MATCH_CACHE_TTL_DAYS * 86400
+        )
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_playlists ("
+                " spotify_playlist_id TEXT PRIMARY KEY,"
+                " yt_playlist_id TEXT NOT NULL,"
+                " snapshot_id TEXT NOT NULL,"
+                " synced_at INTEGER NOT NULL)"
+            )
+            # checked_at: when video_id was last resolved; unmatched ('') entries expire.
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_tracks ("
+                " spotify_playlist_id TEXT NOT NULL,"
+                " track_key TEXT NOT NULL,"
+                " video_id TEXT NOT NULL,"
+                " checked_at INTEGER NOT NULL DEFAULT 0,"
+                " PRIMARY KEY (spotify_playlist_id, track_key))"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sync_tracks)")}
+            if "checked_at" not in columns:
+                self._conn.execute("ALTER TABLE sync_tracks ADD COLUMN checked_at INTEGER NOT NULL DEFAULT 0")
+
+    def load(self, spotify_playlist_id: str) -> SyncState | None:
+        """Load the last synced state of a playlist.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            \n        Returns:
+            SyncState | None: The stored state, or None if never synced.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT yt_playlist_id, snapshot_id, synced_at FROM sync_playlists WHERE spotify_playlist_id = ?",
+                (spotify_playlist_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return SyncState(spotify_playlist_id, *row)
+
+    def tracks(self, spotify_playlist_id: str) -> Dict[str, str]:
+        """Return the synced tracks of a playlist.
+        \n        Tracks that had no match are left out once their entry is older than
+        ``unmatched_ttl_seconds``, so the next sync searches them again.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            \n        Returns:
+            Dict[str, str]: Track key -> video ID ('' if the track had no match).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT track_key, video_id FROM sync_tracks"
+                " WHERE spotify_playlist_id = ? AND (video_id != '' OR checked_at >= ?)",
+                (spotify_playlist_id, self._expired_before())
+            ).fetchall()
+        return dict(rows)
+
+    def expired_unmatched(self, spotify_playlist_id: str) -> int:
+        """Count the tracks of a playlist whose "no match" entry has expired.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            \n        Returns:
+            int: Number of unmatched tracks due for another search.
+        """
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM sync_tracks WHERE spotify_playlist_id = ? AND video_id = '' AND checked_at < ?",
+                (spotify_playlist_id, self._expired_before())
+            ).fetchone()
+        return count
+
+    def _expired_before(self) -> int:
+        """Timestamp before which unmatched entries are expired."""
+        return int(time.time()) - self.unmatched_ttl_seconds
+
+    def save(self, spotify_playlist_id: str, yt_playlist_id: str, snapshot_id: str, tracks: Dict[str, str]) -> None:
+        """Replace the stored state of a playlist after a successful sync.
+        \n        Args:
+            spotify_playlist_id: The Spotify playlist ID.
+            yt_playlist_id: The target YouTube Music playlist ID.
+            snapshot_id: The Spotify snapshot_id that was synced.
+            tracks: Track key -> video ID for every track now in the playlist.
+        """
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_playlists (spotify_playlist_id, yt_playlist_id, snapshot_id, synced_at)"
+                " VALUES (?, ?, ?, ?)",
+                (spotify_playlist_id, yt_playlist_id, snapshot_id, now)
+            )
+            stored = self._conn.execute(
+                "SELECT track_key FROM sync_tracks WHERE spotify_playlist_id = ?", (spotify_playlist_id,)
+            ).fetchall()
+            self._conn.executemany(
+                "DELETE FROM sync_tracks WHERE spotify_playlist_id = ? AND track_key = ?",
+                [(spotify_playlist_id, key) for (key,) in stored if key not in tracks]
+            )
+            # An unchanged, unexpired entry keeps its checked_at; anything else was just
+            # resolved (expired entries were not returned by tracks() and searched again).
+            self._conn.executemany(
+                "INSERT INTO sync_tracks (spotify_playlist_id, track_key, video_id, checked_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (spotify_playlist_id, track_key) DO UPDATE SET"
+                " checked_at = CASE WHEN sync_tracks.video_id = excluded.video_id AND sync_tracks.checked_at >= ?"
+                " THEN sync_tracks.checked_at ELSE excluded.checked_at END,"
+                " video_id = excluded.video_id",
+                [(spotify_playlist_id, key, video_id, now, self._expired_before()) for key, video_id in tracks.items()]
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,5 @@
+"""Runtime telemetry for Spot2YTM.
+
+This package contains the process-wide metrics registry (counters and latency
+histograms) that clients and services update, and its JSON/Prometheus exporters.
+"""
@@ -0,0 +1,282 @@
+"""In-process metrics: counters and latency histograms.
+
+This module provides a thread-safe registry of counters and fixed-bucket histograms
+that the clients, services and migrator update as they work. The registry can be
+exported as JSON or in the Prometheus text exposition format, at the end of a run or
+periodically from a background reporter thread.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+from spot2ytm.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds, from a cache lookup to a slow, retried network call.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    def __init__(self, name: str, description: str = "") -> None:
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """Increase the counter.
+        \n        Args:
+            amount: How much to add (must not be negative).
+        """
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0
+
+
+class Histogram:
+    """Distribution of observed values (latencies in seconds) over fixed buckets."""
+
+    def __init__(self, name: str, description: str = "", buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation.
+        \n        Args:
+            value: The observed value, e.g. a duration in seconds.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def quantile(self, fraction: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket it falls in.
+        \n        Args:
+            fraction: The quantile, e.g. 0.99.
+            \n        Returns:
+            float: The bucket upper bound (inf beyond the last bucket, 0 with no data).
+        """
+        with self._lock:
+            counts, total = list(self._counts), self._count
+        if not total:
+            return 0.0
+        rank = fraction * total
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        """Count, sum, estimated p50/p99 and cumulative bucket counts."""
+        with self._lock:
+            counts, total, value_sum = list(self._counts), self._count, self._sum
+        cumulative: Dict[str, int] = {}
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            seen += count
+            cumulative[_format_bound(bound)] = seen
+        return {
+            "count": total,
+            "sum": value_sum,
+            "mean": value_sum / total if total else 0.0,
+            # None when the quantile lies beyond the last bucket
+            "p50": _finite(self.quantile(0.5)),
+            "p99": _finite(self.quantile(0.99)),
+            "buckets": cumulative,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
+
+
+def _finite(value: float) -> float | None:
+    return None if value == float("inf") else value
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+class MetricsRegistry:
+    """Named collection of counters and histograms.
+
+    ``counter`` and ``histogram`` return the existing metric when the name is already
+    registered, so modules can declare the metrics they update at import time.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """Get or create a counter.
+        \n        Args:
+            name: Metric name, e.g. 'ytmusic_searches_total'.
+            description: Help text used in the Prometheus export.
+            \n        Returns:
+            Counter: The registered counter.
+        """
+        with self._lock:
+            if name not in self._counters:
+                self._counters[name] = Counter(name, description)
+            return self._counters[name]
+
+    def histogram(self, name: str, description: str = "", buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram.
+        \n        Args:
+            name: Metric name, e.g. 'ytmusic_search_seconds'.
+            description: Help text used in the Prometheus export.
+            buckets: Bucket upper bounds, used only when the histogram is created.
+            \n        Returns:
+            Histogram: The registered histogram.
+        """
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, description, buckets)
+            return self._histograms[name]
+
+    def snapshot(self) -> dict:
+        """Current values of every metric.
+        \n        Returns:
+            dict: {'counters': {name: value}, 'histograms': {name: histogram snapshot}}.
+        """
+        with self._lock:
+            counters, histograms = list(self._counters.values()), list(self._histograms.values())
+        return {
+            "timestamp": time.time(),
+            "counters": {counter.name: counter.value for counter in sorted(counters, key=lambda c: c.name)},
+            "histograms": {histogram.name: histogram.snapshot() for histogram in sorted(histograms, key=lambda h: h.name)},
+        }
+
+    def to_json(self) -> str:
+        """Export every metric as a JSON document."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Export every metric in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, value in snapshot["counters"].items():
+            lines.append(f"# HELP {name} {self._counters[name].description}")
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value}")
+        for name, histogram in snapshot["histograms"].items():
+            lines.append(f"# HELP {name} {self._histograms[name].description}")
+            lines.append(f"# TYPE {name} histogram")
+            for bound, count in histogram["buckets"].items():
+                lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+            lines.append(f"{name}_sum {histogram['sum']}")
+            lines.append(f"{name}_count {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Path | None = None, fmt: str | None = None) -> Path:
+        """Write every metric to a file, replacing it atomically.
+        \n        Args:
+            path: Target file. Defaults to settings.METRICS_FILE.
+            fmt: 'json' or 'prometheus'. Defaults to settings.METRICS_FORMAT.
+            \n        Returns:
+            Path: The written file.
+        """
+        path = Path(path or settings.METRICS_FILE)
+        fmt = fmt or settings.METRICS_FORMAT
+        content = self.to_prometheus() if fmt == "prometheus" else self.to_json()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return path
+
+    def reset(self) -> None:
+        """Zero every metric (the metrics stay registered)."""
+        with self._lock:
+            metrics_list = list(self._counters.values()) + list(self._histograms.values())
+        for metric in metrics_list:
+            metric.reset()
+
+
+class MetricsReporter:
+    """Background thread dumping the registry every ``interval`` seconds.
+
+    Used as a context manager; a final dump is written on exit.
+    """
+
+    def __init__(self, registry: "MetricsRegistry", interval: float, path: Path | None = None, fmt: str | None = None) -> None:
+        self.registry = registry
+        self.interval = interval
+        self.path = path
+        self.fmt = fmt
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-reporter", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._dump()
+
+    def _dump(self) -> Path | None:
+        try:
+            return self.registry.dump(self.path, self.fmt)
+        except OSError as e:
+            logger.warning("Writing metrics failed: %s", e)
+            return None
+
+    def __enter__(self) -> "MetricsReporter":
+        if self.interval > 0:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        path = self._dump()
+        if path:
+            logger.info("Metrics written to %s", path)
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
@@ -0,0 +1,166 @@
+"""Opt-in per-stage profiling.
+
+This module profiles named stages of a run (app start-up, and the fetch, match and
+insert stages of every migration) with cProfile and tracemalloc when
+settings.PROFILING is on. Each stage writes a ``.prof`` file (loadable with pstats
+or snakeviz) and a text report of its hottest functions and top allocators under
+settings.PROFILING_DIR. When profiling is off, stages cost a no-op context manager.
+"""
+
+import cProfile
+import io
+import itertools
+import logging
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+from spot2ytm.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+class StageProfiler:
+    """Profiles named stages with cProfile and tracemalloc.
+
+    Stages may nest: the outer stage's cProfile is paused while an inner stage
+    runs, so each profile covers only its own stage. cProfile sees the thread that
+    entered the stage; work handed to worker threads (e.g. concurrent searches)
+    shows up as waiting time, so profile with one worker for a full picture.
+
+    tracemalloc has a single process-wide peak. Each stage resets it on entry, after
+    folding it into the running peaks of the stages already open, so every stage
+    reports the peak reached while it ran, nested or not.
+    """
+
+    def __init__(self, enabled: bool | None = None, out_dir: Path | None = None, top: int | None = None) -> None:
+        """Initialize the profiler.
+        \n        Args:
+            enabled: Whether stages are profiled. Defaults to settings.PROFILING.
+            out_dir: Directory for profiles; each run gets a timestamped subdirectory.
+                     Defaults to settings.PROFILING_DIR.
+            top: Functions and allocation sites listed per report. Defaults to settings.PROFILING_TOP.
+        """
+        self._enabled = enabled
+        self._out_dir = out_dir
+        self._top = top
+        self._run_dir: Path | None = None
+        self._sequence = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Running traced-memory peak of each open stage, by stage number
+        self._peaks: Dict[int, int] = {}
+        self._stage_numbers = itertools.count()
+
+    # Resolved from settings on use, so importing this module does not load settings.
+
+    @property
+    def enabled(self) -> bool:
+        return settings.PROFILING if self._enabled is None else self._enabled
+
+    @property
+    def out_dir(self) -> Path:
+        return Path(self._out_dir or settings.PROFILING_DIR)
+
+    @property
+    def top(self) -> int:
+        return self._top or settings.PROFILING_TOP
+
+    def _next_path(self, name: str) -> Path:
+        """Return the path prefix of the next stage's reports."""
+        with self._lock:
+            if self._run_dir is None:
+                self._run_dir = self.out_dir / time.strftime("%Y%m%d-%H%M%S")
+                self._run_dir.mkdir(parents=True, exist_ok=True)
+            self._sequence += 1
+            return self._run_dir / f"{self._sequence:03d}-{_UNSAFE.sub('_', name)}"
+
+    def _fold_peak(self) -> None:
+        """Fold the current tracemalloc peak into every open stage. Caller holds the lock."""
+        _, peak = tracemalloc.get_traced_memory()
+        for token, stage_peak in self._peaks.items():
+            self._peaks[token] = max(stage_peak, peak)
+
+    @contextmanager
+    def stage(self, name: str, label: str = "") -> Iterator[None]:
+        """Profile the ``with`` block as one stage.
+        \n        Args:
+            name: Stage name, e.g. 'fetch'.
+            label: Optional qualifier added to the report name, e.g. a playlist ID.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        stage_name = f"{name}-{label}" if label else name
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        with self._lock:
+            self._fold_peak()
+            tracemalloc.reset_peak()
+            token = next(self._stage_numbers)
+            self._peaks[token] = 0
+        before = tracemalloc.take_snapshot()
+
+        active: List[cProfile.Profile] = self._local.__dict__.setdefault("active", [])
+        outer = active[-1] if active else None
+        if outer:
+            outer.disable()
+        profile = cProfile.Profile()
+        active.append(profile)
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - start
+            active.pop()
+            if outer:
+                outer.enable()
+
+            after = tracemalloc.take_snapshot()
+            with self._lock:
+                self._fold_peak()
+                peak = self._peaks.pop(token)
+            if started_tracing:
+                tracemalloc.stop()
+            try:
+                self._write(stage_name, profile, before, after, elapsed, peak)
+            except OSError as e:
+                logger.warning("Writing profile of stage %s failed: %s", stage_name, e)
+
+    def _write(
+        self,
+        stage_name: str,
+        profile: cProfile.Profile,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+        elapsed: float,
+        peak: int,
+    ) -> None:
+        """Write the .prof file and the text report of one stage."""
+        path = self._next_path(stage_name)
+        profile.dump_stats(str(path.with_suffix(".prof")))
+
+        report = io.StringIO()
+        report.write(f"Stage {stage_name}: {elapsed:.3f} s wall, peak traced memory {peak / 1024 / 1024:.1f} MiB\n\n")
+        report.write(f"Top {self.top} functions by cumulative time:\n")
+        pstats.Stats(profile, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        report.write(f"\nTop {self.top} allocation sites (growth during the stage):\n")
+        for stat in after.compare_to(before, "lineno")[:self.top]:
+            report.write(f"{stat}\n")
+        path.with_suffix(".txt").write_text(report.getvalue(), encoding=settings.DEFAULT_ENCODING)
+
+        logger.info("Profiled stage %s in %.3f s (peak %.1f MiB): %s", stage_name, elapsed, peak / 1024 / 1024, path)
+
+
+# Process-wide profiler, enabled by settings.PROFILING
+profiler = StageProfiler()
@@ -0,0 +1,108 @@
+"""Resuming a migration whose insert stopped partway through a batch.
+
+A fake YTMusic fails the request that carries one chosen video ID. The songs that
+landed before (or, with several chunks in flight, beside) the failing chunk must
+not be added again when the migration is resumed.
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, List
+
+import pytest
+from ytmusicapi.exceptions import YTMusicError
+
+from spot2ytm.clients.ytmusic_client import YTMusicClient
+from spot2ytm.config.settings import settings
+from spot2ytm.domain.track import Track
+from spot2ytm.domain.track_batch import TrackBatch
+from spot2ytm.services.playlist_migrator import PlaylistMigrator
+from spot2ytm.services.track_matcher import TrackMatcher
+from spot2ytm.storage.migration_journal import MigrationJournal
+
+PLAYLIST = "spotify-playlist"
+TRACKS = TrackBatch(Track(title=f"t{index}", album="") for index in range(6))
+EXPECTED = [f"v_t{index}" for index in range(6)]
+
+
+class FakeYTMusic:
+    """Just enough of ytmusicapi.YTMusic for a migration, with a switchable failure."""
+
+    def __init__(self) -> None:
+        self.playlists: Dict[str, List[str]] = {}
+        self.fail_on: str | None = None
+        self.failures_left = 0
+        self._lock = threading.Lock()
+
+    def search(self, query: str, filter: str | None = None, limit: int = 20, **kwargs) -> List[dict]:
+        return [{"videoId": f"v_{query}", "title": query}]
+
+    def get_library_playlists(self, limit: int | None = 25) -> List[dict]:
+        return [{"title": playlist_id, "playlistId": playlist_id} for playlist_id in self.playlists]
+
+    def create_playlist(self, title: str, description: str, video_ids: List[str] | None = None) -> str:
+        self.playlists[title] = list(video_ids or [])
+        return title
+
+    def add_playlist_items(self, playlistId: str, videoIds: List[str], duplicates: bool = False) -> dict:
+        with self._lock:
+            if self.fail_on in videoIds and self.failures_left:
+                self.failures_left -= 1
+                raise YTMusicError("connection reset")
+            self.playlists[playlistId].extend(videoIds)
+        return {"status": "STATUS_SUCCEEDED"}
+
+
+class FakeFetcher:
+    def fetch(self, playlist_id: str, workers: int | None = None) -> TrackBatch:
+        return TrackBatch(TRACKS)
+
+    def iter_pages(self, playlist_id: str, workers: int | None = None):
+        yield TrackBatch(TRACKS[:3])
+        yield TrackBatch(TRACKS[3:])
+
+
+class FakeSpotify:
+    def get_playlist_name_desc(self, playlist_id: str):
+        return "Migrated", ""
+
+
+@pytest.fixture
+def fake(monkeypatch) -> FakeYTMusic:
+    monkeypatch.setattr(settings, "MIGRATION_INSERT_BATCH_SIZE", 6)
+    monkeypatch.setattr(settings, "YTM_INSERT_CHUNK_SIZE", 2)
+    return FakeYTMusic()
+
+
+def build_migrator(fake: FakeYTMusic, journal: MigrationJournal) -> PlaylistMigrator:
+    client = YTMusicClient(fake, limiters={})
+    return PlaylistMigrator(FakeFetcher(), TrackMatcher(client), client, FakeSpotify(), journal=journal)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("in_flight", [1, 3])
+def test_resume_after_mid_batch_error_adds_each_song_once(fake, monkeypatch, tmp_path, streaming, in_flight):
+    monkeypatch.setattr(settings, "YTM_INSERT_IN_FLIGHT", in_flight)
+    monkeypatch.setattr(settings, "YTM_INSERT_RETRIES", 0)
+    journal = MigrationJournal(tmp_path / "journal.db")
+    migrator = build_migrator(fake, journal)
+
+    # The second chunk (v_t2, v_t3) fails; the first one has already landed
+    fake.fail_on, fake.failures_left = "v_t2", 1
+    assert migrator.migrate(PLAYLIST, streaming=streaming) is None
+    assert journal.load(PLAYLIST).inserted_upto == 2
+
+    assert migrator.migrate(PLAYLIST, streaming=streaming) == "Migrated"
+    songs = fake.playlists["Migrated"]
+    assert Counter(songs) == Counter(EXPECTED)
+    if in_flight == 1:
+        assert songs == EXPECTED
+
+
+def test_errored_songs_are_resent_without_the_landed_ones(fake, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "YTM_INSERT_RETRIES", 1)
+    migrator = build_migrator(fake, MigrationJournal(tmp_path / "journal.db"))
+
+    fake.fail_on, fake.failures_left = "v_t2", 1
+    assert migrator.migrate(PLAYLIST, streaming=False) == "Migrated"
+    assert fake.playlists["Migrated"] == EXPECTED